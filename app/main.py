@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 
 from app.routers.ir import router as ir_router
 from app.routers.notice import router as notice_router
+from src.infrastructure.document_ai.service import warm_ocr_service
 
 app = FastAPI(title="POKI-AI Service", version="0.1.0")
 
@@ -17,6 +18,12 @@ except Exception:  # pragma: no cover
     pass
 
 
+@app.on_event("startup")
+def warm_ocr_clients() -> None:
+    # Credential discovery + gRPC channel setup once per process, off the request path.
+    warm_ocr_service()
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(_: Request, exc: HTTPException):
     # API contract: {"error":"...", "message":"..."} flat payload (not {"detail": {...}})
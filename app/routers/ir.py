@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-import json
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Path as FPath, UploadFile
+from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Path as FPath, Query, UploadFile
 
 from app.schemas.ir_schema import (
     AnalysisStatus,
     CriteriaScoreResponse,
     DeckScoreResponse,
     ErrorResponse,
+    IRDeckSimilarResponse,
     IRDeckSlideItemResponse,
     IRDeckSlidesCompletedResponse,
     IRDeckSlidesInProgressResponse,
@@ -22,8 +22,12 @@ from app.schemas.ir_schema import (
     IRDeckSummaryInProgressResponse,
     IRUploadResponse,
     PresentationGuideResponse,
+    SimilarDeckItemResponse,
+    SimilarSlideItemResponse,
 )
+from src.domain.ir.deck_index import deck_index_from_env
 from src.domain.ir.pipeline import run_ir_analysis
+from src.utils.artifact_codec import read_artifact
 
 try:
     from app.routers import notice as notice_router_module
@@ -87,6 +91,26 @@ def _next_ir_version(pitch_id: str) -> int:
     return max((_IR_BY_ID[i].version for i in ids if i in _IR_BY_ID), default=0) + 1
 
 
+def _previous_slide_state(pitch_id: str, ir_deck_id: str) -> Path | None:
+    """Slide state of the newest completed earlier version of the same pitch."""
+    current = _IR_BY_ID.get(ir_deck_id)
+    if current is None:
+        return None
+    candidates = [
+        _IR_BY_ID[i]
+        for i in _IR_IDS_BY_PITCH.get(pitch_id, [])
+        if i in _IR_BY_ID
+        and i != ir_deck_id
+        and _IR_BY_ID[i].version < current.version
+        and _IR_BY_ID[i].analysis_status == AnalysisStatus.COMPLETED
+    ]
+    for prev in sorted(candidates, key=lambda r: r.version, reverse=True):
+        state_path = IR_ANALYSIS_DIR / prev.id / f"{prev.id}_slide_state.json"
+        if state_path.exists():
+            return state_path
+    return None
+
+
 def _latest_notice_id_for_pitch(pitch_id: str) -> str | None:
     if notice_router_module is None:
         return None
@@ -289,6 +313,7 @@ def _run_ir_analysis_background(ir_deck_id: str, pdf_path: Path) -> None:
         if row is None:
             return
         pitch_id = row.pitch_id
+        previous_slide_state = _previous_slide_state(pitch_id, ir_deck_id)
 
     try:
         out_dir = IR_ANALYSIS_DIR / ir_deck_id
@@ -299,11 +324,13 @@ def _run_ir_analysis_background(ir_deck_id: str, pdf_path: Path) -> None:
             strategy=None,
             use_chunking=True,
             pitch_type=None,
+            previous_slide_state=previous_slide_state,
+            index_deck=True,
         )
         final_path = Path(str(result.get("final_path", "")))
         if not final_path.exists():
             raise RuntimeError("최종 분석 JSON이 생성되지 않았습니다.")
-        payload = json.loads(final_path.read_text(encoding="utf-8"))
+        payload = read_artifact(final_path)
         mapped = _map_ir_payload_to_result(payload, pitch_id=pitch_id)
 
         with _LOCK:
@@ -461,3 +488,34 @@ def get_ir_slides(deck_id: str = FPath(..., description="IR Deck ID")):
         total_slides=len(slides),
         slides=slides,
     )
+
+
+@router.get(
+    "/ir-decks/{deck_id}/similar",
+    response_model=IRDeckSimilarResponse,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_similar_ir_decks(
+    deck_id: str = FPath(..., description="IR Deck ID"),
+    k: int = Query(5, ge=1, le=50, description="반환할 최대 개수"),
+    slide_number: int | None = Query(None, ge=1, description="지정 시 해당 슬라이드와 유사한 다른 덱의 슬라이드"),
+):
+    index = deck_index_from_env()
+    if index is None:
+        _raise_error(404, "IR_DECK_NOT_INDEXED", "유사 덱 인덱스가 비활성화되어 있습니다")
+
+    if slide_number is None:
+        hits = index.similar_decks(deck_id, k=k)
+    else:
+        hits = index.similar_slides(deck_id, slide_number, k=k)
+    if hits is None:
+        _raise_error(404, "IR_DECK_NOT_INDEXED", "유사 덱 인덱스에 없는 IR Deck입니다")
+
+    items = [{**{key: v for key, v in h.items() if key != "deck_id"}, "ir_deck_id": h["deck_id"]} for h in hits]
+    if slide_number is None:
+        return IRDeckSimilarResponse(ir_deck_id=deck_id, similar_decks=[SimilarDeckItemResponse(**x) for x in items])
+    return IRDeckSimilarResponse(
+        ir_deck_id=deck_id,
+        slide_number=slide_number,
+        similar_slides=[SimilarSlideItemResponse(**x) for x in items],
+    )
@@ -98,3 +98,26 @@ class IRDeckSlidesCompletedResponse(BaseModel):
     analysis_status: AnalysisStatus = AnalysisStatus.COMPLETED
     total_slides: int = Field(ge=0)
     slides: list[IRDeckSlideItemResponse] = Field(default_factory=list)
+
+
+class SimilarDeckItemResponse(BaseModel):
+    ir_deck_id: str
+    similarity: float
+    filename: str | None = None
+    pitch_type: str | None = None
+    total_score: int | None = None
+
+
+class SimilarSlideItemResponse(BaseModel):
+    ir_deck_id: str
+    slide_number: int = Field(ge=1)
+    similarity: float
+    category: str | None = None
+    summary: str = ""
+
+
+class IRDeckSimilarResponse(BaseModel):
+    ir_deck_id: str
+    slide_number: int | None = None
+    similar_decks: list[SimilarDeckItemResponse] = Field(default_factory=list)
+    similar_slides: list[SimilarSlideItemResponse] = Field(default_factory=list)
@@ -0,0 +1,337 @@
+"""SQLite catalog of pipeline artifacts (`*_docai.json`, `*_final.json`, `*_strategy.json`).
+
+Label lookups used to walk `data/output` with recursive globs on every call.
+Writers now `register_artifact` each file they produce (stem, kind, directory,
+size and mtime), so lookups are a single indexed query. Rows whose file
+disappeared are dropped and rows whose file was rewritten are refreshed when a
+lookup meets them; `tools/build_artifact_catalog.py` rebuilds the catalog from
+disk. "Latest strategy" answers from the catalog too, unless the directory
+changed after its newest row was indexed (a strategy copied in without going
+through a writer); callers then rescan that one directory.
+
+Registration stays cheap on the write path: the content hash is only
+computed with `ARTIFACT_CATALOG_HASH=1` (or `--hash` on the rebuild tool),
+and outputs under the system temp directory (tuning trials, eval runs) are
+not catalogued unless the catalog itself lives there. Label lookups that
+found nothing are remembered for `ARTIFACT_CATALOG_MISS_TTL` seconds
+(default 300), so a label without artifacts is not re-globbed on every call;
+registering that stem/kind clears the miss.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_CATALOG_PATH = Path("data/output/artifact_catalog.sqlite3")
+DEFAULT_MISS_TTL_SEC = 300.0
+KIND_SUFFIXES = {
+    "docai": "_docai.json",
+    "final": "_final.json",
+    "strategy": "_strategy.json",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    stem TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_stem_kind ON artifacts (stem, kind);
+CREATE INDEX IF NOT EXISTS artifacts_parent_kind ON artifacts (parent, kind, mtime);
+CREATE TABLE IF NOT EXISTS misses (
+    stem TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    root TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (stem, kind, root)
+);
+"""
+_UPSERT = "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def classify_artifact(path: Path) -> Optional[Tuple[str, str]]:
+    """(stem, kind) for catalogued artifact names, else None."""
+    name = Path(path).name
+    for kind, suffix in KIND_SUFFIXES.items():
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return name[: -len(suffix)], kind
+    return None
+
+
+def _artifact_row(path: Path, hash_files: bool = False) -> Optional[Tuple]:
+    path = path.resolve()
+    classified = classify_artifact(path)
+    if classified is None or not path.is_file():
+        return None
+    stem, kind = classified
+    stat = path.stat()
+    # sha256 is "" unless hashing is enabled; size + mtime already detect rewrites.
+    digest = _file_sha256(path) if hash_files else ""
+    return (str(path), stem, kind, str(path.parent), stat.st_size, stat.st_mtime, digest, time.time())
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_under(path: str, root: Path) -> bool:
+    root_s = str(root)
+    return path == root_s or path.startswith(root_s.rstrip(os.sep) + os.sep)
+
+
+class ArtifactCatalog:
+    def __init__(self, db_path: Path, hash_files: bool = False):
+        self.db_path = Path(db_path)
+        self.hash_files = hash_files
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the catalog safe to share
+        # between threads and batch worker processes.
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def register(self, path: Path) -> bool:
+        """Insert or refresh one artifact; returns False for non-artifact names or missing files."""
+        row = _artifact_row(Path(path), self.hash_files)
+        if row is None:
+            return False
+        with closing(self._connect()) as conn, conn:
+            conn.execute(_UPSERT, row)
+            conn.execute("DELETE FROM misses WHERE stem = ? AND kind = ?", (row[1], row[2]))
+        return True
+
+    def lookup(self, stem: str, kind: str, roots: Iterable[Path] = ()) -> Optional[Path]:
+        """Newest existing artifact with this stem/kind, restricted to `roots` when given.
+
+        Candidate rows are re-stat'ed, so a copy rewritten in place without
+        `register` is ranked by its current mtime and its row is refreshed.
+        """
+        resolved = [Path(r).resolve() for r in roots]
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT path, size, mtime FROM artifacts WHERE stem = ? AND kind = ?",
+                (stem, kind),
+            ).fetchall()
+        best: Optional[Tuple[float, str]] = None
+        vanished, changed = [], []
+        for path, size, mtime in rows:
+            if resolved and not any(_is_under(path, root) for root in resolved):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                vanished.append(path)
+                continue
+            if stat.st_size != size or stat.st_mtime != mtime:
+                changed.append(path)
+            if best is None or stat.st_mtime > best[0]:
+                best = (stat.st_mtime, path)
+        self._forget(vanished)
+        for path in changed:
+            self.register(Path(path))
+        return Path(best[1]) if best else None
+
+    def latest(self, kind: str, directory: Path) -> Optional[Path]:
+        """Most recently written artifact of `kind` directly inside `directory`.
+
+        Returns None when the answer may be stale: the directory gained or lost
+        entries after its newest row was indexed, or the newest file was rewritten
+        since. Callers rescan the directory in that case.
+        """
+        directory = Path(directory).resolve()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT path, size, mtime, indexed_at FROM artifacts WHERE parent = ? AND kind = ? ORDER BY mtime DESC",
+                (str(directory), kind),
+            ).fetchall()
+        if not rows:
+            return None
+        try:
+            if directory.stat().st_mtime > max(row[3] for row in rows):
+                return None
+        except OSError:
+            return None
+        for path, size, mtime, _ in rows:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self._forget([path])
+                continue
+            if stat.st_size != size or stat.st_mtime != mtime:
+                return None
+            return Path(path)
+        return None
+
+    def rebuild(self, roots: Iterable[Path]) -> Dict[str, int]:
+        """Re-scan `roots`: register every artifact found and drop rows of vanished files under them."""
+        counts = {kind: 0 for kind in KIND_SUFFIXES}
+        resolved = [Path(r).resolve() for r in roots if Path(r).exists()]
+        rows = {}
+        for root in resolved:
+            for kind, suffix in KIND_SUFFIXES.items():
+                for path in root.glob(f"**/*{suffix}"):
+                    row = _artifact_row(path, self.hash_files)
+                    if row is not None and row[0] not in rows:
+                        rows[row[0]] = row
+                        counts[kind] += 1
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(_UPSERT, list(rows.values()))
+            known = [p for (p,) in conn.execute("SELECT path FROM artifacts").fetchall()]
+            stale = [p for p in known if p not in rows and any(_is_under(p, r) for r in resolved)]
+            conn.executemany("DELETE FROM artifacts WHERE path = ?", [(p,) for p in stale])
+            conn.execute("DELETE FROM misses")
+        return counts
+
+    def record_miss(self, stem: str, kind: str, roots: Iterable[Path]) -> None:
+        """Remember that no `stem`/`kind` artifact exists under `roots`."""
+        now = time.time()
+        rows = [(stem, kind, str(Path(r).resolve()), now) for r in roots]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO misses VALUES (?, ?, ?, ?)", rows)
+
+    def missed_recently(self, stem: str, kind: str, roots: Iterable[Path], ttl_sec: float) -> bool:
+        """True when every root recorded a miss for `stem`/`kind` within `ttl_sec`."""
+        resolved = {str(Path(r).resolve()) for r in roots}
+        if not resolved:
+            return False
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT root FROM misses WHERE stem = ? AND kind = ? AND checked_at >= ?",
+                (stem, kind, time.time() - ttl_sec),
+            ).fetchall()
+        return resolved <= {root for (root,) in rows}
+
+    def stats(self) -> Dict[str, int]:
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT kind, COUNT(*) FROM artifacts GROUP BY kind").fetchall())
+
+    def _forget(self, paths: List[str]) -> None:
+        if not paths:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM artifacts WHERE path = ?", [(p,) for p in paths])
+
+
+_SHARED_CATALOGS: Dict[str, ArtifactCatalog] = {}
+_SHARED_CATALOGS_LOCK = threading.Lock()
+
+
+def _catalog_path_from_env() -> Optional[Path]:
+    if os.getenv("ARTIFACT_CATALOG", "1") == "0":
+        return None
+    return Path(os.getenv("ARTIFACT_CATALOG_PATH", str(DEFAULT_CATALOG_PATH))).resolve()
+
+
+def artifact_catalog_from_env() -> Optional[ArtifactCatalog]:
+    """Process-wide catalog at `ARTIFACT_CATALOG_PATH`; `ARTIFACT_CATALOG=0` disables it."""
+    path = _catalog_path_from_env()
+    if path is None:
+        return None
+    with _SHARED_CATALOGS_LOCK:
+        if str(path) not in _SHARED_CATALOGS:
+            try:
+                hash_files = os.getenv("ARTIFACT_CATALOG_HASH", "0") == "1"
+                _SHARED_CATALOGS[str(path)] = ArtifactCatalog(path, hash_files=hash_files)
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️ 아티팩트 카탈로그를 열 수 없습니다: {e}")
+                return None
+        return _SHARED_CATALOGS[str(path)]
+
+
+def _miss_ttl_sec() -> float:
+    try:
+        return max(0.0, float(os.getenv("ARTIFACT_CATALOG_MISS_TTL", str(DEFAULT_MISS_TTL_SEC))))
+    except ValueError:
+        return DEFAULT_MISS_TTL_SEC
+
+
+def _is_ephemeral(path: Path, catalog_path: Path) -> bool:
+    # Temp-dir outputs vanish with their TemporaryDirectory; catalogue them only
+    # when the catalog is itself temporary (tests). Checked against the configured
+    # path, before the catalog is opened, so temp writes never create it.
+    temp_root = Path(tempfile.gettempdir()).resolve()
+    return _is_under(str(Path(path).resolve()), temp_root) and not _is_under(str(catalog_path), temp_root)
+
+
+def _catalog_for(paths: Iterable[Path]) -> Optional[ArtifactCatalog]:
+    """Shared catalog, or None when it is disabled or any of `paths` is ephemeral."""
+    catalog_path = _catalog_path_from_env()
+    if catalog_path is None or any(_is_ephemeral(Path(p), catalog_path) for p in paths):
+        return None
+    return artifact_catalog_from_env()
+
+
+def register_artifact(path: Path) -> None:
+    """Best-effort registration hook for writers; never fails the caller."""
+    if classify_artifact(Path(path)) is None:
+        return
+    catalog = _catalog_for([path])
+    if catalog is None:
+        return
+    try:
+        catalog.register(Path(path))
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️ 아티팩트 카탈로그 갱신 실패: {e}")
+
+
+def lookup_artifact(stem: str, kind: str, roots: Iterable[Path] = ()) -> Optional[Path]:
+    roots = list(roots)
+    catalog = _catalog_for(roots)
+    if catalog is None:
+        return None
+    try:
+        return catalog.lookup(stem, kind, roots)
+    except sqlite3.Error:
+        return None
+
+
+def latest_artifact(kind: str, directory: Path) -> Optional[Path]:
+    catalog = _catalog_for([directory])
+    if catalog is None:
+        return None
+    try:
+        return catalog.latest(kind, directory)
+    except sqlite3.Error:
+        return None
+
+
+def artifact_miss_cached(stem: str, kind: str, roots: Iterable[Path]) -> bool:
+    """True when a recent lookup already scanned `roots` and found no `stem`/`kind` artifact."""
+    roots = list(roots)
+    catalog = _catalog_for(roots) if roots else None
+    if catalog is None:
+        return False
+    try:
+        return catalog.missed_recently(stem, kind, roots, _miss_ttl_sec())
+    except sqlite3.Error:
+        return False
+
+
+def remember_artifact_miss(stem: str, kind: str, roots: Iterable[Path]) -> None:
+    roots = list(roots)
+    catalog = _catalog_for(roots) if roots else None
+    if catalog is None:
+        return
+    try:
+        catalog.record_miss(stem, kind, roots)
+    except sqlite3.Error:
+        pass
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_STAGE_LIMITS: Dict[str, Any] = {}
+
+
+def bounded_map(fn: Callable[[T], R], items: Sequence[T], max_workers: int) -> List[R]:
+    """Run `fn` over `items` with at most `max_workers` calls in flight.
+
+    Results are returned in input order regardless of completion order.
+    Exceptions propagate like `Executor.map`, so callers that need per-item
+    fallbacks should catch inside `fn`.
+    """
+    if not items:
+        return []
+    workers = max(1, min(int(max_workers), len(items)))
+    if workers == 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def set_stage_limits(limits: Mapping[str, Optional[Any]]) -> None:
+    """Install semaphores (threading or multiprocessing) that bound named pipeline stages.
+
+    Batch workers share one semaphore per stage across processes, so e.g. OCR
+    and LLM calls can be capped independently of the number of workers.
+    """
+    _STAGE_LIMITS.clear()
+    _STAGE_LIMITS.update({name: sem for name, sem in limits.items() if sem is not None})
+
+
+@contextmanager
+def stage_limit(name: str) -> Iterator[None]:
+    """Hold the stage's semaphore, if one is installed, for the duration of the block."""
+    sem = _STAGE_LIMITS.get(name)
+    if sem is None:
+        yield
+        return
+    with sem:
+        yield
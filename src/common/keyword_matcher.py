@@ -0,0 +1,89 @@
+from collections import deque
+from typing import Dict, FrozenSet, List, Mapping, Sequence, Set, Tuple
+
+
+class KeywordMatcher:
+    """Aho–Corasick automaton over labeled keyword groups.
+
+    Built once from `{label: [keyword, ...]}`; a single left-to-right pass over
+    a text finds every keyword that occurs in it as a substring, including
+    overlapping and nested ones. `counts()` reports, per label, how many of its
+    keywords occur, i.e. `sum(kw in text for kw in keywords)`. Matching is
+    case-sensitive, so callers lowercase text the same way they lowercase
+    keywords.
+    """
+
+    def __init__(self, groups: Mapping[str, Sequence[str]]):
+        self.labels: Tuple[str, ...] = tuple(groups)
+        keyword_ids: Dict[str, int] = {}
+        self._keyword_labels: List[List[str]] = []
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                if not keyword:
+                    raise ValueError(f"empty keyword in group {label!r}")
+                kid = keyword_ids.setdefault(keyword, len(keyword_ids))
+                if kid == len(self._keyword_labels):
+                    self._keyword_labels.append([])
+                self._keyword_labels[kid].append(label)
+        self.keywords: Tuple[str, ...] = tuple(keyword_ids)
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for kid, keyword in enumerate(self.keywords):
+            node = 0
+            for ch in keyword:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append(kid)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # Outputs of the longest proper suffix are outputs here too.
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        # Fold failure links into a full transition table (BFS order: a node's
+        # fail target is always finished first), so scanning is one dict lookup
+        # per character. Characters that no keyword continues with go to root.
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            delta[node] = {**delta[fail[node]], **goto[node]}
+            queue.extend(goto[node].values())
+
+        self._delta = delta
+        self._out: List[Tuple[int, ...]] = [tuple(o) for o in out]
+
+    def found(self, text: str) -> FrozenSet[str]:
+        """Distinct keywords that occur in `text`."""
+        return frozenset(self.keywords[kid] for kid in self._scan(text))
+
+    def counts(self, text: str) -> Dict[str, int]:
+        counts = {label: 0 for label in self.labels}
+        for kid in self._scan(text):
+            for label in self._keyword_labels[kid]:
+                counts[label] += 1
+        return counts
+
+    def _scan(self, text: str) -> Set[int]:
+        delta, out = self._delta, self._out
+        found: Set[int] = set()
+        node = 0
+        for ch in text:
+            node = delta[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
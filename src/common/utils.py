@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Dict, Optional
 
+from src.common.artifact_catalog import latest_artifact, register_artifact
+
 
 def strategy_output_path(output_dir: Path, notice_pdf: Path) -> Path:
     return output_dir / f"{notice_pdf.stem}_strategy.json"
@@ -15,6 +17,7 @@ def save_strategy(strategy: Dict, path: Path, notice_pdf: Path) -> Path:
     }
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, ensure_ascii=False, indent=2)
+    register_artifact(path)
     return path
 
 
@@ -33,7 +36,13 @@ def load_strategy(path: Path) -> Optional[Dict]:
 def find_latest_strategy(output_dir: Path) -> Optional[Path]:
     if not output_dir.exists():
         return None
+    catalogued = latest_artifact("strategy", output_dir)
+    if catalogued:
+        return catalogued
+    # Not catalogued yet, or the directory changed since: scan once and register the newest.
     candidates = list(output_dir.glob("*_strategy.json"))
     if not candidates:
         return None
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+    newest = max(candidates, key=lambda p: p.stat().st_mtime)
+    register_artifact(newest)
+    return newest
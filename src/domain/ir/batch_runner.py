@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
+import multiprocessing
+import os
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from src.common.concurrency import set_stage_limits
 from src.domain.ir.pipeline import run_ir_analysis
+from src.domain.ir.settings import PipelineSettings
+from src.utils.artifact_codec import read_artifact
+
+JOURNAL_FILE = "batch_journal.jsonl"
 
 
 @dataclass
@@ -20,6 +29,10 @@ class BatchRunConfig:
     max_files: Optional[int] = None
     use_chunking: bool = True
     skip_notice_like: bool = True
+    workers: int = 1
+    ocr_concurrency: Optional[int] = None
+    llm_concurrency: Optional[int] = None
+    resume: bool = False
 
 
 def run_ir_batch(config: BatchRunConfig) -> Dict[str, Any]:
@@ -34,51 +47,33 @@ def run_ir_batch(config: BatchRunConfig) -> Dict[str, Any]:
         pdfs = pdfs[: max(0, config.max_files)]
 
     started_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-    rows: List[Dict[str, Any]] = []
-
-    for index, pdf in enumerate(pdfs, start=1):
-        started = time.perf_counter()
-        case_output_dir = output_root / pdf.stem
-        case_output_dir.mkdir(parents=True, exist_ok=True)
-        row: Dict[str, Any] = {
-            "index": index,
-            "file": str(pdf),
-            "status": "FAILED",
-            "elapsed_sec": 0.0,
-            "final_path": "",
-            "total_score": None,
-            "covered_groups": 0,
-            "partial_groups": 0,
-            "not_covered_groups": 0,
-            "error": "",
-        }
-        try:
-            result = run_ir_analysis(
-                ir_pdf=pdf,
-                output_dir=case_output_dir,
-                strategy=None,
-                use_chunking=config.use_chunking,
-                pitch_type=config.pitch_type,
-            )
-            final_path = Path(result["final_path"])
-            payload = json.loads(final_path.read_text(encoding="utf-8"))
-            criteria_scores = payload.get("criteria_scores", [])
-            statuses = [str(c.get("coverage_status", "")) for c in criteria_scores]
-            row.update(
-                {
-                    "status": "COMPLETED",
-                    "final_path": str(final_path),
-                    "total_score": int(payload.get("deck_score", {}).get("total_score", 0)),
-                    "covered_groups": sum(1 for s in statuses if s == "COVERED"),
-                    "partial_groups": sum(1 for s in statuses if s == "PARTIALLY_COVERED"),
-                    "not_covered_groups": sum(1 for s in statuses if s == "NOT_COVERED"),
-                }
-            )
-        except Exception as exc:
-            row["error"] = str(exc)
-        finally:
-            row["elapsed_sec"] = round(time.perf_counter() - started, 2)
-            rows.append(row)
+    cases = list(enumerate(pdfs, start=1))
+
+    # Every finished case is appended to the journal right away; the summary is
+    # rebuilt from it, so a crashed run loses at most the cases in flight.
+    journal_path = output_root / JOURNAL_FILE
+    config_hash = _config_hash(config)
+    pdf_hashes = {str(pdf): _file_sha256(pdf) for _, pdf in cases}
+    if not config.resume and journal_path.exists():
+        journal_path.unlink()
+    done = _completed_entries(journal_path, config_hash) if config.resume else {}
+    pending = [(index, pdf) for index, pdf in cases if (str(pdf), pdf_hashes[str(pdf)]) not in done]
+    if len(pending) < len(cases):
+        print(f"⏭️ 저널 기준 완료된 {len(cases) - len(pending)}건은 건너뜁니다.")
+
+    def record(row: Dict[str, Any]) -> None:
+        row["pdf_sha256"] = pdf_hashes[row["file"]]
+        row["config_hash"] = config_hash
+        _append_journal(journal_path, row)
+
+    workers = max(1, min(int(config.workers), len(pending) or 1))
+    if workers == 1:
+        for index, pdf in pending:
+            record(_run_case(index, pdf, output_root, config))
+    else:
+        _run_cases_in_pool(pending, output_root, config, workers, record)
+    # Summary order follows the input order, not completion order.
+    rows = _rows_from_journal(journal_path, cases, pdf_hashes, config_hash)
 
     finished_at = datetime.now(UTC).isoformat().replace("+00:00", "Z")
     completed = [r for r in rows if r["status"] == "COMPLETED"]
@@ -86,6 +81,9 @@ def run_ir_batch(config: BatchRunConfig) -> Dict[str, Any]:
         "started_at": started_at,
         "finished_at": finished_at,
         "pitch_type": config.pitch_type,
+        "workers": workers,
+        "config_hash": config_hash,
+        "resumed_files": len(cases) - len(pending),
         "total_files": len(rows),
         "completed_files": len(completed),
         "failed_files": len(rows) - len(completed),
@@ -93,6 +91,7 @@ def run_ir_batch(config: BatchRunConfig) -> Dict[str, Any]:
         "results": rows,
     }
 
+    summary["journal"] = str(journal_path)
     summary_json = output_root / "batch_summary.json"
     summary_csv = output_root / "batch_summary.csv"
     summary_json.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -102,6 +101,159 @@ def run_ir_batch(config: BatchRunConfig) -> Dict[str, Any]:
     return summary
 
 
+def _run_case(index: int, pdf: Path, output_root: Path, config: BatchRunConfig) -> Dict[str, Any]:
+    started = time.perf_counter()
+    case_output_dir = output_root / pdf.stem
+    case_output_dir.mkdir(parents=True, exist_ok=True)
+    row: Dict[str, Any] = {
+        "index": index,
+        "file": str(pdf),
+        "status": "FAILED",
+        "elapsed_sec": 0.0,
+        "final_path": "",
+        "total_score": None,
+        "covered_groups": 0,
+        "partial_groups": 0,
+        "not_covered_groups": 0,
+        "error": "",
+    }
+    try:
+        result = run_ir_analysis(
+            ir_pdf=pdf,
+            output_dir=case_output_dir,
+            strategy=None,
+            use_chunking=config.use_chunking,
+            pitch_type=config.pitch_type,
+        )
+        final_path = Path(result["final_path"])
+        payload = read_artifact(final_path)
+        criteria_scores = payload.get("criteria_scores", [])
+        statuses = [str(c.get("coverage_status", "")) for c in criteria_scores]
+        row.update(
+            {
+                "status": "COMPLETED",
+                "final_path": str(final_path),
+                "total_score": int(payload.get("deck_score", {}).get("total_score", 0)),
+                "covered_groups": sum(1 for s in statuses if s == "COVERED"),
+                "partial_groups": sum(1 for s in statuses if s == "PARTIALLY_COVERED"),
+                "not_covered_groups": sum(1 for s in statuses if s == "NOT_COVERED"),
+            }
+        )
+    except Exception as exc:
+        row["error"] = str(exc)
+    finally:
+        row["elapsed_sec"] = round(time.perf_counter() - started, 2)
+    return row
+
+
+def _run_cases_in_pool(
+    cases: List[Tuple[int, Path]],
+    output_root: Path,
+    config: BatchRunConfig,
+    workers: int,
+    on_row: Callable[[Dict[str, Any]], None],
+) -> None:
+    # Stage semaphores are shared by every worker process, so OCR and LLM load
+    # can be capped below the worker count.
+    ocr_sem = _stage_semaphore(config.ocr_concurrency, workers)
+    llm_sem = _stage_semaphore(config.llm_concurrency, workers)
+    finished = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ocr_sem, llm_sem)) as pool:
+        futures = {pool.submit(_run_case, index, pdf, output_root, config): (index, pdf) for index, pdf in cases}
+        for future in as_completed(futures):
+            index, pdf = futures[future]
+            try:
+                row = future.result()
+            except Exception as exc:  # worker process died
+                row = {"index": index, "file": str(pdf), "status": "FAILED", "elapsed_sec": 0.0, "error": str(exc)}
+            finished += 1
+            print(f"📦 [{finished}/{len(cases)}] {pdf.name}: {row['status']} ({row['elapsed_sec']}s)")
+            on_row(row)
+
+
+def _stage_semaphore(limit: Optional[int], workers: int) -> Optional[Any]:
+    if limit is None or int(limit) >= workers:
+        return None
+    return multiprocessing.BoundedSemaphore(max(1, int(limit)))
+
+
+def _init_worker(ocr_sem: Optional[Any], llm_sem: Optional[Any]) -> None:
+    """Per-process setup: install stage limits and build reusable clients once."""
+    set_stage_limits({"ocr": ocr_sem, "llm": llm_sem})
+    from src.domain.ir import rag_pipeline
+
+    rag_pipeline._init_embedding_client()
+
+
+def _config_hash(config: BatchRunConfig) -> str:
+    """Hash of everything that changes a case's result besides the PDF itself."""
+    payload = {
+        "pitch_type": config.pitch_type,
+        "use_chunking": config.use_chunking,
+        "settings": asdict(PipelineSettings.resolve()),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _append_journal(path: Path, row: Dict[str, Any]) -> None:
+    with path.open("ab+") as f:
+        # Start on a fresh line if a crash left a torn, newline-less entry.
+        end = f.seek(0, os.SEEK_END)
+        torn = False
+        if end:
+            f.seek(end - 1)
+            torn = f.read(1) != b"\n"
+        f.write((b"\n" if torn else b"") + (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_journal(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue  # torn last line from a crash
+    return entries
+
+
+def _completed_entries(path: Path, config_hash: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    return {
+        (str(e.get("file")), str(e.get("pdf_sha256"))): e
+        for e in _read_journal(path)
+        if e.get("status") == "COMPLETED" and e.get("config_hash") == config_hash
+    }
+
+
+def _rows_from_journal(
+    path: Path,
+    cases: List[Tuple[int, Path]],
+    pdf_hashes: Dict[str, str],
+    config_hash: str,
+) -> List[Dict[str, Any]]:
+    latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for entry in _read_journal(path):
+        if entry.get("config_hash") == config_hash:
+            latest[(str(entry.get("file")), str(entry.get("pdf_sha256")))] = entry
+    rows = []
+    for index, pdf in cases:
+        entry = latest.get((str(pdf), pdf_hashes[str(pdf)]))
+        if entry is not None:
+            rows.append({**entry, "index": index})
+    return rows
+
+
 def _write_summary_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
     fieldnames = [
         "index",
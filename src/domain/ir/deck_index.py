@@ -0,0 +1,205 @@
+"""Cross-deck "similar decks / similar slides" index over analyzed IR decks.
+
+Every analysis leaves `<deck_id>_slide_state.json` (+ `.npy` embedding rows)
+and `<deck_id>_final.json` next to each other. `DeckIndex.add_deck` folds
+them into two quantized `VectorIndex`es per embedding model, one with a row
+per slide and one with a row per deck (mean of its normalized slide vectors),
+so nearest-neighbour queries never open analysis JSON files.
+
+Decks embedded with different models are not comparable; each model gets its
+own sub-directory and a query only searches the one its deck lives in.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.infrastructure.embedding.vector_index import DEFAULT_CACHE_MB, VectorIndex
+from src.utils.artifact_codec import read_artifact
+
+DEFAULT_DECK_INDEX_DIR = Path("data/output/deck_index")
+SLIDE_STATE_SUFFIX = "_slide_state.json"
+SUMMARY_PREVIEW_CHARS = 160
+
+
+def deck_vector(vectors: np.ndarray) -> np.ndarray:
+    """Normalized mean of the deck's normalized slide vectors."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    centroid = (matrix / np.where(norms > 0, norms, 1.0)).mean(axis=0)
+    norm = float(np.linalg.norm(centroid))
+    return centroid / norm if norm > 0 else centroid
+
+
+def deck_id_from_state_path(path: Path) -> str:
+    name = Path(path).name
+    return name[: -len(SLIDE_STATE_SUFFIX)] if name.endswith(SLIDE_STATE_SUFFIX) else Path(path).stem
+
+
+def _slide_key(deck_id: str, slide_number: int) -> str:
+    return f"{deck_id}#{int(slide_number)}"
+
+
+def _model_dir_name(model: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", model).strip("_") or "default"
+
+
+class DeckIndex:
+    def __init__(self, root: Path, dtype: str = "int8", cache_mb: int = DEFAULT_CACHE_MB):
+        self.root = Path(root)
+        self.dtype = dtype
+        self.cache_mb = cache_mb
+        self._open: Dict[str, Tuple[VectorIndex, VectorIndex]] = {}
+        self._lock = threading.Lock()
+
+    def add_deck(self, deck_id: str, slide_state_path: Path, final_path: Optional[Path] = None) -> int:
+        """Index (or re-index) one analyzed deck; returns the number of slides indexed."""
+        state_path = Path(slide_state_path)
+        npy_path = state_path.with_suffix(".npy")
+        if not state_path.exists() or not npy_path.exists():
+            return 0
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        model = state.get("embedding_model")
+        vectors = np.load(npy_path, mmap_mode="r")
+        records = [r for r in state.get("slides", []) if 0 <= int(r.get("embedding_row", -1)) < len(vectors)]
+        if not model or not records:
+            return 0
+
+        final_path = Path(final_path) if final_path else state_path.with_name(f"{deck_id}_final.json")
+        final: Dict[str, Any] = {}
+        if final_path.exists():
+            try:
+                final = read_artifact(final_path)
+            except Exception:
+                final = {}
+        cards = {int(c.get("slide_number", 0)): c for c in final.get("slides", []) if isinstance(c, dict)}
+
+        matrix = np.asarray(vectors[[int(r["embedding_row"]) for r in records]], dtype=np.float32)
+        name = _model_dir_name(model)
+        decks, slides = self._open_dir(self.root / name) or self._indexes(name, matrix.shape[1])
+        slide_meta = []
+        for record in records:
+            card = cards.get(int(record["slide_number"]), {})
+            slide_meta.append(
+                {
+                    "deck_id": deck_id,
+                    "slide_number": int(record["slide_number"]),
+                    "category": card.get("category"),
+                    "summary": str(card.get("content") or "")[:SUMMARY_PREVIEW_CHARS],
+                }
+            )
+        previous = decks.get(deck_id)
+        if previous is not None:
+            current = {m["slide_number"] for m in slide_meta}
+            stale = [n for n in previous[1].get("slide_numbers", []) if n not in current]
+            slides.remove(_slide_key(deck_id, n) for n in stale)
+        slides.add([_slide_key(deck_id, m["slide_number"]) for m in slide_meta], matrix, slide_meta)
+        deck_meta = {
+            "deck_id": deck_id,
+            "filename": (final.get("meta") or {}).get("filename"),
+            "pitch_type": final.get("pitch_type"),
+            "total_score": (final.get("deck_score") or {}).get("total_score"),
+            "slide_numbers": [m["slide_number"] for m in slide_meta],
+        }
+        decks.add([deck_id], [deck_vector(matrix)], [deck_meta])
+        return len(slide_meta)
+
+    def similar_decks(self, deck_id: str, k: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """Nearest other decks, or None when `deck_id` is not indexed."""
+        found = self._find(deck_id)
+        if found is None:
+            return None
+        decks, _ = found
+        vector, _ = decks.get(deck_id)
+        return [_hit(score, meta) for score, meta in decks.search(vector, k, exclude=[deck_id])]
+
+    def similar_slides(self, deck_id: str, slide_number: int, k: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """Nearest slides of other decks to one slide, or None when it is not indexed."""
+        found = self._find(deck_id)
+        if found is None:
+            return None
+        decks, slides = found
+        hit = slides.get(_slide_key(deck_id, slide_number))
+        if hit is None:
+            return None
+        _, deck_meta = decks.get(deck_id)
+        own = [_slide_key(deck_id, n) for n in deck_meta.get("slide_numbers", [])]
+        return [_hit(score, meta) for score, meta in slides.search(hit[0], k, exclude=own)]
+
+    def stats(self) -> Dict[str, Any]:
+        out = {}
+        for model_dir in sorted(p for p in self.root.glob("*") if p.is_dir()):
+            found = self._open_dir(model_dir)
+            if found is not None:
+                out[model_dir.name] = {"decks": found[0].stats(), "slides": found[1].stats()}
+        return out
+
+    def _find(self, deck_id: str) -> Optional[Tuple[VectorIndex, VectorIndex]]:
+        if not self.root.exists():
+            return None
+        for model_dir in sorted(p for p in self.root.glob("*") if p.is_dir()):
+            found = self._open_dir(model_dir)
+            if found is not None and deck_id in found[0]:
+                return found
+        return None
+
+    def _indexes(self, name: str, dim: int, dtype: Optional[str] = None) -> Tuple[VectorIndex, VectorIndex]:
+        model_dir = self.root / name
+        with self._lock:
+            if name not in self._open:
+                dtype = dtype or self.dtype
+                self._open[name] = (
+                    VectorIndex(model_dir / "decks", dim, dtype=dtype, cache_mb=self.cache_mb),
+                    VectorIndex(model_dir / "slides", dim, dtype=dtype, cache_mb=self.cache_mb),
+                )
+            return self._open[name]
+
+    def _open_dir(self, model_dir: Path) -> Optional[Tuple[VectorIndex, VectorIndex]]:
+        if model_dir.name in self._open:
+            return self._open[model_dir.name]
+        header = model_dir / "decks" / VectorIndex.HEADER_FILE
+        if not header.exists():
+            return None
+        # Existing indexes keep the dim/dtype they were created with.
+        spec = json.loads(header.read_text(encoding="utf-8"))
+        return self._indexes(model_dir.name, int(spec["dim"]), spec["dtype"])
+
+
+def _hit(score: float, meta: Dict[str, Any]) -> Dict[str, Any]:
+    out = {k: v for k, v in meta.items() if k not in ("key", "row", "slide_numbers")}
+    out["similarity"] = round(score, 4)
+    return out
+
+
+def index_analysis_outputs(index: DeckIndex, roots: Iterable[Path]) -> Dict[str, int]:
+    """(Re)index every `*_slide_state.json` under `roots`; returns slides indexed per deck."""
+    indexed: Dict[str, int] = {}
+    for root in roots:
+        for state_path in sorted(Path(root).glob(f"**/*{SLIDE_STATE_SUFFIX}")):
+            deck_id = deck_id_from_state_path(state_path)
+            count = index.add_deck(deck_id, state_path)
+            if count:
+                indexed[deck_id] = count
+    return indexed
+
+
+_SHARED_INDEXES: Dict[str, DeckIndex] = {}
+_SHARED_INDEXES_LOCK = threading.Lock()
+
+
+def deck_index_from_env() -> Optional[DeckIndex]:
+    """Process-wide index at `IR_DECK_INDEX_DIR`; `IR_DECK_INDEX=0` disables it."""
+    if os.getenv("IR_DECK_INDEX", "1") == "0":
+        return None
+    root = Path(os.getenv("IR_DECK_INDEX_DIR", str(DEFAULT_DECK_INDEX_DIR)))
+    dtype = os.getenv("IR_DECK_INDEX_DTYPE", "int8")
+    key = f"{root.resolve()}|{dtype}"
+    with _SHARED_INDEXES_LOCK:
+        if key not in _SHARED_INDEXES:
+            _SHARED_INDEXES[key] = DeckIndex(root, dtype=dtype)
+        return _SHARED_INDEXES[key]
@@ -0,0 +1,81 @@
+"""Per-deck BM25 inverted index for lexical rubric-to-slide retrieval.
+
+Built once per deck from the slide retrieval texts: token -> postings of
+(slide row, precomputed BM25 term weight). Scoring a rubric item touches only
+the postings of its own terms, so cost scales with query terms x postings
+instead of items x slides.
+
+Scores are normalized per query by the query's BM25 ceiling (every term
+saturated, `idf * (k1 + 1)` each, out-of-vocabulary terms included), giving a
+0..1 coverage-like value that can replace token Jaccard in the similarity blend.
+"""
+
+from collections import Counter
+from math import log
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.ir.slide_features import TOKEN_PATTERN
+
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+def token_counts(text: str) -> Counter:
+    return Counter(TOKEN_PATTERN.findall((text or "").lower()))
+
+
+class BM25Index:
+    def __init__(self, documents: Sequence[Counter], k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.k1 = k1
+        self.b = b
+        self.n_docs = len(documents)
+        doc_len = np.array([sum(doc.values()) for doc in documents], dtype=np.float64)
+        avgdl = float(doc_len.mean()) if self.n_docs and doc_len.sum() > 0 else 1.0
+        length_norm = k1 * (1.0 - b + b * doc_len / avgdl)
+
+        raw: Dict[str, List[Tuple[int, int]]] = {}
+        for row, doc in enumerate(documents):
+            for term, tf in doc.items():
+                raw.setdefault(term, []).append((row, tf))
+
+        self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for term, entries in raw.items():
+            rows = np.fromiter((r for r, _ in entries), dtype=np.intp, count=len(entries))
+            tfs = np.fromiter((tf for _, tf in entries), dtype=np.float64, count=len(entries))
+            weights = self.idf(len(entries)) * tfs * (k1 + 1.0) / (tfs + length_norm[rows])
+            self.postings[term] = (rows, weights)
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], k1: float = DEFAULT_K1, b: float = DEFAULT_B) -> "BM25Index":
+        return cls([token_counts(t) for t in texts], k1=k1, b=b)
+
+    def idf(self, df: int) -> float:
+        # BM25+ style idf, always positive.
+        return log(1.0 + (self.n_docs - df + 0.5) / (df + 0.5))
+
+    def scores(self, terms: Iterable[str]) -> np.ndarray:
+        """Raw BM25 score of every document for a bag of distinct query terms."""
+        out = np.zeros(self.n_docs, dtype=np.float64)
+        for term in set(terms):
+            posting = self.postings.get(term)
+            if posting is not None:
+                rows, weights = posting
+                out[rows] += weights
+        return out
+
+    def ceiling(self, terms: Iterable[str]) -> float:
+        return sum(
+            self.idf(len(self.postings[t][0]) if t in self.postings else 0) * (self.k1 + 1.0) for t in set(terms)
+        )
+
+    def normalized_matrix(self, queries: Sequence[Iterable[str]]) -> np.ndarray:
+        """(queries x documents) BM25 scores scaled into 0..1 by each query's ceiling."""
+        out = np.zeros((len(queries), self.n_docs), dtype=np.float64)
+        for row, terms in enumerate(queries):
+            terms = set(terms)
+            top = self.ceiling(terms)
+            if top > 0:
+                out[row] = self.scores(terms) / top
+        return np.clip(out, 0.0, 1.0)
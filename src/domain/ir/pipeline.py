@@ -1,7 +1,10 @@
+import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from src.common.concurrency import stage_limit
 from src.common.utils import find_latest_strategy, load_strategy
+from src.domain.ir.deck_index import deck_index_from_env
 from src.domain.ir.rag_pipeline import run_rag_ir_analysis
 from src.domain.ir.scorer import export_final_json
 from src.infrastructure.document_ai.pipeline import run_document_ai_pipeline
@@ -31,6 +34,8 @@ def run_ir_analysis(
     strategy: Optional[Dict] = None,
     use_chunking: bool = True,
     pitch_type: Optional[str] = None,
+    previous_slide_state: Optional[Path] = None,
+    index_deck: bool = False,
 ) -> Dict:
     output_dir.mkdir(parents=True, exist_ok=True)
     print("\n📊 [IR Analysis] IR Deck 분석 시작")
@@ -38,34 +43,60 @@ def run_ir_analysis(
     if not ir_pdf.exists():
         raise FileNotFoundError(f"IR Deck 파일이 없습니다: {ir_pdf}")
 
-    ocr_result = run_document_ai_pipeline(ir_pdf, output_dir, use_chunking=use_chunking)
-    if not ocr_result and not use_chunking:
-        print("⚠️ OCR 결과가 비어 있어 chunking 모드로 재시도합니다.")
-        ocr_result = run_document_ai_pipeline(ir_pdf, output_dir, use_chunking=True)
+    with stage_limit("ocr"):
+        ocr_result = run_document_ai_pipeline(ir_pdf, output_dir, use_chunking=use_chunking)
+        if not ocr_result and not use_chunking:
+            print("⚠️ OCR 결과가 비어 있어 chunking 모드로 재시도합니다.")
+            ocr_result = run_document_ai_pipeline(ir_pdf, output_dir, use_chunking=True)
     if not ocr_result:
         raise RuntimeError("IR OCR 단계 실패: 결과가 비어 있습니다.")
 
     final_path = output_dir / f"{ir_pdf.stem}_final.json"
+    slide_state_path = output_dir / f"{ir_pdf.stem}_slide_state.json"
+    rag_started = time.time()
+    rag_ok = False
     try:
-        # Primary engine: B-plan RAG pipeline.
+        # Primary engine: B-plan RAG pipeline (its Gemini calls take the "llm" stage limit).
         run_rag_ir_analysis(
             docai_result=ocr_result,
             output_path=str(final_path),
             strategy=strategy,
             analysis_version=1,
             pitch_type=pitch_type,
+            previous_slide_state=str(previous_slide_state) if previous_slide_state else None,
+            slide_state_path=str(slide_state_path),
         )
+        rag_ok = True
     except Exception as e:
         print(f"⚠️ B안 파이프라인 실패, 기존 엔진으로 폴백: {e}")
         export_final_json(ocr_result, str(final_path), strategy)
     print(f"✅ IR 분석 결과 저장 완료: {final_path}")
+    # Only vectors written by this run's RAG pipeline match the new final.json.
+    if index_deck and rag_ok:
+        _index_deck(ir_pdf.stem, slide_state_path, final_path, written_after=rag_started)
 
     return {
         "final_path": str(final_path),
         "ocr_output": str(output_dir / f"{ir_pdf.stem}_docai.json"),
+        "slide_state": str(slide_state_path),
     }
 
 
+def _index_deck(deck_id: str, slide_state_path: Path, final_path: Path, written_after: float = 0.0) -> None:
+    index = deck_index_from_env()
+    if index is None or not slide_state_path.exists():
+        return
+    if slide_state_path.stat().st_mtime < written_after:
+        print(f"⚠️ 슬라이드 상태가 이번 분석보다 오래되어 유사 덱 인덱싱을 건너뜁니다: {slide_state_path}")
+        return
+    try:
+        count = index.add_deck(deck_id, slide_state_path, final_path)
+        if count:
+            print(f"🗂️ 유사 덱 인덱스 갱신: {deck_id} ({count}장)")
+    except Exception as e:
+        print(f"⚠️ 유사 덱 인덱스 갱신 실패: {e}")
+
+
 # Backward compatibility
 def run_ir_deck_analysis(
     ir_pdf: Path,
@@ -1,18 +1,55 @@
 import json
 import os
 import re
-from math import sqrt
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.common.artifact_catalog import register_artifact
+from src.common.concurrency import bounded_map, stage_limit
+from src.utils.artifact_codec import write_artifact
+from src.common.keyword_matcher import KeywordMatcher
+from src.domain.ir.lexical_index import BM25Index
+from src.domain.ir.similarity import embedding_matrix, similarity_matrix, top_k_evidences
+from src.domain.ir.slide_model import SlideRecord, as_slide_records, attach_embeddings, deck_embedding_matrix
+from src.domain.ir.slide_state import (
+    SlideState,
+    embedding_key,
+    save_slide_state,
+    slide_embedding_text,
+    slide_fingerprint,
+)
+from src.domain.ir.slide_features import (
+    SlideFeatures,
+    TextFeatures,
+    build_slide_features,
+    retrieval_text,
+    text_features,
+)
+from src.domain.ir.settings import PipelineSettings
+from src.infrastructure.embedding.cache import EmbeddingStore, embedding_store_from_env
 from src.infrastructure.embedding.client import EmbeddingClient
+from src.infrastructure.embedding.hashing import hashing_embedder_from_env
 from src.infrastructure.gemini.client import GeminiJSONClient
 
 
-DEFAULT_TOP_K = 3
-SIM_HIGH = 0.72
-SIM_MID = 0.60
-DEFAULT_LLM_SLIDE_LIMIT = 12
+SLIDE_CATEGORIES = {
+    "COVER",
+    "PROBLEM",
+    "SOLUTION",
+    "PRODUCT",
+    "MARKET",
+    "BUSINESS_MODEL",
+    "TRACTION",
+    "COMPETITION",
+    "TEAM",
+    "FINANCE",
+    "ASK",
+    "OTHER",
+}
 GROUP_CATEGORY_PRIORS = {
     "PROBLEM": {"PROBLEM", "MARKET"},
     "SOLUTION": {"SOLUTION", "PRODUCT"},
@@ -172,71 +209,31 @@ CATEGORY_PRIORITY = [
     "OTHER",
 ]
 
-_PIPELINE_CONFIG_CACHE: Optional[Dict[str, Any]] = None
-
-
-def _load_pipeline_config() -> Dict[str, Any]:
-    global _PIPELINE_CONFIG_CACHE
-    if _PIPELINE_CONFIG_CACHE is not None:
-        return _PIPELINE_CONFIG_CACHE
-    default_path = Path("data/config/pitchcoach_pipeline_config.json")
-    cfg_path = Path(os.getenv("PITCHCOACH_PIPELINE_CONFIG_PATH", str(default_path)))
-    if cfg_path.exists():
-        try:
-            _PIPELINE_CONFIG_CACHE = json.loads(cfg_path.read_text(encoding="utf-8"))
-            return _PIPELINE_CONFIG_CACHE
-        except Exception:
-            pass
-    _PIPELINE_CONFIG_CACHE = {}
-    return _PIPELINE_CONFIG_CACHE
-
-
-def _sim_high() -> float:
-    cfg = _load_pipeline_config()
-    cfg_val = (
-        cfg.get("matching", {})
-        .get("similarity_threshold", {})
-        .get("high", SIM_HIGH)
-    )
-    try:
-        return float(os.getenv("IR_SIM_HIGH", str(cfg_val)))
-    except Exception:
-        return SIM_HIGH
-
-
-def _sim_mid() -> float:
-    cfg = _load_pipeline_config()
-    cfg_val = (
-        cfg.get("matching", {})
-        .get("similarity_threshold", {})
-        .get("mid", SIM_MID)
-    )
-    try:
-        return float(os.getenv("IR_SIM_MID", str(cfg_val)))
-    except Exception:
-        return SIM_MID
-
-
-def _sim_low() -> float:
-    cfg = _load_pipeline_config()
-    cfg_val = cfg.get("matching", {}).get("similarity_threshold", {}).get("low")
-    if cfg_val is None:
-        cfg_val = max(0.0, _sim_mid() - 0.10)
-    try:
-        return float(os.getenv("IR_SIM_LOW", str(cfg_val)))
-    except Exception:
-        return max(0.0, _sim_mid() - 0.10)
-
-
-def _top_k() -> int:
-    cfg = _load_pipeline_config()
-    cfg_val = cfg.get("matching", {}).get("top_k", DEFAULT_TOP_K)
-    try:
-        v = int(os.getenv("IR_TOP_K", str(cfg_val)))
-        return max(1, min(10, v))
-    except Exception:
-        return DEFAULT_TOP_K
-
+# Core signals used by the rule-based classifier on top of CATEGORY_KEYWORDS.
+CORE_KEYWORDS = {
+    "MARKET": ["tam", "sam", "som", "시장규모", "cagr", "성장률", "시장 점유", "시장 성장"],
+    "PLAN": ["로드맵", "roadmap", "마일스톤", "q1", "q2", "q3", "q4", "2026", "2027", "2028", "일정", "분기"],
+    "TRACTION": ["mou", "loi", "poc", "계약", "선정", "인증", "실매출", "mrr", "arr", "재계약", "파일럿", "베타"],
+    "PRODUCT": ["ui", "ux", "화면", "스크린샷", "데모", "프로세스", "flow", "워크플로우", "아키텍처"],
+    "SOLUTION": ["해결", "솔루션", "개선", "제안", "대안", "효과", "as-is", "to-be"],
+    "TEAM": ["ceo", "cto", "coo", "cmo", "founder", "팀", "멤버", "프로필", "경력", "학력"],
+    "COVER": ["thank", "thanks", "q&a", "감사", "문의", "logo", "chapter", "section", "part", "overview", "agenda"],
+}
+COVER_TITLE_KEYWORDS = ["ir", "pitch", "발표", "데크", "deck"]
+STORY_PROBLEM_KEYWORDS = ["문제", "pain", "불편", "한계", "차별"]
+GOV_PITCH_KEYWORDS = ["정부", "지원사업", "정책", "지자체", "공공", "과제", "k-startup", "창업패키지"]
+CONTEST_PITCH_KEYWORDS = ["경진대회", "contest", "해커톤", "수상", "데모데이 외 대회"]
+
+# One automaton per keyword table family, built at import: a single pass per text.
+_CLASSIFY_MATCHER = KeywordMatcher(
+    {
+        **CATEGORY_KEYWORDS,
+        **{f"CORE_{name}": keywords for name, keywords in CORE_KEYWORDS.items()},
+        "COVER_TITLE": COVER_TITLE_KEYWORDS,
+        "STORY_PROBLEM": STORY_PROBLEM_KEYWORDS,
+    }
+)
+_PITCH_TYPE_MATCHER = KeywordMatcher({"GOV_SUPPORT": GOV_PITCH_KEYWORDS, "STARTUP_CONTEST": CONTEST_PITCH_KEYWORDS})
 
 def run_rag_ir_analysis(
     docai_result: Dict[str, Any],
@@ -244,9 +241,16 @@ def run_rag_ir_analysis(
     strategy: Optional[Dict[str, Any]] = None,
     analysis_version: int = 1,
     pitch_type: Optional[str] = None,
+    settings: Optional[PipelineSettings] = None,
+    previous_slide_state: Optional[str] = None,
+    slide_state_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     if not docai_result:
         raise RuntimeError("OCR 결과가 비어 있습니다.")
+    settings = settings or PipelineSettings.resolve()
+    previous = SlideState.load(Path(previous_slide_state)) if previous_slide_state else None
+    if previous is not None:
+        print(f"♻️ [RAG] 이전 버전 슬라이드 상태 로드: {len(previous)}장")
 
     print("🧠 [RAG] 분석 엔진 시작")
     gemini = GeminiJSONClient()
@@ -256,18 +260,21 @@ def run_rag_ir_analysis(
     print(f"🧾 [RAG] 슬라이드 로드 완료: {len(slides)}장")
 
     print("🏷️ [RAG] 슬라이드 분류/요약 진행")
-    _classify_and_summarize_slides(slides, gemini)
+    llm_classified = _classify_and_summarize_slides(slides, gemini, settings, previous)
+    _attach_slide_features(slides)
+    lexical_index = _build_lexical_index(slides, settings.lexical_scorer)
 
     print("🔢 [RAG] 임베딩 생성 진행")
     embed_client = _init_embedding_client()
-    _embed_slides(slides, embed_client)
-    _embed_rubric_items(rubric, embed_client)
+    embedding_model = _embed_deck(slides, rubric, embed_client, previous)
 
     print("📚 [RAG] 루브릭 매칭 및 기준별 점수 계산")
     criteria_scores = _score_criteria_with_rag(
         slides=slides,
         rubric=rubric,
         gemini=gemini,
+        settings=settings,
+        lexical_index=lexical_index,
     )
 
     print("🧩 [RAG] 종합 점수/가이드 생성")
@@ -287,15 +294,19 @@ def run_rag_ir_analysis(
             "filename": docai_result.get("metadata", {}).get("filename", "unknown"),
             "total_slides": len(slides),
             "analysis_model": gemini.model_name if gemini.model else None,
-            "embedding_model": "gemini-embedding-001",
+            "embedding_model": embedding_model,
         },
     }
 
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(final_output, f, ensure_ascii=False, indent=2)
-
+    write_artifact(output_file, final_output)
+    register_artifact(output_file)
+    if slide_state_path:
+        save_slide_state(Path(slide_state_path), slides, llm_classified, embedding_model)
+
+    cache_stats = gemini.cache_stats()
+    if cache_stats:
+        print(f"🗄️ [RAG] Gemini 응답 캐시: hit {cache_stats['hits']} / miss {cache_stats['misses']}")
     print("✅ [RAG] 최종 JSON 생성 완료")
     return final_output
 
@@ -340,11 +351,9 @@ def _infer_pitch_type_from_slides(slides: List[Dict[str, Any]]) -> Optional[str]
     if not text:
         return None
 
-    gov_keywords = ["정부", "지원사업", "정책", "지자체", "공공", "과제", "k-startup", "창업패키지"]
-    comp_keywords = ["경진대회", "contest", "해커톤", "수상", "데모데이 외 대회"]
-
-    gov_hits = sum(1 for k in gov_keywords if k in text)
-    comp_hits = sum(1 for k in comp_keywords if k in text)
+    hits = _PITCH_TYPE_MATCHER.counts(text)
+    gov_hits = hits["GOV_SUPPORT"]
+    comp_hits = hits["STARTUP_CONTEST"]
 
     if gov_hits >= 2:
         return "GOV_SUPPORT"
@@ -353,28 +362,23 @@ def _infer_pitch_type_from_slides(slides: List[Dict[str, Any]]) -> Optional[str]
     return "VC_DEMO"
 
 
-def _build_slides(docai_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _build_slides(docai_result: Dict[str, Any]) -> List[SlideRecord]:
     pages = docai_result.get("pages", [])
     detected_sections = docai_result.get("detected_sections", [])
     section_map = {s.get("page"): s.get("section", "unknown") for s in detected_sections if isinstance(s, dict)}
     full_text = docai_result.get("text", "")
 
-    slides: List[Dict[str, Any]] = []
+    slides: List[SlideRecord] = []
     for idx, page in enumerate(pages):
         page_num = idx + 1
         page_text = _extract_page_text(page, full_text).strip()
         slides.append(
-            {
-                "slide_number": page_num,
-                "raw_text": page_text,
-                "clean_text": _clean_text(page_text),
-                "short_summary": "",
-                "key_claims": [],
-                "category": section_map.get(page_num, "OTHER").upper(),
-                "category_confidence": 0.5,
-                "text_deficiency_flag": len(page_text) < 20,
-                "embedding": [],
-            }
+            SlideRecord(
+                slide_number=page_num,
+                clean_text=_clean_text(page_text),
+                category=section_map.get(page_num, "OTHER").upper(),
+                text_deficiency_flag=len(page_text) < 20,
+            )
         )
     return slides
 
@@ -395,11 +399,31 @@ def _clean_text(text: str) -> str:
     return text
 
 
-def _classify_and_summarize_slides(slides: List[Dict[str, Any]], gemini: GeminiJSONClient) -> None:
-    llm_slide_limit = int(os.getenv("IR_LLM_SLIDE_LIMIT", str(DEFAULT_LLM_SLIDE_LIMIT)))
-    use_llm_count = min(len(slides), llm_slide_limit) if gemini.model else 0
+def _classify_and_summarize_slides(
+    slides: List[Dict[str, Any]],
+    gemini: GeminiJSONClient,
+    settings: Optional[PipelineSettings] = None,
+    previous: Optional[SlideState] = None,
+) -> Set[int]:
+    """Classify/summarize slides in place; returns the slide numbers classified by Gemini."""
+    settings = settings or PipelineSettings.resolve()
+    use_llm_count = min(len(slides), settings.llm_slide_limit) if gemini.model else 0
+    max_in_flight = settings.llm_concurrency
     if gemini.model:
-        print(f"   - Gemini 분류 대상: {use_llm_count}/{len(slides)}장 (나머지 규칙 기반)")
+        print(f"   - Gemini 분류 대상: {use_llm_count}/{len(slides)}장 (나머지 규칙 기반, 동시 요청 {max_in_flight})")
+
+    llm_targets = [s for s in slides[:use_llm_count] if s["clean_text"]]
+    reused: Dict[int, Optional[Dict[str, Any]]] = {}
+    if previous is not None:
+        for slide in llm_targets:
+            cached = previous.classification(slide_fingerprint(slide["clean_text"]))
+            if cached is not None:
+                reused[int(slide["slide_number"])] = cached
+        print(f"   - 이전 버전 분류 재사용: {len(reused)}/{len(llm_targets)}장")
+    pending = [s for s in llm_targets if int(s["slide_number"]) not in reused]
+    llm_by_number = _llm_classify_targets(pending, gemini, settings)
+    llm_by_number.update(reused)
+    llm_classified: Set[int] = set()
 
     for idx, slide in enumerate(slides, start=1):
         if idx % 5 == 0 or idx == len(slides):
@@ -410,44 +434,11 @@ def _classify_and_summarize_slides(slides: List[Dict[str, Any]], gemini: GeminiJ
             slide["category"], slide["category_confidence"] = "OTHER", 0.2
             continue
 
-        if gemini.model and idx <= use_llm_count:
-            try:
-                prompt = (
-                    "다음 IR 슬라이드를 분석해서 JSON만 반환하세요.\n"
-                    "category는 COVER|PROBLEM|SOLUTION|PRODUCT|MARKET|BUSINESS_MODEL|TRACTION|"
-                    "COMPETITION|TEAM|FINANCE|ASK|OTHER 중 하나.\n"
-                    "출력: {\"category\":\"...\",\"category_confidence\":0.0~1.0,"
-                    "\"short_summary\":\"...\",\"key_claims\":[\"...\", \"...\"]}\n\n"
-                    f"[슬라이드 텍스트]\n{slide['clean_text'][:4000]}"
-                )
-                out = gemini.generate_json(prompt, temperature=0.1)
-                category = str(out.get("category", "OTHER")).upper()
-                if category not in {
-                    "COVER",
-                    "PROBLEM",
-                    "SOLUTION",
-                    "PRODUCT",
-                    "MARKET",
-                    "BUSINESS_MODEL",
-                    "TRACTION",
-                    "COMPETITION",
-                    "TEAM",
-                    "FINANCE",
-                    "ASK",
-                    "OTHER",
-                }:
-                    category = "OTHER"
-                slide["category"] = category
-                slide["category_confidence"] = _clamp01(float(out.get("category_confidence", 0.7)))
-                slide["short_summary"] = str(out.get("short_summary", ""))[:280] or slide["clean_text"][:180]
-                claims = out.get("key_claims", [])
-                if isinstance(claims, list):
-                    slide["key_claims"] = [str(c).strip() for c in claims if str(c).strip()][:5]
-                else:
-                    slide["key_claims"] = []
-                continue
-            except Exception:
-                pass
+        llm_out = llm_by_number.get(int(slide["slide_number"]))
+        if llm_out is not None:
+            slide.update(llm_out)
+            llm_classified.add(int(slide["slide_number"]))
+            continue
 
         # Fallback classification and summary
         category, conf = _keyword_classify_with_confidence(
@@ -459,6 +450,156 @@ def _classify_and_summarize_slides(slides: List[Dict[str, Any]], gemini: GeminiJ
         slide["category_confidence"] = conf
         slide["short_summary"] = slide["clean_text"][:180]
         slide["key_claims"] = _extract_claims(slide["clean_text"])
+    return llm_classified
+
+
+def _llm_classify_targets(
+    targets: List[Dict[str, Any]],
+    gemini: GeminiJSONClient,
+    settings: PipelineSettings,
+) -> Dict[int, Optional[Dict[str, Any]]]:
+    """Gemini classification keyed by slide_number; None entries fall back to rules."""
+    max_in_flight = settings.llm_concurrency
+    batch_size = settings.llm_batch_size
+    if batch_size <= 1:
+        results = bounded_map(lambda s: _llm_classify_slide(s, gemini), targets, max_in_flight)
+        return {int(s["slide_number"]): out for s, out in zip(targets, results)}
+
+    batches = _pack_classification_batches(targets, batch_size, settings.llm_batch_char_budget)
+    print(f"   - 배치 분류: {len(targets)}장 -> {len(batches)}회 요청 (최대 {batch_size}장/요청)")
+    by_number: Dict[int, Optional[Dict[str, Any]]] = {}
+    for batch_out in bounded_map(lambda b: _llm_classify_batch(b, gemini), batches, max_in_flight):
+        by_number.update(batch_out)
+
+    # Re-issue only the slides the batch responses left out.
+    missing = [s for s in targets if by_number.get(int(s["slide_number"])) is None]
+    if missing:
+        print(f"   - 배치 응답 누락 {len(missing)}장 개별 재요청")
+        retried = bounded_map(lambda s: _llm_classify_slide(s, gemini), missing, max_in_flight)
+        for slide, out in zip(missing, retried):
+            by_number[int(slide["slide_number"])] = out
+    return by_number
+
+
+def _pack_classification_batches(
+    targets: List[Dict[str, Any]],
+    batch_size: int,
+    char_budget: int,
+) -> List[List[Dict[str, Any]]]:
+    batches: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    used = 0
+    for slide in targets:
+        size = min(len(slide["clean_text"]), 4000)
+        if current and (len(current) >= batch_size or used + size > char_budget):
+            batches.append(current)
+            current, used = [], 0
+        current.append(slide)
+        used += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _generate_json(gemini: GeminiJSONClient, prompt: str, temperature: float) -> Any:
+    # The batch runner's "llm" stage limit bounds Gemini calls only, not the local RAG work around them.
+    with stage_limit("llm"):
+        return gemini.generate_json(prompt, temperature=temperature)
+
+
+def _llm_classify_batch(batch: List[Dict[str, Any]], gemini: GeminiJSONClient) -> Dict[int, Dict[str, Any]]:
+    """Classify several slides in one prompt; slides missing from the reply are omitted."""
+    try:
+        sections = "\n\n".join(
+            f"[슬라이드 {int(s['slide_number'])}]\n{s['clean_text'][:4000]}" for s in batch
+        )
+        prompt = (
+            f"다음 IR 슬라이드 {len(batch)}장을 각각 분석해서 JSON 배열만 반환하세요.\n"
+            "category는 COVER|PROBLEM|SOLUTION|PRODUCT|MARKET|BUSINESS_MODEL|TRACTION|"
+            "COMPETITION|TEAM|FINANCE|ASK|OTHER 중 하나.\n"
+            "출력: [{\"slide_number\":1,\"category\":\"...\",\"category_confidence\":0.0~1.0,"
+            "\"short_summary\":\"...\",\"key_claims\":[\"...\", \"...\"]}]\n"
+            "입력된 모든 slide_number에 대해 정확히 1개씩 반환하세요.\n\n"
+            f"{sections}"
+        )
+        out = _generate_json(gemini, prompt, temperature=0.1)
+    except Exception:
+        return {}
+
+    entries = out.get("slides", []) if isinstance(out, dict) else out
+    by_number = {int(s["slide_number"]): s for s in batch}
+    parsed: Dict[int, Dict[str, Any]] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        try:
+            number = int(entry.get("slide_number"))
+            if number in by_number and number not in parsed:
+                parsed[number] = _parse_llm_classification(entry, by_number[number])
+        except Exception:
+            continue
+    return parsed
+
+
+def _llm_classify_slide(slide: Dict[str, Any], gemini: GeminiJSONClient) -> Optional[Dict[str, Any]]:
+    """Classify one slide with Gemini; None means the caller should use the rule-based fallback."""
+    try:
+        prompt = (
+            "다음 IR 슬라이드를 분석해서 JSON만 반환하세요.\n"
+            "category는 COVER|PROBLEM|SOLUTION|PRODUCT|MARKET|BUSINESS_MODEL|TRACTION|"
+            "COMPETITION|TEAM|FINANCE|ASK|OTHER 중 하나.\n"
+            "출력: {\"category\":\"...\",\"category_confidence\":0.0~1.0,"
+            "\"short_summary\":\"...\",\"key_claims\":[\"...\", \"...\"]}\n\n"
+            f"[슬라이드 텍스트]\n{slide['clean_text'][:4000]}"
+        )
+        out = _generate_json(gemini, prompt, temperature=0.1)
+        return _parse_llm_classification(out, slide)
+    except Exception:
+        return None
+
+
+def _parse_llm_classification(out: Dict[str, Any], slide: Dict[str, Any]) -> Dict[str, Any]:
+    category = str(out.get("category", "OTHER")).upper()
+    if category not in SLIDE_CATEGORIES:
+        category = "OTHER"
+    claims = out.get("key_claims", [])
+    return {
+        "category": category,
+        "category_confidence": _clamp01(float(out.get("category_confidence", 0.7))),
+        "short_summary": str(out.get("short_summary", ""))[:280] or slide["clean_text"][:180],
+        "key_claims": [str(c).strip() for c in claims if str(c).strip()][:5] if isinstance(claims, list) else [],
+    }
+
+
+def _attach_slide_features(slides: List[Dict[str, Any]]) -> None:
+    # Built once after classification so retrieval/cards never re-tokenize slide text.
+    for slide in slides:
+        slide["features"] = build_slide_features(slide)
+
+
+def _build_lexical_index(slides: Sequence[Dict[str, Any]], lexical_scorer: str) -> Optional[BM25Index]:
+    # Built once per deck next to the slide features; only the BM25 scorer needs it.
+    if lexical_scorer != "bm25":
+        return None
+    return BM25Index.from_texts(retrieval_text(s) for s in slides)
+
+
+def _slide_features(slide: Dict[str, Any]) -> SlideFeatures:
+    features = slide.get("features")
+    if features is None:
+        features = build_slide_features(slide)
+        slide["features"] = features
+    return features
+
+
+def _item_features(item: Dict[str, Any]) -> TextFeatures:
+    features = item.get("features")
+    if features is None:
+        features = text_features(_item_text(item))
+        item["features"] = features
+    return features
+
+
+def _item_text(item: Dict[str, Any]) -> str:
+    return f"{item.get('item_name', '')} {item.get('description', '')}".strip()
 
 
 def _keyword_classify(text: str) -> str:
@@ -477,13 +618,14 @@ def _keyword_classify_with_confidence(
     line_count = len([ln for ln in re.split(r"[\r\n]+", t) if ln.strip()])
     num_cnt = len(re.findall(r"\d", t))
 
-    has_market_core = any(k in t for k in ["tam", "sam", "som", "시장규모", "cagr", "성장률", "시장 점유", "시장 성장"])
-    has_plan_core = any(k in t for k in ["로드맵", "roadmap", "마일스톤", "q1", "q2", "q3", "q4", "2026", "2027", "2028", "일정", "분기"])
-    has_traction_core = any(k in t for k in ["mou", "loi", "poc", "계약", "선정", "인증", "실매출", "mrr", "arr", "재계약", "파일럿", "베타"])
-    has_product_core = any(k in t for k in ["ui", "ux", "화면", "스크린샷", "데모", "프로세스", "flow", "워크플로우", "아키텍처"])
-    has_solution_core = any(k in t for k in ["해결", "솔루션", "개선", "제안", "대안", "효과", "as-is", "to-be"])
-    has_team_core = any(k in t for k in ["ceo", "cto", "coo", "cmo", "founder", "팀", "멤버", "프로필", "경력", "학력"])
-    has_cover_core = any(k in t for k in ["thank", "thanks", "q&a", "감사", "문의", "logo", "chapter", "section", "part", "overview", "agenda"])
+    hits = _CLASSIFY_MATCHER.counts(t)
+    has_market_core = hits["CORE_MARKET"] > 0
+    has_plan_core = hits["CORE_PLAN"] > 0
+    has_traction_core = hits["CORE_TRACTION"] > 0
+    has_product_core = hits["CORE_PRODUCT"] > 0
+    has_solution_core = hits["CORE_SOLUTION"] > 0
+    has_team_core = hits["CORE_TEAM"] > 0
+    has_cover_core = hits["CORE_COVER"] > 0
 
     # Cover/title slide heuristic
     if total_slides > 0:
@@ -491,7 +633,7 @@ def _keyword_classify_with_confidence(
             return "COVER", 0.82
         if slide_number == total_slides and token_count <= 60:
             return "COVER", 0.80
-    if len(t) < 130 and any(k in t for k in ["ir", "pitch", "발표", "데크", "deck"]):
+    if len(t) < 130 and hits["COVER_TITLE"] > 0:
         return "COVER", 0.78
     if has_cover_core and token_count <= 20 and line_count <= 4 and num_cnt == 0:
         return "COVER", 0.70
@@ -500,11 +642,7 @@ def _keyword_classify_with_confidence(
     if total_slides > 0 and slide_number <= 2 and has_team_core:
         return "TEAM", 0.70
 
-    scores: Dict[str, float] = {k: 0.0 for k in CATEGORY_KEYWORDS}
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if kw in t:
-                scores[category] += 1.0
+    scores: Dict[str, float] = {k: float(hits[k]) for k in CATEGORY_KEYWORDS}
 
     if num_cnt >= 8:
         scores["MARKET"] += 1.0
@@ -535,7 +673,7 @@ def _keyword_classify_with_confidence(
         scores["SOLUTION"] -= 0.3
 
     # Prefer solution for problem->solution storytelling slides.
-    if has_solution_core and any(k in t for k in ["문제", "pain", "불편", "한계", "차별"]):
+    if has_solution_core and hits["STORY_PROBLEM"] > 0:
         scores["SOLUTION"] += 0.6
         scores["PROBLEM"] += 0.3
 
@@ -557,25 +695,68 @@ def _extract_claims(text: str) -> List[str]:
     return claims[:5]
 
 
+_EMBED_CLIENTS: Dict[Tuple[str, str], EmbeddingClient] = {}
+_EMBED_CLIENTS_LOCK = threading.Lock()
+
+
 def _init_embedding_client() -> Optional[EmbeddingClient]:
+    """Process-wide Vertex embedding client; built once per (project, location)."""
     if os.getenv("ENABLE_VERTEX_EMBEDDING") != "1":
         return None
-    try:
-        project_id = os.getenv("PROJECT_ID")
-        if not project_id:
+    project_id = os.getenv("PROJECT_ID")
+    if not project_id:
+        return None
+    location = os.getenv("LOCATION", "us-central1")
+    with _EMBED_CLIENTS_LOCK:
+        client = _EMBED_CLIENTS.get((project_id, location))
+        if client is not None:
+            return client
+        try:
+            client = EmbeddingClient(model_name="gemini-embedding-001")
+            client.init_vertex(project_id=project_id, location=location)
+        except Exception:
             return None
-        client = EmbeddingClient(model_name="gemini-embedding-001")
-        client.init_vertex(project_id=project_id, location=os.getenv("LOCATION", "us-central1"))
+        _EMBED_CLIENTS[(project_id, location)] = client
         return client
-    except Exception:
-        return None
 
 
-def _embed_slides(slides: List[Dict[str, Any]], embed_client: Optional[EmbeddingClient]) -> None:
-    texts = [f"{s['clean_text']}\n{s['short_summary']}" for s in slides]
-    vectors = _embed_texts(texts, embed_client)
-    for slide, vec in zip(slides, vectors):
-        slide["embedding"] = vec
+def _embed_deck(
+    slides: List[Dict[str, Any]],
+    rubric: Dict[str, Any],
+    embed_client: Optional[EmbeddingClient],
+    previous: Optional[SlideState] = None,
+) -> str:
+    """Embed slides and rubric items in place; returns the name of the embedding model used."""
+    slide_texts = [slide_embedding_text(s) for s in slides]
+    item_refs = [item for group in rubric.get("groups", []) for item in group.get("items", [])]
+    item_texts = [f"{item.get('item_name', '')}. {item.get('description', '')}" for item in item_refs]
+    expected_model = embed_client.model_name if embed_client is not None else hashing_embedder_from_env().model_name
+
+    reused: Dict[int, Sequence[float]] = {}
+    if previous is not None:
+        for idx, (slide, text) in enumerate(zip(slides, slide_texts)):
+            vec = previous.embedding(slide_fingerprint(slide["clean_text"]), embedding_key(expected_model, text))
+            if vec is not None:
+                reused[idx] = vec
+        print(f"   - 이전 버전 임베딩 재사용: {len(reused)}/{len(slides)}장")
+    pending = [idx for idx in range(len(slides)) if idx not in reused]
+
+    # Slides and rubric items share one embedding call so the client can pack them into full batches.
+    vectors, model = _embed_texts_with_model([slide_texts[idx] for idx in pending] + item_texts, embed_client)
+    if reused and model != expected_model:
+        # The model call fell back to hashing; reused model vectors would not share its vector space.
+        vectors, model = _embed_texts_with_model(slide_texts + item_texts, None)
+        pending, reused = list(range(len(slides))), {}
+    slide_vectors: List[Sequence[float]] = [[] for _ in slides]
+    for idx, vec in zip(pending, vectors[: len(pending)]):
+        slide_vectors[idx] = vec
+    for idx, vec in reused.items():
+        slide_vectors[idx] = vec
+    # One float32 deck matrix; each slide keeps a row view instead of its own float list.
+    attach_embeddings(slides, slide_vectors)
+    for item, vec in zip(item_refs, vectors[len(pending) :]):
+        item["embedding"] = vec
+    return model
 
 
 def _load_rubric(pitch_type: str) -> Dict[str, Any]:
@@ -656,46 +837,89 @@ def _default_rubric(pitch_type: str) -> Dict[str, Any]:
     return {"pitch_type": pitch_type, "total_points": 100, "groups": common}
 
 
-def _embed_rubric_items(rubric: Dict[str, Any], embed_client: Optional[EmbeddingClient]) -> None:
-    items = []
-    refs: List[Dict[str, Any]] = []
-    for group in rubric.get("groups", []):
-        for item in group.get("items", []):
-            text = f"{item.get('item_name', '')}. {item.get('description', '')}"
-            items.append(text)
-            refs.append(item)
-    vectors = _embed_texts(items, embed_client)
-    for item, vec in zip(refs, vectors):
-        item["embedding"] = vec
+def _embed_texts(
+    texts: List[str],
+    embed_client: Optional[EmbeddingClient],
+    task_type: str = "RETRIEVAL_DOCUMENT",
+) -> List[Sequence[float]]:
+    return _embed_texts_with_model(texts, embed_client, task_type)[0]
 
 
-def _embed_texts(texts: List[str], embed_client: Optional[EmbeddingClient]) -> List[List[float]]:
+def _embed_texts_with_model(
+    texts: List[str],
+    embed_client: Optional[EmbeddingClient],
+    task_type: str = "RETRIEVAL_DOCUMENT",
+) -> Tuple[List[Sequence[float]], str]:
     if embed_client is not None:
         try:
-            return embed_client.embed(texts, task_type="RETRIEVAL_DOCUMENT")
+            store = embedding_store_from_env()
+            if store is None:
+                return embed_client.embed(texts, task_type=task_type), embed_client.model_name
+            return _embed_texts_with_store(texts, embed_client, store, task_type), embed_client.model_name
         except Exception:
             pass
-    return [_fallback_embed(t) for t in texts]
-
-
-def _fallback_embed(text: str) -> List[float]:
-    # Lightweight deterministic fallback embedding.
-    vec = [0.0] * 64
-    for token in re.findall(r"[a-zA-Z0-9가-힣_]+", text.lower()):
-        idx = hash(token) % len(vec)
-        vec[idx] += 1.0
-    norm = sqrt(sum(v * v for v in vec)) or 1.0
-    return [v / norm for v in vec]
+    fallback = hashing_embedder_from_env()
+    return list(fallback.embed(texts)), fallback.model_name
+
+
+def _embed_texts_with_store(
+    texts: List[str],
+    embed_client: EmbeddingClient,
+    store: EmbeddingStore,
+    task_type: str,
+) -> List[Sequence[float]]:
+    # Only cache misses reach the embedding API; hits are views into the store's memory map.
+    vectors: List[Optional[Sequence[float]]] = list(store.get_many(embed_client.model_name, task_type, texts))
+    missing = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+    if missing:
+        fresh = embed_client.embed(missing, task_type=task_type)
+        store.put_many(embed_client.model_name, task_type, missing, fresh)
+        by_text = dict(zip(missing, fresh))
+        vectors = [v if v is not None else by_text[t] for t, v in zip(texts, vectors)]
+    print(f"   - 임베딩 캐시: hit {len(texts) - len(missing)} / miss {len(missing)}")
+    return vectors
 
 
 def _score_criteria_with_rag(
     slides: List[Dict[str, Any]],
     rubric: Dict[str, Any],
     gemini: GeminiJSONClient,
+    settings: Optional[PipelineSettings] = None,
+    lexical_index: Optional[BM25Index] = None,
 ) -> List[Dict[str, Any]]:
-    criteria_scores: List[Dict[str, Any]] = []
+    settings = settings or PipelineSettings.resolve()
+    groups = rubric.get("groups", [])
+    item_refs = [(str(group.get("group_id", "")), item) for group in groups for item in group.get("items", [])]
+    max_in_flight = settings.llm_concurrency
+
+    # Phase 1 (local): retrieval and coverage planning, no network calls.
+    evidences_by_item = _retrieve_evidences(
+        item_refs,
+        slides,
+        settings.top_k,
+        settings.retrieval_min_sim,
+        lexical_scorer=settings.lexical_scorer,
+        lexical_index=lexical_index,
+    )
+    plans = [
+        _plan_coverage(item, evidences, gemini, settings)
+        for (_, item), evidences in zip(item_refs, evidences_by_item)
+    ]
+
+    # Phase 2a: every pending LLM review in one concurrent wave.
+    review_idx = [i for i, plan in enumerate(plans) if plan.needs_review]
+    reviews = bounded_map(
+        lambda i: _llm_review(item_refs[i][1], evidences_by_item[i][:2], gemini, settings),
+        review_idx,
+        max_in_flight,
+    )
+    coverages = [plan.coverage for plan in plans]
+    for i, reviewed in zip(review_idx, reviews):
+        coverages[i] = plans[i].resolve(reviewed)
 
-    for group in rubric.get("groups", []):
+    group_states: List[Dict[str, Any]] = []
+    item_cursor = 0
+    for group in groups:
         group_items = group.get("items", [])
         raw_group_score = 0.0
         raw_group_max = float(group.get("max_score", 0))
@@ -706,16 +930,12 @@ def _score_criteria_with_rag(
         evidence_for_group: List[Dict[str, Any]] = []
 
         for item in group_items:
-            evidences = _retrieve_top_k(
-                item,
-                slides,
-                top_k=_top_k(),
-                group_id=str(group.get("group_id", "")),
-            )
+            evidences = evidences_by_item[item_cursor]
+            coverage = str(coverages[item_cursor])
+            item_cursor += 1
             max_sim = evidences[0]["similarity"] if evidences else 0.0
-            coverage = _decide_coverage(item, evidences, gemini)
             item_max = float(item.get("max_score", 0))
-            item_score = _score_item(item_max, coverage, max_sim)
+            item_score = _score_item(item_max, coverage, max_sim, settings)
 
             raw_group_score += item_score
             coverage_values.append(coverage)
@@ -723,7 +943,7 @@ def _score_criteria_with_rag(
             # Bind evidence to score: for covered/partial items, keep at least top evidence.
             if coverage in {"COVERED", "PARTIALLY_COVERED"} and evidences:
                 all_related.append(int(evidences[0]["slide_number"]))
-                all_related.extend([e["slide_number"] for e in evidences[1:] if e["similarity"] >= (_sim_mid() - 0.1)])
+                all_related.extend([e["slide_number"] for e in evidences[1:] if e["similarity"] >= (settings.sim_mid - 0.1)])
             evidence_for_group.append(
                 {
                     "item_id": item.get("item_id"),
@@ -752,15 +972,38 @@ def _score_criteria_with_rag(
                 if rel:
                     fallback_related.append(int(rel[0]))
             related_unique = sorted(set(fallback_related))
-        group_coverage = _reduce_group_coverage(coverage_values, coverage_weights)
-        score_100 = int(round((raw_group_score / raw_group_max) * 100)) if raw_group_max > 0 else 0
-        feedback, confidence = _build_group_feedback(
-            group=group,
-            evidence_for_group=evidence_for_group,
-            missing_items=missing_items,
-            gemini=gemini,
+        group_states.append(
+            {
+                "group": group,
+                "raw_group_score": raw_group_score,
+                "raw_group_max": raw_group_max,
+                "group_coverage": _reduce_group_coverage(coverage_values, coverage_weights),
+                "related_unique": related_unique,
+                "missing_items": missing_items,
+                "evidence_for_group": evidence_for_group,
+            }
         )
 
+    # Phase 2b: all group feedback calls in one concurrent wave.
+    feedbacks = bounded_map(
+        lambda st: _build_group_feedback(
+            group=st["group"],
+            evidence_for_group=st["evidence_for_group"],
+            missing_items=st["missing_items"],
+            gemini=gemini,
+            settings=settings,
+        ),
+        group_states,
+        max_in_flight,
+    )
+
+    criteria_scores: List[Dict[str, Any]] = []
+    for st, (feedback, confidence) in zip(group_states, feedbacks):
+        group = st["group"]
+        raw_group_score = st["raw_group_score"]
+        raw_group_max = st["raw_group_max"]
+        group_coverage = st["group_coverage"]
+        score_100 = int(round((raw_group_score / raw_group_max) * 100)) if raw_group_max > 0 else 0
         criteria_scores.append(
             {
                 "criteria_score_id": f"cs-{group.get('group_id', '').lower()}",
@@ -774,8 +1017,8 @@ def _score_criteria_with_rag(
                 "is_covered": group_coverage != "NOT_COVERED",
                 "coverage_status": group_coverage,
                 "feedback": feedback,
-                "related_slides": related_unique,
-                "missing_items": missing_items,
+                "related_slides": st["related_unique"],
+                "missing_items": st["missing_items"],
                 "confidence": confidence,
             }
         )
@@ -812,60 +1055,48 @@ def _validate_and_repair_criteria(criteria_scores: List[Dict[str, Any]]) -> List
     return criteria_scores
 
 
-def _retrieve_top_k(
-    item: Dict[str, Any],
-    slides: List[Dict[str, Any]],
+def _retrieve_evidences(
+    item_refs: List[Tuple[str, Dict[str, Any]]],
+    slides: Sequence[Dict[str, Any]],
     top_k: int,
-    group_id: str = "",
-) -> List[Dict[str, Any]]:
-    item_vec = item.get("embedding", [])
-    item_text = f"{item.get('item_name', '')} {item.get('description', '')}".strip()
-    prior_categories = GROUP_CATEGORY_PRIORS.get(group_id, set())
-    scored = []
-    min_retrieval_sim = float(os.getenv("IR_RETR_MIN_SIM", "0.02"))
-    for slide in slides:
-        if slide.get("text_deficiency_flag"):
-            continue
-        vec_sim = _cosine(item_vec, slide.get("embedding", []))
-        slide_text = f"{slide.get('clean_text', '')} {slide.get('short_summary', '')}"
-        lex_sim = _lexical_similarity(item_text, slide_text)
-        ngram_sim = _ngram_similarity(item_text, slide_text)
-        kw_sim = _keyword_overlap_score(item_text, slide_text)
-        blend_sim = (0.40 * vec_sim) + (0.25 * lex_sim) + (0.20 * ngram_sim) + (0.15 * kw_sim)
-        robust_sim = max(lex_sim, ngram_sim, (0.85 * vec_sim) + (0.15 * kw_sim))
-        sim = max(blend_sim, robust_sim)
-        if prior_categories and slide.get("category") in prior_categories:
-            sim = min(1.0, sim + 0.12)
-            if float(slide.get("category_confidence", 0.0)) >= 0.7:
-                sim = min(1.0, sim + 0.04)
-        if _item_prefers_numeric(item_text):
-            digit_cnt = len(re.findall(r"\d", slide_text))
-            if digit_cnt >= 6:
-                sim = min(1.0, sim + 0.06)
-            elif digit_cnt >= 3:
-                sim = min(1.0, sim + 0.03)
-        if sim < min_retrieval_sim:
-            continue
-        scored.append(
-            {
-                "slide_number": slide["slide_number"],
-                "similarity": sim,
-                "summary": slide["short_summary"],
-                "clean_text": slide["clean_text"][:1000],
-            }
-        )
-    scored.sort(key=lambda x: x["similarity"], reverse=True)
-    return scored[:top_k]
-
-
-def _keyword_overlap_score(item_text: str, slide_text: str) -> float:
-    item_tokens = set(re.findall(r"[a-zA-Z0-9가-힣_]+", (item_text or "").lower()))
-    slide_tokens = set(re.findall(r"[a-zA-Z0-9가-힣_]+", (slide_text or "").lower()))
-    if not item_tokens or not slide_tokens:
-        return 0.0
-    overlap = len(item_tokens & slide_tokens)
-    denom = max(1, min(len(item_tokens), 10))
-    return max(0.0, min(1.0, overlap / denom))
+    min_sim: float = PipelineSettings.retrieval_min_sim,
+    lexical_scorer: str = PipelineSettings.lexical_scorer,
+    lexical_index: Optional[BM25Index] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Score every (group_id, item) against the deck at once and keep each item's top-k slides.
+
+    Pass the deck's `lexical_index` (see `_build_lexical_index`) when retrieving
+    more than once per deck; it is built here only when missing.
+    """
+    if not item_refs:
+        return []
+    slides = as_slide_records(slides)
+    items = [item for _, item in item_refs]
+    slide_feats = [_slide_features(s) for s in slides]
+    lexical_sim = None
+    if lexical_scorer == "bm25":
+        index = lexical_index if lexical_index is not None else _build_lexical_index(slides, lexical_scorer)
+        lexical_sim = index.normalized_matrix([_item_features(item).tokens for item in items])
+    sim = similarity_matrix(
+        item_vectors=embedding_matrix([item.get("embedding", []) for item in items], dtype=np.float64),
+        item_features=[_item_features(item) for item in items],
+        item_priors=[GROUP_CATEGORY_PRIORS.get(group_id, set()) for group_id, _ in item_refs],
+        item_numeric=[_item_prefers_numeric(_item_text(item)) for item in items],
+        slide_vectors=deck_embedding_matrix(slides),
+        slide_features=slide_feats,
+        slide_categories=[s.category for s in slides],
+        slide_confidences=[float(s.category_confidence) for s in slides],
+        lexical_sim=lexical_sim,
+    )
+    eligible = np.array([not s.text_deficiency_flag for s in slides], dtype=bool)
+    return top_k_evidences(
+        sim,
+        slides,
+        slide_feats,
+        top_k=top_k,
+        min_sim=min_sim,
+        eligible=eligible,
+    )
 
 
 def _item_prefers_numeric(item_text: str) -> bool:
@@ -890,95 +1121,91 @@ def _item_prefers_numeric(item_text: str) -> bool:
     return any(k in t for k in numeric_hints)
 
 
-def _lexical_similarity(a: str, b: str) -> float:
-    ta = set(re.findall(r"[a-zA-Z0-9가-힣_]+", (a or "").lower()))
-    tb = set(re.findall(r"[a-zA-Z0-9가-힣_]+", (b or "").lower()))
-    if not ta or not tb:
-        return 0.0
-    inter = len(ta & tb)
-    union = len(ta | tb)
-    if union == 0:
-        return 0.0
-    return inter / union
+@dataclass(frozen=True)
+class CoveragePlan:
+    """Coverage decided locally, or a pending LLM review and how to read its verdict."""
 
+    coverage: Optional[str] = None
+    # NOT_COVERED from the review is softened to PARTIALLY_COVERED (mid-band evidence).
+    soften: bool = False
 
-def _ngram_similarity(a: str, b: str, n: int = 3) -> float:
-    aa = re.sub(r"\s+", "", (a or "").lower())
-    bb = re.sub(r"\s+", "", (b or "").lower())
-    if len(aa) < n or len(bb) < n:
-        return 0.0
-    ga = {aa[i : i + n] for i in range(len(aa) - n + 1)}
-    gb = {bb[i : i + n] for i in range(len(bb) - n + 1)}
-    if not ga or not gb:
-        return 0.0
-    inter = len(ga & gb)
-    union = len(ga | gb)
-    return inter / union if union else 0.0
-
+    @property
+    def needs_review(self) -> bool:
+        return self.coverage is None
 
-def _cosine(a: List[float], b: List[float]) -> float:
-    if not a or not b:
-        return 0.0
-    n = min(len(a), len(b))
-    dot = sum(a[i] * b[i] for i in range(n))
-    na = sqrt(sum(a[i] * a[i] for i in range(n)))
-    nb = sqrt(sum(b[i] * b[i] for i in range(n)))
-    if na == 0 or nb == 0:
-        return 0.0
-    return max(0.0, min(1.0, dot / (na * nb)))
+    def resolve(self, reviewed: str) -> str:
+        if self.soften and reviewed == "NOT_COVERED":
+            return "PARTIALLY_COVERED"
+        return reviewed
 
 
-def _decide_coverage(item: Dict[str, Any], evidences: List[Dict[str, Any]], gemini: GeminiJSONClient) -> str:
+def _plan_coverage(
+    item: Dict[str, Any],
+    evidences: List[Dict[str, Any]],
+    gemini: GeminiJSONClient,
+    settings: Optional[PipelineSettings] = None,
+) -> CoveragePlan:
+    settings = settings or PipelineSettings.resolve()
     max_sim = evidences[0]["similarity"] if evidences else 0.0
     fail_if_missing = bool(item.get("fail_if_missing", False))
-    sim_high = _sim_high()
-    sim_mid = _sim_mid()
-    sim_low = _sim_low()
+    sim_high = settings.sim_high
+    sim_mid = settings.sim_mid
+    sim_low = settings.sim_low
 
     # Local/offline fallback: keep partial coverage signal when semantic model is unavailable.
     if not gemini.model and sim_low <= max_sim < sim_mid:
-        return "PARTIALLY_COVERED"
+        return CoveragePlan("PARTIALLY_COVERED")
 
     if max_sim >= sim_high:
         if evidences and len((evidences[0].get("clean_text") or "").strip()) < 20:
-            return _llm_review(item, evidences[:2], gemini)
-        return "COVERED"
+            return CoveragePlan()
+        return CoveragePlan("COVERED")
 
     if sim_mid <= max_sim < sim_high:
-        reviewed = _llm_review(item, evidences[:2], gemini)
-        return "PARTIALLY_COVERED" if reviewed == "NOT_COVERED" else reviewed
+        return CoveragePlan(soften=True)
 
     if sim_low <= max_sim < sim_mid and evidences:
         if fail_if_missing:
-            reviewed = _llm_review(item, evidences[:2], gemini)
-            return "PARTIALLY_COVERED" if reviewed == "NOT_COVERED" else reviewed
-        return "PARTIALLY_COVERED"
+            return CoveragePlan(soften=True)
+        return CoveragePlan("PARTIALLY_COVERED")
 
     if fail_if_missing:
-        return _llm_review(item, evidences[:2], gemini)
-    return "NOT_COVERED"
+        return CoveragePlan()
+    return CoveragePlan("NOT_COVERED")
 
 
-def _llm_review(item: Dict[str, Any], evidences: List[Dict[str, Any]], gemini: GeminiJSONClient) -> str:
-    if os.getenv("IR_FAST_MODE") == "1":
-        top = evidences[0]["similarity"] if evidences else 0.0
-        if top >= _sim_high():
-            return "COVERED"
-        if top >= _sim_mid():
-            return "PARTIALLY_COVERED"
-        if top >= _sim_low():
-            return "PARTIALLY_COVERED"
-        return "NOT_COVERED"
+def _decide_coverage(
+    item: Dict[str, Any],
+    evidences: List[Dict[str, Any]],
+    gemini: GeminiJSONClient,
+    settings: Optional[PipelineSettings] = None,
+) -> str:
+    settings = settings or PipelineSettings.resolve()
+    plan = _plan_coverage(item, evidences, gemini, settings)
+    if not plan.needs_review:
+        return str(plan.coverage)
+    return plan.resolve(_llm_review(item, evidences[:2], gemini, settings))
 
-    if not gemini.model or not evidences:
-        top = evidences[0]["similarity"] if evidences else 0.0
-        if top >= _sim_high():
-            return "COVERED"
-        if top >= _sim_mid():
-            return "PARTIALLY_COVERED"
-        if top >= _sim_low():
-            return "PARTIALLY_COVERED"
-        return "NOT_COVERED"
+
+def _coverage_from_similarity(top: float, settings: PipelineSettings) -> str:
+    if top >= settings.sim_high:
+        return "COVERED"
+    if top >= settings.sim_mid:
+        return "PARTIALLY_COVERED"
+    if top >= settings.sim_low:
+        return "PARTIALLY_COVERED"
+    return "NOT_COVERED"
+
+
+def _llm_review(
+    item: Dict[str, Any],
+    evidences: List[Dict[str, Any]],
+    gemini: GeminiJSONClient,
+    settings: Optional[PipelineSettings] = None,
+) -> str:
+    settings = settings or PipelineSettings.resolve()
+    if settings.fast_mode or not gemini.model or not evidences:
+        return _coverage_from_similarity(evidences[0]["similarity"] if evidences else 0.0, settings)
     try:
         prompt = {
             "item_name": item.get("item_name"),
@@ -989,7 +1216,7 @@ def _llm_review(item: Dict[str, Any], evidences: List[Dict[str, Any]], gemini: G
             "question": "증거 슬라이드가 항목을 충족하는가? JSON만 반환",
             "output_format": {"is_relevant": True, "confidence": 0.0},
         }
-        out = gemini.generate_json(json.dumps(prompt, ensure_ascii=False), temperature=0.0)
+        out = _generate_json(gemini, json.dumps(prompt, ensure_ascii=False), temperature=0.0)
         is_rel = bool(out.get("is_relevant", False))
         conf = _clamp01(float(out.get("confidence", 0.0)))
         if is_rel and conf >= 0.6:
@@ -998,25 +1225,23 @@ def _llm_review(item: Dict[str, Any], evidences: List[Dict[str, Any]], gemini: G
             return "PARTIALLY_COVERED"
         return "NOT_COVERED"
     except Exception:
-        top = evidences[0]["similarity"] if evidences else 0.0
-        if top >= _sim_high():
-            return "COVERED"
-        if top >= _sim_mid():
-            return "PARTIALLY_COVERED"
-        if top >= _sim_low():
-            return "PARTIALLY_COVERED"
-        return "NOT_COVERED"
+        return _coverage_from_similarity(evidences[0]["similarity"] if evidences else 0.0, settings)
 
 
-def _score_item(item_max: float, coverage: str, similarity: float) -> float:
+def _score_item(
+    item_max: float,
+    coverage: str,
+    similarity: float,
+    settings: Optional[PipelineSettings] = None,
+) -> float:
     if coverage == "NOT_COVERED":
         return 0.0
+    settings = settings or PipelineSettings.resolve()
+    sim_high = max(0.01, min(0.99, settings.sim_high))
     if coverage == "PARTIALLY_COVERED":
-        sim_high = max(0.01, min(0.99, _sim_high()))
         ratio = max(0.35, min(0.70, (similarity / sim_high) * 0.70))
         return round(item_max * ratio, 2)
     # COVERED
-    sim_high = max(0.01, min(0.99, _sim_high()))
     ratio = 0.65 + max(0.0, min(1.0, (similarity - sim_high) / (1.0 - sim_high))) * 0.35
     return round(item_max * ratio, 2)
 
@@ -1047,8 +1272,10 @@ def _build_group_feedback(
     evidence_for_group: List[Dict[str, Any]],
     missing_items: List[Dict[str, str]],
     gemini: GeminiJSONClient,
+    settings: Optional[PipelineSettings] = None,
 ) -> Tuple[str, float]:
-    if os.getenv("IR_FAST_MODE") == "1":
+    settings = settings or PipelineSettings.resolve()
+    if settings.fast_mode:
         if missing_items:
             return (
                 f"{group.get('group_name')} 항목에서 누락 요소가 감지되었습니다. "
@@ -1067,7 +1294,7 @@ def _build_group_feedback(
                 "instruction": "근거 기반으로 2문장 피드백 작성. 과장 금지. JSON만 반환.",
                 "output_format": {"feedback": "...", "confidence": 0.0},
             }
-            out = gemini.generate_json(json.dumps(prompt, ensure_ascii=False), temperature=0.2)
+            out = _generate_json(gemini, json.dumps(prompt, ensure_ascii=False), temperature=0.2)
             feedback = str(out.get("feedback", "")).strip()
             confidence = _clamp01(float(out.get("confidence", 0.75)))
             if feedback:
@@ -1138,7 +1365,7 @@ def _build_structure_summary(
                 "instruction": "IR 덱 구조 총평을 3~4문장으로 작성. JSON만 반환.",
                 "output_format": {"summary": "..."},
             }
-            out = gemini.generate_json(json.dumps(payload, ensure_ascii=False), temperature=0.2)
+            out = _generate_json(gemini, json.dumps(payload, ensure_ascii=False), temperature=0.2)
             summary = str(out.get("summary", "")).strip()
             if summary:
                 return summary
@@ -1186,7 +1413,7 @@ def _build_presentation_guide(
     }
 
 
-def _build_slide_cards(slides: List[Dict[str, Any]], criteria_scores: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _build_slide_cards(slides: Sequence[Dict[str, Any]], criteria_scores: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     score_by_slide: Dict[int, List[int]] = {}
     criteria_by_slide: Dict[int, List[str]] = {}
     for c in criteria_scores:
@@ -1195,12 +1422,13 @@ def _build_slide_cards(slides: List[Dict[str, Any]], criteria_scores: List[Dict[
             criteria_by_slide.setdefault(sn, []).append(str(c.get("criteria_name", "")))
 
     out = []
-    for slide in slides:
-        sn = slide["slide_number"]
+    for slide in as_slide_records(slides):
+        sn = slide.slide_number
         linked_scores = score_by_slide.get(sn, [])
-        text_len = len(slide.get("clean_text", ""))
-        numbers = len(re.findall(r"\d", slide.get("clean_text", "")))
-        cat_conf = float(slide.get("category_confidence", 0.5))
+        feat = _slide_features(slide)
+        text_len = feat.clean_length
+        numbers = feat.clean_digit_count
+        cat_conf = float(slide.category_confidence)
 
         base = 45
         if linked_scores:
@@ -1210,13 +1438,13 @@ def _build_slide_cards(slides: List[Dict[str, Any]], criteria_scores: List[Dict[
             base += 8
         elif numbers >= 3:
             base += 4
-        if slide.get("category") == "OTHER":
+        if slide.category == "OTHER":
             base -= 8
         if text_len > 1200:
             base -= 6
         if text_len < 40:
             base -= 10
-        if slide["text_deficiency_flag"]:
+        if slide.text_deficiency_flag:
             base = min(base, 50)
         detail = _slide_feedback(
             slide=slide,
@@ -1228,10 +1456,10 @@ def _build_slide_cards(slides: List[Dict[str, Any]], criteria_scores: List[Dict[
             {
                 "slide_id": f"slide-{sn}",
                 "slide_number": sn,
-                "category": slide["category"],
+                "category": slide.category,
                 "score": max(0, min(100, base)),
                 "thumbnail_url": None,
-                "content": slide["short_summary"],
+                "content": slide.short_summary,
                 "display_order": sn,
                 "feedback": detail,
             }
@@ -1240,39 +1468,39 @@ def _build_slide_cards(slides: List[Dict[str, Any]], criteria_scores: List[Dict[
 
 
 def _slide_feedback(
-    slide: Dict[str, Any],
+    slide: SlideRecord,
     score: int,
     matched_criteria: List[str],
     numeric_count: int,
 ) -> Dict[str, Any]:
     strengths = []
     improvements = []
-    if slide["category"] != "OTHER":
-        strengths.append(f"{slide['category']} 목적의 메시지가 확인됩니다.")
-    if len(slide.get("key_claims", [])) >= 2:
+    if slide.category != "OTHER":
+        strengths.append(f"{slide.category} 목적의 메시지가 확인됩니다.")
+    if len(slide.key_claims or []) >= 2:
         strengths.append("핵심 주장 문장이 2개 이상 있어 전달 포인트가 분명합니다.")
     if numeric_count >= 3:
         strengths.append("수치 정보가 포함되어 객관적 설명에 유리합니다.")
     if matched_criteria:
         strengths.append(f"관련 기준: {', '.join(matched_criteria[:2])}")
 
-    if slide.get("text_deficiency_flag"):
+    if slide.text_deficiency_flag:
         improvements.append("텍스트 근거가 부족하므로 핵심 문장/수치를 1~2개 추가하세요.")
-    if len(slide.get("clean_text", "")) > 900:
+    if _slide_features(slide).clean_length > 900:
         improvements.append("텍스트 밀도가 높아 핵심 문장 중심으로 압축하는 것이 좋습니다.")
     if numeric_count == 0:
         improvements.append("정량 근거(시장/사용자/매출 등) 수치를 최소 1개 이상 넣어주세요.")
-    if slide.get("category") in {"MARKET", "BUSINESS_MODEL"} and numeric_count < 2:
+    if slide.category in {"MARKET", "BUSINESS_MODEL"} and numeric_count < 2:
         improvements.append("시장/수익 슬라이드는 계산식 또는 기준년/출처를 함께 제시하세요.")
-    if slide.get("category") == "TEAM":
+    if slide.category == "TEAM":
         improvements.append("팀 슬라이드는 역할/경력/실행성과를 한 줄씩 분리해 가독성을 높이세요.")
     if not improvements:
         improvements.append("핵심 주장 1개를 제목으로 끌어올리고, 본문은 근거 2개로 압축하세요.")
 
-    preview = (slide.get("short_summary", "") or "").strip()
+    preview = (slide.short_summary or "").strip()
     preview = preview[:90] + ("..." if len(preview) > 90 else "")
     detailed = (
-        f"슬라이드 {slide['slide_number']}({slide['category']}) 점수는 {score}점입니다. "
+        f"슬라이드 {slide.slide_number}({slide.category}) 점수는 {score}점입니다. "
         f"요약: {preview}"
     )
     return {
@@ -1,9 +1,11 @@
-import json
 import re
 from typing import Dict, List, Optional, Any
 
+from src.common.artifact_catalog import register_artifact
+from src.common.concurrency import stage_limit
 from src.domain.ir.prompts import build_ir_analysis_prompt
 from src.infrastructure.gemini.client import GeminiJSONClient
+from src.utils.artifact_codec import write_artifact
 
 
 DEFAULT_REQUIRED_SECTIONS = {
@@ -154,7 +156,8 @@ def analyze_with_gemini(
     )
 
     try:
-        analysis_result = gemini.generate_json(prompt, temperature=0.3)
+        with stage_limit("llm"):
+            analysis_result = gemini.generate_json(prompt, temperature=0.3)
         print("Gemini 분석 완료!")
         return analysis_result
 
@@ -289,8 +292,8 @@ def export_final_json(
         if "full_text" in slide["contents"]:
             del slide["contents"]["full_text"]
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(final_output, f, ensure_ascii=False, indent=2)
+    write_artifact(output_path, final_output)
+    register_artifact(output_path)
 
     print("\n완료!")
     print("파일:", output_path)
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_CONFIG_PATH = Path("data/config/pitchcoach_pipeline_config.json")
+
+DEFAULT_TOP_K = 3
+SIM_HIGH = 0.72
+SIM_MID = 0.60
+DEFAULT_RETR_MIN_SIM = 0.02
+DEFAULT_LLM_SLIDE_LIMIT = 12
+DEFAULT_LLM_CONCURRENCY = 4
+DEFAULT_LLM_BATCH_CHAR_BUDGET = 12000
+DEFAULT_LEXICAL_SCORER = "jaccard"
+LEXICAL_SCORERS = ("jaccard", "bm25")
+
+_CONFIG_LOCK = threading.Lock()
+_CONFIG_CACHE: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+
+
+def pipeline_config_path() -> Path:
+    return Path(os.getenv("PITCHCOACH_PIPELINE_CONFIG_PATH", str(DEFAULT_CONFIG_PATH)))
+
+
+def load_pipeline_config(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Parsed pipeline config, re-read only when the file's mtime changes."""
+    cfg_path = Path(path) if path is not None else pipeline_config_path()
+    try:
+        mtime: Optional[int] = cfg_path.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    key = str(cfg_path)
+    with _CONFIG_LOCK:
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        cfg: Dict[str, Any] = {}
+        if mtime is not None:
+            try:
+                cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+            except Exception:
+                cfg = {}
+        _CONFIG_CACHE[key] = (mtime, cfg)
+        return cfg
+
+
+def _env(name: str, cast: Callable[[str], Any], default: Any) -> Any:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return cast(raw)
+    except Exception:
+        return default
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name) == "1"
+
+
+@dataclass(frozen=True)
+class PipelineSettings:
+    """Immutable knobs for one `run_rag_ir_analysis` call.
+
+    Resolved once (overrides > env > pipeline config > defaults) and passed
+    down explicitly, so hot loops never touch `os.environ` and concurrent runs
+    can use different thresholds.
+    """
+
+    sim_high: float = SIM_HIGH
+    sim_mid: float = SIM_MID
+    sim_low: float = SIM_MID - 0.10
+    top_k: int = DEFAULT_TOP_K
+    retrieval_min_sim: float = DEFAULT_RETR_MIN_SIM
+    llm_slide_limit: int = DEFAULT_LLM_SLIDE_LIMIT
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY
+    llm_batch_size: int = 1
+    llm_batch_char_budget: int = DEFAULT_LLM_BATCH_CHAR_BUDGET
+    fast_mode: bool = False
+    lexical_scorer: str = DEFAULT_LEXICAL_SCORER
+
+    @classmethod
+    def resolve(cls, **overrides: Any) -> "PipelineSettings":
+        cfg = load_pipeline_config()
+        matching = cfg.get("matching", {}) or {}
+        thresholds = matching.get("similarity_threshold", {}) or {}
+
+        sim_high = _env("IR_SIM_HIGH", float, _as_float(thresholds.get("high"), SIM_HIGH))
+        sim_mid = _env("IR_SIM_MID", float, _as_float(thresholds.get("mid"), SIM_MID))
+        sim_high = float(overrides.pop("sim_high", sim_high))
+        sim_mid = float(overrides.pop("sim_mid", sim_mid))
+        derived_low = max(0.0, sim_mid - 0.10)
+        sim_low = _env("IR_SIM_LOW", float, _as_float(thresholds.get("low"), derived_low))
+        top_k = _env("IR_TOP_K", int, _as_int(matching.get("top_k"), DEFAULT_TOP_K))
+        lexical_scorer = str(
+            overrides.pop("lexical_scorer", None)
+            or os.getenv("IR_LEXICAL_SCORER")
+            or matching.get("lexical_scorer")
+            or DEFAULT_LEXICAL_SCORER
+        ).lower()
+
+        settings = cls(
+            sim_high=sim_high,
+            sim_mid=sim_mid,
+            sim_low=sim_low,
+            top_k=max(1, min(10, top_k)),
+            retrieval_min_sim=_env("IR_RETR_MIN_SIM", float, DEFAULT_RETR_MIN_SIM),
+            llm_slide_limit=_env("IR_LLM_SLIDE_LIMIT", int, DEFAULT_LLM_SLIDE_LIMIT),
+            llm_concurrency=max(1, _env("IR_LLM_CONCURRENCY", int, DEFAULT_LLM_CONCURRENCY)),
+            llm_batch_size=max(1, _env("IR_LLM_BATCH_SIZE", int, 1)),
+            llm_batch_char_budget=max(500, _env("IR_LLM_BATCH_CHAR_BUDGET", int, DEFAULT_LLM_BATCH_CHAR_BUDGET)),
+            fast_mode=_env_flag("IR_FAST_MODE"),
+            lexical_scorer=lexical_scorer if lexical_scorer in LEXICAL_SCORERS else DEFAULT_LEXICAL_SCORER,
+        )
+        if "top_k" in overrides:
+            overrides["top_k"] = max(1, min(10, int(overrides["top_k"])))
+        return replace(settings, **overrides) if overrides else settings
+
+
+def _as_float(value: Any, default: float) -> float:
+    try:
+        return float(value) if value is not None else default
+    except Exception:
+        return default
+
+
+def _as_int(value: Any, default: int) -> int:
+    try:
+        return int(value) if value is not None else default
+    except Exception:
+        return default
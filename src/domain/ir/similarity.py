@@ -0,0 +1,192 @@
+"""Vectorized item x slide similarity for the RAG engine.
+
+Computes the original per-(item, slide) retrieval blend as matrix operations:
+one matmul for embedding cosine (float32 rows, float64 math), incidence-matrix
+products for token/trigram overlaps, and masked bonuses for category priors and
+numeric slides. Similarities agree with the per-pair reference (kept in
+tests/test_ir_similarity_matrix.py and tools/bench_ir_similarity.py) to well
+within SIMILARITY_TOLERANCE; both rank on `rank_key`, which rounds to that
+tolerance, so summation-order noise cannot reorder near-ties before the
+slide-order tie-break.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from src.domain.ir.slide_features import SlideFeatures, TextFeatures
+
+SIMILARITY_TOLERANCE = 1e-9
+
+
+def rank_key(similarity: float) -> int:
+    """Similarity rounded to SIMILARITY_TOLERANCE; equal keys are ties broken by slide order."""
+    return round(similarity / SIMILARITY_TOLERANCE)
+
+
+def embedding_matrix(vectors: Sequence[Sequence[float]], dtype: Any = np.float32) -> np.ndarray:
+    """Stack embeddings into a matrix (float32 by default); missing vectors become zero rows."""
+    if isinstance(vectors, np.ndarray) and vectors.ndim == 2:
+        return vectors.astype(dtype, copy=False)
+    width = max((len(v) for v in vectors), default=0)
+    out = np.zeros((len(vectors), width), dtype=dtype)
+    for idx, vec in enumerate(vectors):
+        if len(vec):
+            out[idx, : len(vec)] = np.asarray(vec, dtype=dtype)
+    return out
+
+
+def cosine_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Clamped cosine of every row of `a` against every row of `b`."""
+    dim = min(a.shape[1], b.shape[1])
+    if dim == 0 or a.shape[0] == 0 or b.shape[0] == 0:
+        return np.zeros((a.shape[0], b.shape[0]), dtype=np.float64)
+    a = np.asarray(a[:, :dim], dtype=np.float64)
+    b = np.asarray(b[:, :dim], dtype=np.float64)
+    dot = a @ b.T
+    na = np.linalg.norm(a, axis=1)
+    nb = np.linalg.norm(b, axis=1)
+    denom = np.outer(na, nb)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos = np.where(denom > 0, dot / denom, 0.0)
+    return np.clip(cos, 0.0, 1.0)
+
+
+def _overlap_counts(
+    item_sets: Sequence[frozenset],
+    slide_sets: Sequence[frozenset],
+) -> np.ndarray:
+    # Only terms that occur in some item can intersect, so the vocabulary stays item-sized.
+    vocab: Dict[str, int] = {}
+    for terms in item_sets:
+        for term in terms:
+            vocab.setdefault(term, len(vocab))
+    if not vocab:
+        return np.zeros((len(item_sets), len(slide_sets)), dtype=np.float64)
+    item_inc = np.zeros((len(item_sets), len(vocab)), dtype=np.float32)
+    for row, terms in enumerate(item_sets):
+        item_inc[row, [vocab[t] for t in terms]] = 1.0
+    slide_inc = np.zeros((len(slide_sets), len(vocab)), dtype=np.float32)
+    for row, terms in enumerate(slide_sets):
+        cols = [vocab[t] for t in terms if t in vocab]
+        if cols:
+            slide_inc[row, cols] = 1.0
+    return (item_inc @ slide_inc.T).astype(np.float64)
+
+
+def _jaccard_matrix(inter: np.ndarray, item_sizes: np.ndarray, slide_sizes: np.ndarray) -> np.ndarray:
+    union = item_sizes[:, None] + slide_sizes[None, :] - inter
+    valid = (item_sizes[:, None] > 0) & (slide_sizes[None, :] > 0) & (union > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(valid, inter / union, 0.0)
+
+
+def similarity_matrix(
+    item_vectors: np.ndarray,
+    item_features: Sequence[TextFeatures],
+    item_priors: Sequence[Set[str]],
+    item_numeric: Sequence[bool],
+    slide_vectors: np.ndarray,
+    slide_features: Sequence[SlideFeatures],
+    slide_categories: Sequence[str],
+    slide_confidences: Sequence[float],
+    lexical_sim: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Return the (items x slides) retrieval similarity matrix.
+
+    `lexical_sim` replaces the token-Jaccard term (e.g. normalized BM25 scores).
+    """
+    n_items = len(item_features)
+    n_slides = len(slide_features)
+    if n_items == 0 or n_slides == 0:
+        return np.zeros((n_items, n_slides), dtype=np.float64)
+
+    vec_sim = cosine_matrix(item_vectors, slide_vectors)
+
+    item_tokens = [f.tokens for f in item_features]
+    slide_tokens = [f.tokens for f in slide_features]
+    item_tok_sizes = np.array([len(t) for t in item_tokens], dtype=np.float64)
+    slide_tok_sizes = np.array([len(t) for t in slide_tokens], dtype=np.float64)
+    tok_inter = _overlap_counts(item_tokens, slide_tokens)
+    lex_sim = _jaccard_matrix(tok_inter, item_tok_sizes, slide_tok_sizes) if lexical_sim is None else lexical_sim
+
+    kw_denom = np.maximum(1.0, np.minimum(item_tok_sizes, 10.0))[:, None]
+    kw_valid = (item_tok_sizes[:, None] > 0) & (slide_tok_sizes[None, :] > 0)
+    kw_sim = np.where(kw_valid, np.clip(tok_inter / kw_denom, 0.0, 1.0), 0.0)
+
+    item_grams = [f.trigrams for f in item_features]
+    slide_grams = [f.trigrams for f in slide_features]
+    gram_inter = _overlap_counts(item_grams, slide_grams)
+    ngram_sim = _jaccard_matrix(
+        gram_inter,
+        np.array([len(g) for g in item_grams], dtype=np.float64),
+        np.array([len(g) for g in slide_grams], dtype=np.float64),
+    )
+
+    blend = (0.40 * vec_sim) + (0.25 * lex_sim) + (0.20 * ngram_sim) + (0.15 * kw_sim)
+    robust = np.maximum(np.maximum(lex_sim, ngram_sim), (0.85 * vec_sim) + (0.15 * kw_sim))
+    sim = np.maximum(blend, robust)
+
+    categories = np.asarray(list(slide_categories), dtype=object)
+    confident = np.asarray(slide_confidences, dtype=np.float64) >= 0.7
+    prior = np.zeros((n_items, n_slides), dtype=bool)
+    for row, priors in enumerate(item_priors):
+        if priors:
+            prior[row] = np.isin(categories, list(priors))
+    sim = np.where(prior, np.minimum(1.0, sim + 0.12), sim)
+    sim = np.where(prior & confident[None, :], np.minimum(1.0, sim + 0.04), sim)
+
+    digits = np.array([f.digit_count for f in slide_features], dtype=np.int64)
+    numeric = np.asarray(item_numeric, dtype=bool)[:, None]
+    sim = np.where(numeric & (digits >= 6)[None, :], np.minimum(1.0, sim + 0.06), sim)
+    sim = np.where(numeric & ((digits >= 3) & (digits < 6))[None, :], np.minimum(1.0, sim + 0.03), sim)
+    return sim
+
+
+def top_k_indices(row: np.ndarray, eligible: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k eligible entries by descending `rank_key`, ties by ascending index.
+
+    Uses `np.partition` to find the k-th key, then `np.lexsort` on the survivors.
+    """
+    candidates = np.flatnonzero(eligible)
+    if candidates.size == 0 or top_k <= 0:
+        return candidates[:0]
+    # np.rint rounds half to even like round() in rank_key.
+    values = np.rint(row[candidates] / SIMILARITY_TOLERANCE)
+    if candidates.size > top_k:
+        kth = np.partition(values, candidates.size - top_k)[candidates.size - top_k]
+        keep = values >= kth
+        candidates = candidates[keep]
+        values = values[keep]
+    order = np.lexsort((candidates, -values))
+    return candidates[order[:top_k]]
+
+
+def top_k_evidences(
+    sim: np.ndarray,
+    slides: Sequence[Dict[str, Any]],
+    slide_features: Sequence[SlideFeatures],
+    top_k: int,
+    min_sim: float,
+    eligible: Optional[np.ndarray] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Turn each similarity row into the evidence list `_decide_coverage` expects."""
+    if eligible is None:
+        eligible = np.ones(len(slides), dtype=bool)
+    out: List[List[Dict[str, Any]]] = []
+    for row in sim:
+        picks = top_k_indices(row, eligible & (row >= min_sim), top_k)
+        out.append(
+            [
+                {
+                    "slide_number": slides[idx]["slide_number"],
+                    "similarity": float(row[idx]),
+                    "summary": slides[idx]["short_summary"],
+                    "clean_text": slide_features[idx].evidence_text,
+                }
+                for idx in picks
+            ]
+        )
+    return out
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet
+
+TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9가-힣_]+")
+DIGIT_PATTERN = re.compile(r"\d")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+NGRAM_SIZE = 3
+EVIDENCE_TEXT_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class TextFeatures:
+    """Token/trigram sets of one text, computed once and reused by every similarity function."""
+
+    tokens: FrozenSet[str]
+    trigrams: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class SlideFeatures:
+    """Per-slide retrieval features built once after classification/summarization."""
+
+    tokens: FrozenSet[str]
+    trigrams: FrozenSet[str]
+    # Digits in "clean_text + short_summary" (retrieval numeric bonus).
+    digit_count: int
+    # Digits in clean_text only (slide card scoring/feedback).
+    clean_digit_count: int
+    clean_length: int
+    evidence_text: str
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    return frozenset(TOKEN_PATTERN.findall((text or "").lower()))
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> FrozenSet[str]:
+    compact = WHITESPACE_PATTERN.sub("", (text or "").lower())
+    if len(compact) < n:
+        return frozenset()
+    return frozenset(compact[i : i + n] for i in range(len(compact) - n + 1))
+
+
+def text_features(text: str) -> TextFeatures:
+    return TextFeatures(tokens=tokenize(text), trigrams=char_ngrams(text))
+
+
+def retrieval_text(slide: Dict[str, Any]) -> str:
+    return f"{slide.get('clean_text', '')} {slide.get('short_summary', '')}"
+
+
+def build_slide_features(slide: Dict[str, Any]) -> SlideFeatures:
+    clean_text = slide.get("clean_text", "") or ""
+    text = retrieval_text(slide)
+    return SlideFeatures(
+        tokens=tokenize(text),
+        trigrams=char_ngrams(text),
+        digit_count=len(DIGIT_PATTERN.findall(text)),
+        clean_digit_count=len(DIGIT_PATTERN.findall(clean_text)),
+        clean_length=len(clean_text),
+        evidence_text=clean_text[:EVIDENCE_TEXT_LIMIT],
+    )
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    union = len(a | b)
+    if union == 0:
+        return 0.0
+    return len(a & b) / union
+
+
+def keyword_overlap(item_tokens: FrozenSet[str], slide_tokens: FrozenSet[str]) -> float:
+    if not item_tokens or not slide_tokens:
+        return 0.0
+    overlap = len(item_tokens & slide_tokens)
+    denom = max(1, min(len(item_tokens), 10))
+    return max(0.0, min(1.0, overlap / denom))
@@ -0,0 +1,136 @@
+"""Compact in-memory slide record used throughout the RAG pipeline.
+
+`SlideRecord` replaces the per-slide dicts: fixed `__slots__` instead of a
+per-instance `__dict__`, and an embedding that is a float32 row view into one
+shared deck matrix instead of a list of Python floats. Slides are converted to
+plain dicts with `to_dict()` only where they leave the pipeline.
+
+Mapping-style access (`slide["category"]`, `slide.get(...)`, `update`) is kept
+so helpers that also accept plain dict slides keep working unchanged.
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from src.domain.ir.similarity import embedding_matrix
+
+
+class SlideRecord:
+    __slots__ = (
+        "slide_number",
+        "clean_text",
+        "short_summary",
+        "key_claims",
+        "category",
+        "category_confidence",
+        "text_deficiency_flag",
+        "embedding",
+        "features",
+    )
+
+    def __init__(
+        self,
+        slide_number: int,
+        clean_text: str = "",
+        short_summary: str = "",
+        key_claims: Optional[List[str]] = None,
+        category: str = "OTHER",
+        category_confidence: float = 0.5,
+        text_deficiency_flag: bool = False,
+        embedding: Sequence[float] = (),
+        features: Any = None,
+    ):
+        self.slide_number = slide_number
+        self.clean_text = clean_text
+        self.short_summary = short_summary
+        self.key_claims = key_claims if key_claims is not None else []
+        self.category = category
+        self.category_confidence = category_confidence
+        self.text_deficiency_flag = text_deficiency_flag
+        self.embedding = embedding
+        self.features = features
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SlideRecord":
+        return cls(**{k: data[k] for k in cls.__slots__ if k in data})
+
+    def to_dict(self, include_embedding: bool = False) -> Dict[str, Any]:
+        out = {
+            "slide_number": self.slide_number,
+            "clean_text": self.clean_text,
+            "short_summary": self.short_summary,
+            "key_claims": list(self.key_claims),
+            "category": self.category,
+            "category_confidence": self.category_confidence,
+            "text_deficiency_flag": self.text_deficiency_flag,
+        }
+        if include_embedding:
+            out["embedding"] = [float(v) for v in self.embedding]
+        return out
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> Sequence[str]:
+        return self.__slots__
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+    def __repr__(self) -> str:
+        return f"SlideRecord(slide_number={self.slide_number}, category={self.category!r})"
+
+
+SlideLike = Union[SlideRecord, Dict[str, Any]]
+
+
+def as_slide_records(slides: Sequence[SlideLike]) -> List[SlideRecord]:
+    """Records as-is; plain dict slides are wrapped (read-only use)."""
+    return [s if isinstance(s, SlideRecord) else SlideRecord.from_dict(s) for s in slides]
+
+
+def attach_embeddings(slides: Sequence[SlideLike], vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    """Stack `vectors` into one float32 deck matrix and point each slide at its row."""
+    matrix = embedding_matrix(vectors)
+    for idx, slide in enumerate(slides):
+        slide["embedding"] = matrix[idx]
+    return matrix
+
+
+def deck_embedding_matrix(slides: Sequence[SlideLike]) -> np.ndarray:
+    """The shared deck matrix when slides hold its row views, otherwise a freshly stacked one."""
+    vectors = [s.get("embedding", []) for s in slides]
+    base = getattr(vectors[0], "base", None) if vectors else None
+    if (
+        isinstance(base, np.ndarray)
+        and base.ndim == 2
+        and base.dtype == np.float32
+        and base.shape[0] == len(vectors)
+        and all(
+            isinstance(v, np.ndarray) and v.base is base and v.ctypes.data == base[idx].ctypes.data
+            for idx, v in enumerate(vectors)
+        )
+    ):
+        return base
+    # Loose vectors may be float64 lists; stack them losslessly for retrieval.
+    return embedding_matrix(vectors, dtype=np.float64)
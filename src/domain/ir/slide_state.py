@@ -0,0 +1,124 @@
+"""Per-slide state carried between analyses of successive deck versions.
+
+Each analysis can store, per slide, a fingerprint of its normalized text, the
+Gemini classification it received and its embedding. A later version of the
+same pitch loads that state and reuses the expensive results for slides whose
+fingerprint did not change.
+
+Layout: `<stem>_slide_state.json` (records) plus `<stem>_slide_state.npy`
+(float32 embedding rows referenced by `embedding_row`).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+STATE_VERSION = 1
+CLASSIFICATION_KEYS = ("category", "category_confidence", "short_summary", "key_claims")
+
+
+def slide_fingerprint(text: str) -> str:
+    normalized = " ".join((text or "").lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def embedding_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+def slide_embedding_text(slide: Dict[str, Any]) -> str:
+    return f"{slide['clean_text']}\n{slide['short_summary']}"
+
+
+class SlideState:
+    """Reusable slide results indexed by text fingerprint."""
+
+    def __init__(self, records: List[Dict[str, Any]], vectors: Optional[np.ndarray] = None):
+        self.vectors = vectors
+        self._by_fingerprint: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            self._by_fingerprint.setdefault(str(record.get("fingerprint", "")), record)
+
+    def __len__(self) -> int:
+        return len(self._by_fingerprint)
+
+    def classification(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        record = self._by_fingerprint.get(fingerprint)
+        if not record or not record.get("classification"):
+            return None
+        return dict(record["classification"])
+
+    def embedding(self, fingerprint: str, key: str) -> Optional[np.ndarray]:
+        record = self._by_fingerprint.get(fingerprint)
+        if not record or record.get("embedding_key") != key or self.vectors is None:
+            return None
+        row = int(record.get("embedding_row", -1))
+        if row < 0 or row >= len(self.vectors):
+            return None
+        return self.vectors[row]
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SlideState"]:
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if payload.get("version") != STATE_VERSION:
+            return None
+        vectors = None
+        npy_path = path.with_suffix(".npy")
+        if npy_path.exists():
+            try:
+                vectors = np.load(npy_path, mmap_mode="r")
+            except Exception:
+                vectors = None
+        return cls(payload.get("slides", []), vectors)
+
+
+def save_slide_state(
+    path: Path,
+    slides: List[Dict[str, Any]],
+    llm_classified: Iterable[int],
+    embedding_model: Optional[str],
+) -> None:
+    """Persist fingerprints, Gemini classifications and (model) embeddings of `slides`.
+
+    Rule-based classifications are not stored: they depend on slide position
+    and are cheap to recompute. Embeddings are stored only when they came from
+    a named embedding model.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    llm_numbers = set(int(n) for n in llm_classified)
+    records: List[Dict[str, Any]] = []
+    rows: List[np.ndarray] = []
+    for slide in slides:
+        record: Dict[str, Any] = {
+            "slide_number": int(slide["slide_number"]),
+            "fingerprint": slide_fingerprint(slide.get("clean_text", "")),
+            "classification": None,
+            "embedding_key": None,
+            "embedding_row": -1,
+        }
+        if int(slide["slide_number"]) in llm_numbers:
+            record["classification"] = {k: slide.get(k) for k in CLASSIFICATION_KEYS}
+        vec = np.asarray(slide.get("embedding", []), dtype=np.float32)
+        if embedding_model and vec.size and (not rows or vec.size == rows[0].size):
+            record["embedding_key"] = embedding_key(embedding_model, slide_embedding_text(slide))
+            record["embedding_row"] = len(rows)
+            rows.append(vec)
+        records.append(record)
+
+    npy_path = path.with_suffix(".npy")
+    if rows:
+        np.save(npy_path, np.stack(rows))
+    elif npy_path.exists():
+        npy_path.unlink()
+    payload = {"version": STATE_VERSION, "embedding_model": embedding_model, "slides": records}
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
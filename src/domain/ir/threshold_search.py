@@ -0,0 +1,79 @@
+"""Search strategies over the (sim_high, sim_mid, top_k) threshold space.
+
+`candidate_space` enumerates the grid (ranges like `0.60:0.80:0.01` make fine
+grids cheap to write down), `random_candidates` samples it, and
+`successive_halving` spends label evaluations where they matter: every
+candidate is scored on a small label subset, the best 1/eta survive to a
+subset eta times larger, and the last round uses every label. Candidates are
+always ranked with `score_for_ranking`.
+"""
+
+import math
+import random
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from src.domain.ir.tuning_metrics import score_for_ranking
+
+Candidate = Tuple[float, float, int]
+# evaluate(candidates, n_labels) -> one summary dict per candidate on the first n_labels labels
+Evaluator = Callable[[List[Candidate], int], List[Dict[str, Any]]]
+
+
+def parse_values(spec: str, cast: Callable[[str], Any] = float) -> List[Any]:
+    """`"0.65,0.68,0.72"` or inclusive ranges `"start:stop:step"`, mixable with commas."""
+    values: List[Any] = []
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        if ":" not in part:
+            values.append(cast(part))
+            continue
+        start_s, stop_s, step_s = (x.strip() for x in part.split(":"))
+        start, stop, step = float(start_s), float(stop_s), float(step_s)
+        if step <= 0:
+            raise ValueError(f"range step must be positive: {part}")
+        decimals = max(len(s.split(".")[1]) if "." in s else 0 for s in (start_s, stop_s, step_s))
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        values.extend(cast(f"{start + i * step:.{decimals}f}") for i in range(count))
+    return list(dict.fromkeys(values))
+
+
+def candidate_space(highs: Sequence[float], mids: Sequence[float], topks: Sequence[int]) -> List[Candidate]:
+    return [(high, mid, topk) for high in highs for mid in mids if mid < high for topk in topks]
+
+
+def random_candidates(space: Sequence[Candidate], n: int, seed: int = 0) -> List[Candidate]:
+    """`n` distinct candidates drawn from `space` (all of it when n >= len(space))."""
+    if n >= len(space):
+        return list(space)
+    return random.Random(seed).sample(list(space), n)
+
+
+def successive_halving(
+    candidates: Sequence[Candidate],
+    n_labels: int,
+    evaluate: Evaluator,
+    eta: int = 3,
+    min_labels: int = 1,
+) -> List[Dict[str, Any]]:
+    """Run successive halving; returns every evaluated row tagged with `round` and `labels`.
+
+    Rows of the last round are evaluated on all `n_labels` labels.
+    """
+    eta = max(2, int(eta))
+    survivors = list(candidates)
+    if not survivors or n_labels <= 0:
+        return []
+    rounds = max(0, math.ceil(math.log(len(survivors), eta) - 1e-9))
+    history: List[Dict[str, Any]] = []
+    for r in range(rounds + 1):
+        labels = n_labels if r == rounds else max(min(min_labels, n_labels), math.ceil(n_labels / eta ** (rounds - r)))
+        summaries = evaluate(survivors, labels)
+        rows = [{**summary, "round": r, "labels": labels} for summary in summaries]
+        history.extend(rows)
+        if r == rounds:
+            break
+        keep = max(1, math.ceil(len(survivors) / eta))
+        ranked = sorted(range(len(rows)), key=lambda i: score_for_ranking(rows[i]), reverse=True)[:keep]
+        survivors = [survivors[i] for i in sorted(ranked)]
+    return history
@@ -0,0 +1,239 @@
+"""Threshold sweep over cached retrieval results.
+
+Between tuning trials only `sim_high`/`sim_mid`/`sim_low`/`top_k` change, and
+none of them affect slide building, classification, embedding or similarity
+ranking. `prepare_sweep_deck` runs that part of `run_rag_ir_analysis` once per
+deck, keeping each rubric item's evidence ranking at the largest `top_k` of
+the grid (evidence lists for smaller `top_k` are prefixes of it).
+`sweep_criteria` then replays the fast-mode decisions of
+`_score_criteria_with_rag` (coverage plan + similarity review, item scores,
+group coverage, related slides and the score/evidence repair) for every grid
+point at once as array operations.
+
+The replay matches `run_rag_ir_analysis(settings=...)` with `fast_mode=True`,
+which is how the tuner runs trials; LLM review and feedback are not modeled.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.ir import rag_pipeline
+from src.domain.ir.settings import PipelineSettings
+
+NOT_COVERED, PARTIALLY_COVERED, COVERED = 0, 1, 2
+COVERAGE_NAMES = ("NOT_COVERED", "PARTIALLY_COVERED", "COVERED")
+
+
+@dataclass
+class SweepDeck:
+    pitch_type: str
+    slides: List[Dict[str, Any]]
+    group_ids: List[str]
+    group_max: np.ndarray  # (G,)
+    item_group: np.ndarray  # (I,) group row of each item
+    item_max: np.ndarray  # (I,)
+    fail_if_missing: np.ndarray  # (I,) bool
+    short_top: np.ndarray  # (I,) top evidence text shorter than 20 chars
+    evidence_slides: np.ndarray  # (I, K) slide numbers, -1 where absent
+    evidence_sims: np.ndarray  # (I, K) similarities, nan where absent
+    has_model: bool
+
+    def prediction(self, criteria: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Minimal final-JSON payload `evaluate_label` reads."""
+        return {"pitch_type": self.pitch_type, "criteria_scores": criteria, "slides": self.slides}
+
+
+def prepare_sweep_deck(
+    docai_result: Dict[str, Any],
+    max_top_k: int,
+    pitch_type: Optional[str] = None,
+    strategy: Optional[Dict[str, Any]] = None,
+    settings: Optional[PipelineSettings] = None,
+) -> SweepDeck:
+    """Run the threshold-independent front half of the RAG pipeline once."""
+    settings = settings or PipelineSettings.resolve(fast_mode=True, llm_slide_limit=0)
+    gemini = rag_pipeline.GeminiJSONClient()
+    slides = rag_pipeline._build_slides(docai_result)
+    pitch_type = rag_pipeline._resolve_pitch_type(strategy, pitch_type, slides)
+    rubric = rag_pipeline._load_rubric(pitch_type)
+    rag_pipeline._classify_and_summarize_slides(slides, gemini, settings)
+    rag_pipeline._attach_slide_features(slides)
+    lexical_index = rag_pipeline._build_lexical_index(slides, settings.lexical_scorer)
+    rag_pipeline._embed_deck(slides, rubric, rag_pipeline._init_embedding_client())
+
+    groups = rubric.get("groups", [])
+    item_refs = [(str(g.get("group_id", "")), item) for g in groups for item in g.get("items", [])]
+    k = max(1, min(10, int(max_top_k)))
+    evidences = rag_pipeline._retrieve_evidences(
+        item_refs,
+        slides,
+        k,
+        settings.retrieval_min_sim,
+        lexical_scorer=settings.lexical_scorer,
+        lexical_index=lexical_index,
+    )
+
+    n_items = len(item_refs)
+    ev_slides = np.full((n_items, k), -1, dtype=np.int64)
+    ev_sims = np.full((n_items, k), np.nan, dtype=np.float64)
+    short_top = np.zeros(n_items, dtype=bool)
+    for i, evs in enumerate(evidences):
+        for j, ev in enumerate(evs):
+            ev_slides[i, j] = int(ev["slide_number"])
+            ev_sims[i, j] = float(ev["similarity"])
+        if evs:
+            short_top[i] = len((evs[0].get("clean_text") or "").strip()) < 20
+
+    item_group = np.array([gi for gi, g in enumerate(groups) for _ in g.get("items", [])], dtype=np.intp)
+    return SweepDeck(
+        pitch_type=pitch_type,
+        slides=[{"slide_number": s.slide_number, "category": s.category} for s in slides],
+        group_ids=[g.get("group_id") for g in groups],
+        group_max=np.array([float(g.get("max_score", 0)) for g in groups], dtype=np.float64),
+        item_group=item_group,
+        item_max=np.array([float(item.get("max_score", 0)) for _, item in item_refs], dtype=np.float64),
+        fail_if_missing=np.array([bool(item.get("fail_if_missing", False)) for _, item in item_refs], dtype=bool),
+        short_top=short_top,
+        evidence_slides=ev_slides,
+        evidence_sims=ev_sims,
+        has_model=bool(gemini.model),
+    )
+
+
+def sweep_criteria(deck: SweepDeck, trials: Sequence[PipelineSettings]) -> List[List[Dict[str, Any]]]:
+    """Per trial, the criteria list (`criteria_id`, `coverage_status`, `related_slides`, `score`)."""
+    n_trials, n_groups = len(trials), len(deck.group_ids)
+    if not n_trials:
+        return []
+    high = np.array([t.sim_high for t in trials], dtype=np.float64)[:, None]
+    mid = np.array([t.sim_mid for t in trials], dtype=np.float64)[:, None]
+    low = np.array([t.sim_low for t in trials], dtype=np.float64)[:, None]
+    top_k = np.array([t.top_k for t in trials], dtype=np.intp)[:, None]
+
+    has_ev = deck.evidence_slides[:, 0] >= 0 if deck.evidence_slides.shape[1] else np.zeros(0, dtype=bool)
+    top = np.where(has_ev, np.nan_to_num(deck.evidence_sims[:, 0], nan=0.0), 0.0)[None, :]  # (1, I)
+
+    coverage = _fast_mode_coverage(
+        top,
+        has_ev[None, :],
+        deck.short_top[None, :],
+        deck.fail_if_missing[None, :],
+        high,
+        mid,
+        low,
+        deck.has_model,
+    )
+    item_scores = _item_scores(deck.item_max[None, :], coverage, top, high)  # (T, I)
+
+    # Group reductions accumulate item by item, in rubric order, exactly like
+    # the pipeline's running sums, so threshold comparisons agree bit for bit.
+    raw_group = np.zeros((n_trials, n_groups), dtype=np.float64)
+    covered_weight = np.zeros((n_trials, n_groups), dtype=np.float64)
+    denom = np.zeros(n_groups, dtype=np.float64)
+    n_group_items = np.zeros(n_groups, dtype=np.intp)
+    coverage_value = np.array([0.0, 0.5, 1.0])[coverage]
+    for i, g in enumerate(deck.item_group):
+        weight = max(0.0, float(deck.item_max[i]))
+        raw_group[:, g] += item_scores[:, i]
+        covered_weight[:, g] += coverage_value[:, i] * weight
+        denom[g] += weight
+        n_group_items[g] += 1
+    weighted = covered_weight / np.where(denom > 0, denom, 1.0)
+    group_cov = np.where(weighted >= 0.60, COVERED, np.where(weighted >= 0.25, PARTIALLY_COVERED, NOT_COVERED))
+    group_cov = np.where(n_group_items[None, :] > 0, group_cov, NOT_COVERED)
+
+    related = _related_slides(deck, coverage, has_ev, mid, top_k, raw_group)
+
+    score_100 = np.where(
+        deck.group_max[None, :] > 0,
+        np.rint(raw_group / np.where(deck.group_max > 0, deck.group_max, 1.0)[None, :] * 100),
+        0,
+    )
+    score_100 = np.clip(score_100, 0, 100).astype(np.int64)
+    has_related = np.array([[bool(related[t][g]) for g in range(n_groups)] for t in range(n_trials)], dtype=bool)
+    repaired = (score_100 > 0) & ~has_related
+    group_cov = np.where(repaired, NOT_COVERED, group_cov)
+    score_100 = np.where(repaired, 0, score_100)
+
+    return [
+        [
+            {
+                "criteria_id": deck.group_ids[g],
+                "coverage_status": COVERAGE_NAMES[int(group_cov[t, g])],
+                "related_slides": related[t][g],
+                "score": int(score_100[t, g]),
+            }
+            for g in range(n_groups)
+        ]
+        for t in range(n_trials)
+    ]
+
+
+def _fast_mode_coverage(top, has_ev, short_top, fail_if_missing, high, mid, low, has_model: bool) -> np.ndarray:
+    """`_plan_coverage` resolved with the fast-mode review (`_coverage_from_similarity`)."""
+    reviewed = np.where(top >= high, COVERED, np.where((top >= mid) | (top >= low), PARTIALLY_COVERED, NOT_COVERED))
+    softened = np.where(reviewed == NOT_COVERED, PARTIALLY_COVERED, reviewed)
+    offline_partial = (low <= top) & (top < mid) & (not has_model)
+    return np.select(
+        [
+            offline_partial,
+            top >= high,
+            (mid <= top) & (top < high),
+            (low <= top) & (top < mid) & has_ev,
+        ],
+        [
+            PARTIALLY_COVERED,
+            np.where(has_ev & short_top, reviewed, COVERED),
+            softened,
+            np.where(fail_if_missing, softened, PARTIALLY_COVERED),
+        ],
+        default=np.where(fail_if_missing, reviewed, NOT_COVERED),
+    ).astype(np.intp)
+
+
+def _item_scores(item_max: np.ndarray, coverage: np.ndarray, top: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """Vector form of `_score_item`."""
+    sim_high = np.clip(high, 0.01, 0.99)
+    partial = np.clip((top / sim_high) * 0.70, 0.35, 0.70)
+    covered = 0.65 + np.clip((top - sim_high) / (1.0 - sim_high), 0.0, 1.0) * 0.35
+    ratio = np.where(coverage == COVERED, covered, np.where(coverage == PARTIALLY_COVERED, partial, 0.0))
+    raw = item_max * ratio
+    # Python's round() (exact decimal value) rather than np.round (scale + rint):
+    # they disagree on ties like 5.775, which can move a group score by one point.
+    return np.array([round(float(v), 2) for v in raw.ravel()], dtype=np.float64).reshape(raw.shape)
+
+
+def _related_slides(
+    deck: SweepDeck,
+    coverage: np.ndarray,
+    has_ev: np.ndarray,
+    mid: np.ndarray,
+    top_k: np.ndarray,
+    raw_group: np.ndarray,
+) -> List[List[List[int]]]:
+    n_trials, n_groups = coverage.shape[0], len(deck.group_ids)
+    k = deck.evidence_slides.shape[1]
+    position = np.arange(k)[None, None, :]
+    sims = np.nan_to_num(deck.evidence_sims, nan=-np.inf)[None, :, :]
+    # Top evidence of every covered/partial item, plus later evidence (within this
+    # trial's top_k) at or above sim_mid - 0.1.
+    keep = (coverage != NOT_COVERED)[:, :, None] & has_ev[None, :, None]
+    keep = keep & ((position == 0) | ((position < top_k[:, :, None]) & (sims >= (mid - 0.1)[:, :, None])))
+
+    related: List[List[List[int]]] = []
+    for t in range(n_trials):
+        per_group: List[set] = [set() for _ in range(n_groups)]
+        items, positions = np.nonzero(keep[t])
+        for i, j in zip(items, positions):
+            per_group[deck.item_group[i]].add(int(deck.evidence_slides[i, j]))
+        row = []
+        for g in range(n_groups):
+            if raw_group[t, g] > 0 and not per_group[g]:
+                # Fallback: the top evidence of every item in the group.
+                members = np.flatnonzero((deck.item_group == g) & has_ev)
+                per_group[g] = {int(deck.evidence_slides[i, 0]) for i in members}
+            row.append(sorted(per_group[g]))
+        related.append(row)
+    return related
@@ -4,6 +4,13 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.common.artifact_catalog import (
+    artifact_miss_cached,
+    lookup_artifact,
+    register_artifact,
+    remember_artifact_miss,
+)
+
 
 def normalize_pitch_type(value: str) -> str:
     v = (value or "").strip().upper()
@@ -65,8 +72,15 @@ def find_result_for_label(results_root: Path, filename: str, aliases: Optional[L
         direct = results_root / stem / f"{stem}_final.json"
         if direct.exists():
             return direct
+        catalogued = lookup_artifact(stem, "final", [results_root])
+        if catalogued:
+            return catalogued
+        if artifact_miss_cached(stem, "final", [results_root]):
+            continue
         for p in results_root.glob(f"**/{stem}_final.json"):
+            register_artifact(p)
             return p
+        remember_artifact_miss(stem, "final", [results_root])
     return None
 
 
@@ -83,9 +97,16 @@ def find_docai_for_label(search_roots: List[Path], filename: str, aliases: Optio
         for c in candidates:
             if c.exists():
                 return c
+        catalogued = lookup_artifact(stem, "docai", search_roots)
+        if catalogued:
+            return catalogued
+        if artifact_miss_cached(stem, "docai", search_roots):
+            continue
         for root in search_roots:
             for p in root.glob(f"**/{stem}_docai.json"):
+                register_artifact(p)
                 return p
+        remember_artifact_miss(stem, "docai", search_roots)
     return None
 
 
@@ -1,9 +1,11 @@
-import json
 import os
 from pathlib import Path
 from typing import Any, Dict
 
+from src.common.artifact_catalog import register_artifact
 from src.infrastructure.document_ai.client import DocumentAIClient
+from src.infrastructure.document_ai.projection import keep_raw_enabled, raw_output_path, slim_enabled
+from src.utils.artifact_codec import read_artifact, write_artifact
 
 
 def run_notice_document_ai(notice_pdf: Path, output_dir: Path) -> Dict[str, Any]:
@@ -22,17 +24,16 @@ def run_notice_document_ai(notice_pdf: Path, output_dir: Path) -> Dict[str, Any]
         location=location,
         ocr_processor_id=processor_id,
     )
-    doc_dict = client.process_ocr_pdf(notice_pdf)
+    raw_path = Path(raw_output_path(str(output_path))) if slim_enabled() and keep_raw_enabled() else None
+    doc_dict = client.process_ocr_pdf(notice_pdf, raw_output_path=raw_path)
     _write_json(output_path, doc_dict)
     return doc_dict
 
 
 def _read_json(path: Path) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_artifact(path)
 
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    write_artifact(path, payload)
+    register_artifact(path)
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -6,6 +5,7 @@ from src.domain.notice.document_ai import run_notice_document_ai
 from src.domain.notice.parser import analyze_notice
 from src.infrastructure.gemini.client import GeminiJSONClient
 from src.common.utils import save_strategy, strategy_output_path
+from src.utils.artifact_codec import write_artifact
 
 
 DEFAULT_STRATEGY = {
@@ -179,9 +179,7 @@ def _extract_anchor_text(anchor: Dict[str, Any], full_text: str) -> str:
         parts.append(full_text[start:end])
     return " ".join(parts).strip()
 def _write_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    write_artifact(path, payload)
 
 
 def _strip_internal_fields(payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,4 +1,5 @@
 from src.infrastructure.document_ai.client import DocumentAIClient
 from src.infrastructure.document_ai.pipeline import run_document_ai_pipeline
+from src.infrastructure.document_ai.service import OCRService, get_ocr_service, warm_ocr_service
 
-__all__ = ["DocumentAIClient", "run_document_ai_pipeline"]
+__all__ = ["DocumentAIClient", "OCRService", "get_ocr_service", "run_document_ai_pipeline", "warm_ocr_service"]
@@ -1,9 +1,13 @@
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from google.cloud import documentai_v1beta3 as documentai
 
+from src.infrastructure.document_ai.projection import ocr_process_options, slim_document, slim_enabled
+from src.infrastructure.document_ai.service import get_ocr_service
+from src.utils.artifact_codec import write_artifact
+
 
 class DocumentAIClient:
     def __init__(
@@ -15,29 +19,30 @@ class DocumentAIClient:
         self.project_id = project_id
         self.location = location
         self.ocr_processor_id = ocr_processor_id
-        self.client = documentai.DocumentProcessorServiceClient()
+        self.service = get_ocr_service()
+
+    def process_ocr_pdf(self, pdf_path: Path, raw_output_path: Optional[Path] = None) -> Dict[str, Any]:
+        """OCR a PDF; returns the slim projection unless `DOCAI_SLIM=0`.
 
-    def process_ocr_pdf(self, pdf_path: Path) -> Dict[str, Any]:
-        name = self.client.processor_path(self.project_id, self.location, self.ocr_processor_id)
+        The full document is written to `raw_output_path` when one is given;
+        only then (or with `DOCAI_SLIM=0`) are symbols, style info and image
+        quality scores requested.
+        """
+        name = self.service.processor_path(self.project_id, self.location, self.ocr_processor_id)
         raw_document = documentai.RawDocument(
             content=self._read_bytes(pdf_path),
             mime_type="application/pdf",
         )
-        process_options = documentai.ProcessOptions(
-            ocr_config=documentai.OcrConfig(
-                compute_style_info=True,
-                enable_native_pdf_parsing=True,
-                enable_image_quality_scores=True,
-                enable_symbol=True,
-            )
-        )
         request = documentai.ProcessRequest(
             name=name,
             raw_document=raw_document,
-            process_options=process_options,
+            process_options=ocr_process_options(full=raw_output_path is not None or not slim_enabled()),
         )
-        result = self.client.process_document(request=request)
-        return json.loads(documentai.Document.to_json(result.document))
+        result = self.service.process_document(request)
+        doc = json.loads(documentai.Document.to_json(result.document))
+        if raw_output_path is not None:
+            write_artifact(raw_output_path, doc)
+        return slim_document(doc) if slim_enabled() else doc
 
     @staticmethod
     def _read_bytes(path: Path) -> bytes:
@@ -0,0 +1,166 @@
+"""Native-text fast path: read the PDF text layer locally, OCR only what lacks one.
+
+Decks exported from PowerPoint/Keynote carry a text layer, so most pages do
+not need cloud OCR. `extract_native_text` turns PyPDF2's text into a
+Document AI-shaped dict (`text`, `pages[].blocks[].layout.textAnchor`, page
+dimensions) with one block per text line, and records per-page character
+coverage under `native_text`. `merge_ocr_pages` splices Document AI pages
+(OCR'd from a sub-PDF of just the low-text pages) back in, re-anchored onto
+the combined text, so downstream code cannot tell the sources apart.
+
+Opt-in with `DOCAI_NATIVE_TEXT=1`; `DOCAI_NATIVE_MIN_CHARS` (default 20, the
+same bound `_build_slides` uses for `text_deficiency_flag`) is the minimum
+native characters for a page to skip OCR.
+"""
+
+import os
+from typing import Any, Dict, List, Sequence
+
+from PyPDF2 import PdfReader, PdfWriter
+
+DEFAULT_MIN_CHARS = 20
+
+
+def native_text_enabled() -> bool:
+    return os.getenv("DOCAI_NATIVE_TEXT", "0") == "1"
+
+
+def native_min_chars() -> int:
+    try:
+        return max(0, int(os.getenv("DOCAI_NATIVE_MIN_CHARS", str(DEFAULT_MIN_CHARS))))
+    except ValueError:
+        return DEFAULT_MIN_CHARS
+
+
+def _anchor(start: int, end: int) -> Dict[str, Any]:
+    return {"textAnchor": {"textSegments": [{"startIndex": str(start), "endIndex": str(end)}]}}
+
+
+def extract_native_text(pdf_path: str, min_chars: int = DEFAULT_MIN_CHARS) -> Dict[str, Any]:
+    reader = PdfReader(pdf_path)
+    parts: List[str] = []
+    offset = 0
+    pages: List[Dict[str, Any]] = []
+    coverage: List[Dict[str, Any]] = []
+    for page_number, pdf_page in enumerate(reader.pages, 1):
+        try:
+            raw = pdf_page.extract_text() or ""
+        except Exception:
+            raw = ""
+        page_start = offset
+        chars = 0
+        blocks = []
+        for line in (line.strip() for line in raw.splitlines()):
+            if not line:
+                continue
+            blocks.append({"layout": _anchor(offset, offset + len(line))})
+            parts.append(line + "\n")
+            offset += len(line) + 1
+            chars += len(line)
+        box = pdf_page.mediabox
+        pages.append(
+            {
+                "pageNumber": page_number,
+                "dimension": {"width": float(box.width), "height": float(box.height), "unit": "points"},
+                "layout": _anchor(page_start, offset),
+                "blocks": blocks,
+            }
+        )
+        coverage.append({"page": page_number, "chars": chars, "source": "native" if chars >= min_chars else "ocr"})
+    return {
+        "text": "".join(parts),
+        "pages": pages,
+        "native_text": {
+            "engine": "PyPDF2",
+            "min_chars": min_chars,
+            "pages": coverage,
+            "ocr_pages": [c["page"] for c in coverage if c["source"] == "ocr"],
+        },
+    }
+
+
+def write_page_subset(pdf_path: str, page_numbers: Sequence[int], output_path: str) -> str:
+    """Copy the given 1-based pages into a new PDF (for OCR of low-text pages only)."""
+    reader = PdfReader(pdf_path)
+    writer = PdfWriter()
+    for number in page_numbers:
+        writer.add_page(reader.pages[number - 1])
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return output_path
+
+
+def merge_ocr_pages(native: Dict[str, Any], ocr: Dict[str, Any], page_numbers: Sequence[int]) -> Dict[str, Any]:
+    """Replace `page_numbers` of `native` by the OCR pages, in order, re-anchoring their text."""
+    ocr_text = ocr.get("text", "")
+    replacements = dict(zip(page_numbers, ocr.get("pages", [])))
+    parts: List[str] = []
+    offset = 0
+    pages: List[Dict[str, Any]] = []
+    native_text = native.get("text", "")
+    for page in native.get("pages", []):
+        number = page.get("pageNumber")
+        source_page, source_text = (replacements[number], ocr_text) if number in replacements else (page, native_text)
+        span = _page_span(source_page)
+        if span is None:
+            start = end = 0
+        else:
+            start, end = span
+        parts.append(source_text[start:end])
+        shifted = _shift_anchors(source_page, offset - start)
+        shifted["pageNumber"] = number
+        pages.append(shifted)
+        offset += end - start
+
+    merged = {k: v for k, v in native.items() if k not in ("text", "pages")}
+    merged["text"] = "".join(parts)
+    merged["pages"] = pages
+    if "native_text" in merged:
+        coverage = dict(merged["native_text"])
+        done = coverage.get("ocr_pages_processed", []) + [n for n in page_numbers if n in replacements]
+        coverage["ocr_pages_processed"] = sorted(done)
+        merged["native_text"] = coverage
+    return merged
+
+
+def _segments(node: Any):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "textAnchor" and isinstance(value, dict):
+                yield from value.get("textSegments", [])
+            else:
+                yield from _segments(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _segments(item)
+
+
+def _page_span(page: Dict[str, Any]):
+    bounds = [(int(s.get("startIndex", 0)), int(s.get("endIndex", 0))) for s in _segments(page)]
+    if not bounds:
+        return None
+    return min(b[0] for b in bounds), max(b[1] for b in bounds)
+
+
+def _shift_anchors(node: Any, delta: int) -> Any:
+    if isinstance(node, dict):
+        out = {}
+        for key, value in node.items():
+            if key == "textAnchor" and isinstance(value, dict):
+                anchor = dict(value)
+                anchor["textSegments"] = [
+                    {
+                        **segment,
+                        "startIndex": str(int(segment.get("startIndex", 0)) + delta),
+                        "endIndex": str(int(segment.get("endIndex", 0)) + delta),
+                    }
+                    for segment in value.get("textSegments", [])
+                ]
+                out[key] = anchor
+            else:
+                out[key] = _shift_anchors(value, delta)
+        return out
+    if isinstance(node, list):
+        return [_shift_anchors(item, delta) for item in node]
+    return node
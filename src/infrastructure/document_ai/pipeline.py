@@ -1,13 +1,31 @@
 from pathlib import Path
-from typing import Dict
+from tempfile import TemporaryDirectory
+from typing import Dict, Optional
 import logging
+import os
 
-from src.utils.io_utils import read_json
+from src.common.concurrency import bounded_map
+from src.utils.io_utils import read_json, save_json
+from src.infrastructure.document_ai.native_text import (
+    extract_native_text,
+    merge_ocr_pages,
+    native_min_chars,
+    native_text_enabled,
+    write_page_subset,
+)
 from src.infrastructure.document_ai.processor import (
+    OCR_PAGE_LIMIT,
+    choose_pages_per_chunk,
+    chunk_concurrency,
+    detect_sections,
+    extract_numbers,
+    generate_metadata,
     merge_chunk_results,
+    ocr_with_retry,
     process_document,
     process_pdf_ocr_in_chunks,
 )
+from src.infrastructure.document_ai.service import get_ocr_service
 
 
 logger = logging.getLogger("POKI")
@@ -35,7 +53,7 @@ def run_document_ai_pipeline(
     pdf_path: Path,
     output_dir: Path,
     use_chunking: bool = False,
-    pages_per_chunk: int = 15,
+    pages_per_chunk: Optional[int] = None,
 ) -> Dict:
     print(f"\n📄 [OCR] {pdf_path.name}")
     output_path = output_dir / f"{pdf_path.stem}_docai.json"
@@ -45,11 +63,71 @@ def run_document_ai_pipeline(
         return read_json(str(output_path))
 
     # Proactive switch: if page count exceeds non-chunking practical limit, force chunking first.
+    # pages_per_chunk=None lets the chunker size chunks from page count and file size.
     page_count = _get_pdf_page_count(pdf_path)
-    if page_count is not None and page_count > pages_per_chunk and not use_chunking:
-        print(f"   ⚙️ 페이지 수 {page_count}p 감지 -> chunking 자동 전환 ({pages_per_chunk}p 단위)")
+    if page_count is not None and page_count > (pages_per_chunk or OCR_PAGE_LIMIT) and not use_chunking:
+        unit = f"{pages_per_chunk}p 단위" if pages_per_chunk else "청크 크기 자동"
+        print(f"   ⚙️ 페이지 수 {page_count}p 감지 -> chunking 자동 전환 ({unit})")
         use_chunking = True
 
+    service_before = get_ocr_service().stats()
+    try:
+        if native_text_enabled():
+            try:
+                return _native_text_with_ocr(pdf_path, output_dir, output_path)
+            except Exception as e:
+                logger.warning(f"⚠️ 텍스트 레이어 추출 실패, 전체 OCR로 진행: {e}")
+        return _ocr_with_fallback(pdf_path, output_dir, output_path, use_chunking, pages_per_chunk)
+    finally:
+        _log_client_reuse(service_before, get_ocr_service().stats())
+
+
+def _log_client_reuse(before: Dict, after: Dict) -> None:
+    requests = after["requests"] - before["requests"]
+    if requests <= 0:
+        return
+    created = after["clients_created"] - before["clients_created"]
+    saved = after["setup_sec_saved"] - before["setup_sec_saved"]
+    print(f"   🔌 OCR 요청 {requests}건 / 신규 클라이언트 {created}개 (연결 설정 절약 약 {saved:.2f}s)")
+
+
+def _native_text_with_ocr(pdf_path: Path, output_dir: Path, output_path: Path) -> Dict:
+    """Use the PDF text layer; send only pages below DOCAI_NATIVE_MIN_CHARS to Document AI."""
+    doc = extract_native_text(str(pdf_path), native_min_chars())
+    ocr_pages = doc["native_text"]["ocr_pages"]
+    total = len(doc["pages"])
+    print(f"   📝 텍스트 레이어 사용 {total - len(ocr_pages)}/{total}p, OCR 대상 {len(ocr_pages)}p")
+
+    if ocr_pages:
+        workers = chunk_concurrency()
+        size = choose_pages_per_chunk(len(ocr_pages), os.path.getsize(pdf_path) * len(ocr_pages) // max(1, total), workers)
+        groups = [ocr_pages[i : i + size] for i in range(0, len(ocr_pages), size)]
+
+        # Page-subset PDFs and their OCR JSONs are intermediates; only the merged _docai.json is kept.
+        with TemporaryDirectory(prefix=f"{pdf_path.stem}_lowtext_") as tmp:
+            work_dir = Path(tmp)
+
+            def _ocr_group(item) -> Dict:
+                idx, pages = item
+                subset = write_page_subset(str(pdf_path), pages, str(work_dir / f"{pdf_path.stem}_lowtext_{idx}.pdf"))
+                return ocr_with_retry(subset, str(work_dir / f"{pdf_path.stem}_lowtext_{idx}_ocr.json"), f"OCR 페이지 묶음 {idx}")
+
+            ocr_results = bounded_map(_ocr_group, list(enumerate(groups, 1)), workers)
+        for pages, ocr in zip(groups, ocr_results):
+            doc = merge_ocr_pages(doc, ocr, pages)
+
+    doc = generate_metadata(extract_numbers(detect_sections(doc)))
+    save_json(doc, str(output_path))
+    return doc
+
+
+def _ocr_with_fallback(
+    pdf_path: Path,
+    output_dir: Path,
+    output_path: Path,
+    use_chunking: bool,
+    pages_per_chunk: Optional[int],
+) -> Dict:
     try:
         if use_chunking:
             print("   ⚙️ 대용량 분할 처리 중...")
@@ -3,11 +3,23 @@ Document AI API 호출 + 강화 기능
 """
 
 import json
+import math
 import re
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 from google.cloud import documentai_v1beta3 as documentai
+from PyPDF2 import PdfReader
 
+from src.common.concurrency import bounded_map
+from src.common.keyword_matcher import KeywordMatcher
+from src.infrastructure.document_ai.service import get_ocr_service
+from src.infrastructure.document_ai.projection import (
+    keep_raw_enabled,
+    ocr_process_options,
+    raw_output_path,
+    slim_document,
+    slim_enabled,
+)
 from src.utils.io_utils import save_json, read_bytes
 from src.utils.pdf_split import split_pdf
 
@@ -19,6 +31,12 @@ PROCESSORS = {
     "FORM": os.getenv("FORM_PROCESSOR_ID", "662d7f1f1e179648"),
 }
 
+# 온라인(동기) OCR 요청 한도
+OCR_PAGE_LIMIT = 15
+OCR_REQUEST_BYTES = 20 * 1024 * 1024
+MIN_CHUNK_PAGES = 5
+DEFAULT_CHUNK_CONCURRENCY = 4
+
 
 # 섹션 감지 패턴
 SECTION_KEYWORDS = {
@@ -35,6 +53,9 @@ SECTION_KEYWORDS = {
     "growth": ["growth", "성장", "확장", "계획", "roadmap", "milestone"],
 }
 
+_SECTION_MATCHER = KeywordMatcher(
+    {section: [keyword.lower() for keyword in keywords] for section, keywords in SECTION_KEYWORDS.items()}
+)
 
 # 숫자 추출 패턴
 NUMBER_PATTERNS = {
@@ -64,8 +85,8 @@ def process_document(
     
     processor_id = PROCESSORS[processor_type]
     
-    client = documentai.DocumentProcessorServiceClient()
-    name = client.processor_path(PROJECT_ID, LOCATION, processor_id)
+    service = get_ocr_service()
+    name = service.processor_path(PROJECT_ID, LOCATION, processor_id)
     
     print(f"📄 [{processor_type}] {file_path} 분석 시작...")
     
@@ -77,20 +98,12 @@ def process_document(
         mime_type="application/pdf",
     )
     
-    # OCR 옵션 강화
+    # OCR 옵션 강화 (symbol/style/품질 점수는 전체 Document를 저장할 때만 요청)
     if processor_type == "OCR":
-        process_options = documentai.ProcessOptions(
-            ocr_config=documentai.OcrConfig(
-                compute_style_info=True,
-                enable_native_pdf_parsing=True,
-                enable_image_quality_scores=True,
-                enable_symbol=True,
-            )
-        )
         request = documentai.ProcessRequest(
             name=name,
             raw_document=raw_document,
-            process_options=process_options
+            process_options=ocr_process_options()
         )
     else:
         request = documentai.ProcessRequest(
@@ -98,7 +111,7 @@ def process_document(
             raw_document=raw_document
         )
     
-    result = client.process_document(request=request)
+    result = service.process_document(request)
     doc = result.document
     
     # Document AI Document → dict
@@ -114,6 +127,12 @@ def process_document(
         print(f"✅ 강화 완료: {len(doc_dict.get('detected_sections', []))}개 섹션, "
               f"{sum(len(v) for v in doc_dict.get('extracted_numbers', {}).values())}개 숫자 추출")
     
+    # 파이프라인이 읽지 않는 token/symbol/style/이미지 페이로드 제거
+    if slim_enabled():
+        if keep_raw_enabled():
+            save_json(doc_dict, raw_output_path(output_path))
+        doc_dict = slim_document(doc_dict)
+
     # 기존 유틸 사용
     save_json(doc_dict, output_path)
     print(f"✅ [{processor_type}] 결과 저장 완료 → {output_path}\n")
@@ -121,47 +140,98 @@ def process_document(
     return doc_dict
 
 
+def chunk_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("DOCAI_CHUNK_CONCURRENCY", str(DEFAULT_CHUNK_CONCURRENCY))))
+    except ValueError:
+        return DEFAULT_CHUNK_CONCURRENCY
+
+
+def choose_pages_per_chunk(page_count: int, file_size: int, concurrency: int) -> int:
+    """청크 크기 자동 결정
+
+    요청 한도(페이지 수, 요청 크기)를 지키는 최소 청크 수에서 시작해, 병렬 슬롯이
+    남으면 청크당 MIN_CHUNK_PAGES 이상을 유지하는 선에서 청크를 더 잘게 나눈다.
+    반환값은 청크당 최대 페이지 수이며, 실제 배분은 split_pdf(balanced=True)가
+    고르게 맞춘다 (31페이지 -> 11/10/10).
+    """
+    if page_count <= 0:
+        return OCR_PAGE_LIMIT
+    needed = max(
+        math.ceil(page_count / OCR_PAGE_LIMIT),
+        math.ceil(file_size / (OCR_REQUEST_BYTES * 0.9)),  # PDF 분할 오버헤드 여유
+    )
+    n_chunks = max(needed, min(concurrency, page_count // MIN_CHUNK_PAGES))
+    return max(1, math.ceil(page_count / min(n_chunks, page_count)))
+
+
+def ocr_with_retry(
+    file_path: str,
+    output_path: str,
+    label: str,
+    enable_enhancement: bool = True,
+) -> Dict:
+    """OCR 한 청크(페이지 묶음)를 처리하고, 실패하면 한 번 재시도 (재시도 실패는 예외 전파)"""
+    try:
+        return process_document(
+            file_path=file_path,
+            processor_type="OCR",
+            output_path=output_path,
+            enable_enhancement=enable_enhancement
+        )
+    except Exception as e:
+        print(f"⚠️ {label} 실패, 재시도합니다: {e}")
+        return process_document(
+            file_path=file_path,
+            processor_type="OCR",
+            output_path=output_path,
+            enable_enhancement=enable_enhancement
+        )
+
+
 def process_pdf_ocr_in_chunks(
     file_path: str,
     output_dir: str,
-    pages_per_chunk: int = 15,
-    enable_enhancement: bool = True
+    pages_per_chunk: Optional[int] = None,
+    enable_enhancement: bool = True,
+    max_workers: Optional[int] = None,
 ) -> List[Dict]:
-    """대용량 PDF를 청크로 나누어 OCR 처리"""
+    """대용량 PDF를 청크로 나누어 OCR 처리
+
+    청크는 최대 `max_workers`(기본 DOCAI_CHUNK_CONCURRENCY)개까지 동시에 처리하고,
+    결과는 청크 순서대로 반환한다. 실패한 청크는 한 번 재시도하며, 재시도도
+    실패하면 예외를 올려 문서 전체를 실패로 처리한다.
+    """
     
     os.makedirs(output_dir, exist_ok=True)
+    workers = max_workers or chunk_concurrency()
+    if not pages_per_chunk:
+        page_count = len(PdfReader(file_path).pages)
+        pages_per_chunk = choose_pages_per_chunk(page_count, os.path.getsize(file_path), workers)
     
     print(f"\n📄 대용량 PDF 청크 처리: {file_path}")
-    print(f"  - 청크 크기: {pages_per_chunk}페이지")
+    print(f"  - 청크 크기: {pages_per_chunk}페이지 (동시 {workers}개)")
     print(f"  - 출력 디렉토리: {output_dir}")
     
-    # 기존 pdf_split 사용
-    chunk_files = split_pdf(file_path, output_dir, pages_per_chunk)
+    # 기존 pdf_split 사용; 마지막 청크만 짧아지지 않도록 페이지를 고르게 배분
+    chunk_files = split_pdf(file_path, output_dir, pages_per_chunk, balanced=True)
     
     print(f"  ✅ {len(chunk_files)}개 청크로 분할 완료\n")
-    
-    results = []
-    
-    for idx, chunk_path in enumerate(chunk_files, 1):
-        print(f"📄 청크 {idx}/{len(chunk_files)} 처리 중...")
-        
+
+    def _process_chunk(item) -> Dict:
+        idx, chunk_path = item
         chunk_name = os.path.splitext(os.path.basename(chunk_path))[0]
         output_path = os.path.join(output_dir, f"{chunk_name}_ocr.json")
-        
-        result = process_document(
-            file_path=chunk_path,
-            processor_type="OCR",
-            output_path=output_path,
-            enable_enhancement=enable_enhancement
-        )
-        
+        print(f"📄 청크 {idx}/{len(chunk_files)} 처리 중...")
+        result = ocr_with_retry(chunk_path, output_path, f"청크 {idx}", enable_enhancement)
         result["chunk_info"] = {
             "chunk_index": idx,
             "total_chunks": len(chunk_files),
             "chunk_file": chunk_path,
         }
-        
-        results.append(result)
+        return result
+
+    results = bounded_map(_process_chunk, list(enumerate(chunk_files, 1)), workers)
     
     print(f"\n✅ 전체 {len(results)}개 청크 처리 완료\n")
     
@@ -183,11 +253,8 @@ def detect_sections(doc_dict: Dict) -> Dict:
         first_block = blocks[0]
         block_text = _extract_block_text(first_block, full_text).lower()
         
-        section_type = "unknown"
-        for section, keywords in SECTION_KEYWORDS.items():
-            if any(keyword.lower() in block_text for keyword in keywords):
-                section_type = section
-                break
+        hits = _SECTION_MATCHER.counts(block_text)
+        section_type = next((section for section in SECTION_KEYWORDS if hits[section]), "unknown")
         
         detected_sections.append({
             "page": page_idx + 1,
@@ -0,0 +1,104 @@
+"""Slim projection of Document AI results.
+
+OCR runs with `enable_symbol`, style info and image quality scores, so the raw
+`Document` carries tokens, symbols, lines, paragraphs, style runs and a base64
+page image on every page. The pipeline only reads the document text, page
+numbers/dimensions, block and table-cell text anchors (plus the enhancement
+keys added in `processor`), so that is all `slim_document` keeps.
+
+`DOCAI_SLIM=0` persists the full document as before; `DOCAI_KEEP_RAW=1` keeps
+slim artifacts for the pipeline and also writes the full document next to
+them as `<name>_raw.json`. Unless one of those asks for the full document,
+`ocr_process_options` does not request symbols, style info or image quality
+scores at all, so they are neither transferred nor parsed.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from google.cloud import documentai_v1beta3 as documentai
+
+DOC_KEYS = ("text", "mimeType", "uri", "detected_sections", "extracted_numbers", "metadata", "chunk_info")
+PAGE_KEYS = ("pageNumber", "dimension", "detected_section", "original_page_number")
+LAYOUT_KEYS = ("textAnchor", "boundingPoly", "confidence")
+
+
+def slim_enabled() -> bool:
+    return os.getenv("DOCAI_SLIM", "1") != "0"
+
+
+def keep_raw_enabled() -> bool:
+    return os.getenv("DOCAI_KEEP_RAW", "0") == "1"
+
+
+def full_document_enabled() -> bool:
+    """The unprojected document gets persisted (`DOCAI_SLIM=0` or `DOCAI_KEEP_RAW=1`)."""
+    return not slim_enabled() or keep_raw_enabled()
+
+
+def ocr_process_options(full: Optional[bool] = None) -> documentai.ProcessOptions:
+    """OCR options; the symbol/style/quality extras only when the full document is kept."""
+    full = full_document_enabled() if full is None else full
+    return documentai.ProcessOptions(
+        ocr_config=documentai.OcrConfig(
+            compute_style_info=full,
+            enable_native_pdf_parsing=True,
+            enable_image_quality_scores=full,
+            enable_symbol=full,
+        )
+    )
+
+
+def raw_output_path(output_path: str) -> str:
+    """`deck_docai.json` -> `deck_docai_raw.json` (not picked up as a `_docai.json` artifact)."""
+    path = Path(output_path)
+    return str(path.with_name(f"{path.stem}_raw{path.suffix}"))
+
+
+def slim_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    out = {key: doc[key] for key in DOC_KEYS if key in doc}
+    out["pages"] = [_slim_page(page) for page in doc.get("pages", [])]
+    return out
+
+
+def _slim_page(page: Dict[str, Any]) -> Dict[str, Any]:
+    out = {key: page[key] for key in PAGE_KEYS if key in page}
+    if "layout" in page:
+        out["layout"] = _slim_layout(page["layout"])
+    out["blocks"] = [{"layout": _slim_layout(block.get("layout", {}))} for block in page.get("blocks", [])]
+    if page.get("tables"):
+        out["tables"] = [_slim_table(table) for table in page["tables"]]
+    if "image" in page:
+        image = page["image"] or {}
+        # Drop the base64 page render but keep the same keys: the legacy
+        # scorer's image_count is len(page["image"]).
+        out["image"] = {key: value for key, value in image.items() if key != "content"}
+        if "content" in image:
+            out["image"]["contentSize"] = len(image["content"] or "")
+    return out
+
+
+def _slim_layout(layout: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: layout[key] for key in LAYOUT_KEYS if key in layout}
+
+
+def _slim_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    if "layout" in table:
+        out["layout"] = _slim_layout(table["layout"])
+    for key in ("headerRows", "bodyRows"):
+        if key in table:
+            out[key] = [_slim_row(row) for row in table[key]]
+    return out
+
+
+def _slim_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    cells: List[Dict[str, Any]] = []
+    for cell in row.get("cells", []):
+        slim = {"layout": _slim_layout(cell.get("layout", {}))}
+        for key in ("rowSpan", "colSpan"):
+            if key in cell:
+                slim[key] = cell[key]
+        cells.append(slim)
+    return {"cells": cells}
@@ -0,0 +1,116 @@
+"""Process-wide Document AI OCR service.
+
+Building a `DocumentProcessorServiceClient` re-runs credential discovery and
+opens a new gRPC channel, which used to happen for every document, every
+chunk and every notice. `get_ocr_service()` returns one long-lived service per
+process that owns a small pool of clients (`DOCAI_CLIENT_POOL_SIZE`, default
+1; gRPC channels multiplex concurrent requests, so more are only worth it
+under heavy chunk concurrency). Both `processor.process_document` and
+`DocumentAIClient` send their requests through it, and the API warms it at
+startup.
+
+`stats()` reports how many clients were built, what that cost, and an
+estimate of the setup time saved by reusing them.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from google.cloud import documentai_v1beta3 as documentai
+
+DEFAULT_POOL_SIZE = 1
+
+
+class OCRService:
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, client_factory: Optional[Callable[[], Any]] = None):
+        self.pool_size = max(1, int(pool_size))
+        self._factory = client_factory or documentai.DocumentProcessorServiceClient
+        self._clients: List[Any] = []
+        self._next = 0
+        self._lock = threading.Lock()
+        self._setup_sec = 0.0
+        self._requests = 0
+        self._request_sec = 0.0
+
+    def client(self) -> Any:
+        """Next pooled client (round-robin), created on first use of each slot."""
+        with self._lock:
+            if len(self._clients) < self.pool_size:
+                started = time.perf_counter()
+                self._clients.append(self._factory())
+                self._setup_sec += time.perf_counter() - started
+                return self._clients[-1]
+            client = self._clients[self._next % len(self._clients)]
+            self._next += 1
+            return client
+
+    @staticmethod
+    def processor_path(project_id: str, location: str, processor_id: str) -> str:
+        return documentai.DocumentProcessorServiceClient.processor_path(project_id, location, processor_id)
+
+    def process_document(self, request: Any) -> Any:
+        client = self.client()
+        started = time.perf_counter()
+        try:
+            return client.process_document(request=request)
+        finally:
+            with self._lock:
+                self._requests += 1
+                self._request_sec += time.perf_counter() - started
+
+    def warm(self) -> None:
+        """Create every pooled client up front (credential discovery + channel setup)."""
+        while True:
+            with self._lock:
+                if len(self._clients) >= self.pool_size:
+                    return
+            self.client()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            created = len(self._clients)
+            per_client = self._setup_sec / created if created else 0.0
+            reused = max(0, self._requests - created)
+            return {
+                "pool_size": self.pool_size,
+                "clients_created": created,
+                "client_setup_sec": round(self._setup_sec, 4),
+                "requests": self._requests,
+                "request_sec": round(self._request_sec, 4),
+                "setup_sec_saved": round(per_client * reused, 4),
+            }
+
+
+_SERVICE: Optional[OCRService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_ocr_service() -> OCRService:
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            try:
+                pool_size = int(os.getenv("DOCAI_CLIENT_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+            except ValueError:
+                pool_size = DEFAULT_POOL_SIZE
+            _SERVICE = OCRService(pool_size=pool_size)
+        return _SERVICE
+
+
+def warm_ocr_service(background: bool = True) -> None:
+    """Build the pooled clients ahead of the first request; failures only log."""
+
+    def _warm() -> None:
+        try:
+            started = time.perf_counter()
+            get_ocr_service().warm()
+            print(f"🔌 Document AI 클라이언트 준비 완료 ({time.perf_counter() - started:.2f}s)")
+        except Exception as e:
+            print(f"⚠️ Document AI 클라이언트 사전 준비 실패 (첫 요청 시 재시도): {e}")
+
+    if background:
+        threading.Thread(target=_warm, name="docai-warmup", daemon=True).start()
+    else:
+        _warm()
@@ -1,3 +1,6 @@
+from src.infrastructure.embedding.cache import EmbeddingStore
 from src.infrastructure.embedding.client import EmbeddingClient
+from src.infrastructure.embedding.hashing import HashingEmbedder
+from src.infrastructure.embedding.vector_index import VectorIndex
 
-__all__ = ["EmbeddingClient"]
+__all__ = ["EmbeddingClient", "EmbeddingStore", "HashingEmbedder", "VectorIndex"]
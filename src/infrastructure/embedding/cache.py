@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+
+class EmbeddingStore:
+    """Persistent embedding cache keyed by (model, task_type, text hash).
+
+    Vectors are appended to one packed float32 file (`vectors.f32`) and located
+    through an append-only offset index (`index.jsonl`). Lookups return views
+    into a read-only memory map, so cached vectors are never parsed or copied.
+    Appends take an exclusive file lock, which keeps the files consistent when
+    several worker processes share a directory.
+    """
+
+    DATA_FILE = "vectors.f32"
+    INDEX_FILE = "index.jsonl"
+    LOCK_FILE = ".lock"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.root / self.DATA_FILE
+        self.index_path = self.root / self.INDEX_FILE
+        self.data_path.touch(exist_ok=True)
+        self.index_path.touch(exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._index_pos = 0
+        self._mmap: Optional[np.memmap] = None
+        self._mmap_len = 0
+        self._lock = threading.Lock()
+        self._refresh_index()
+
+    @staticmethod
+    def make_key(model: str, task_type: Optional[str], text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}|{task_type or ''}|{digest}"
+
+    def get_many(self, model: str, task_type: Optional[str], texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        keys = [self.make_key(model, task_type, t) for t in texts]
+        with self._lock:
+            if any(k not in self._index for k in keys):
+                self._refresh_index()
+            out: List[Optional[np.ndarray]] = []
+            for key in keys:
+                loc = self._index.get(key)
+                if loc is None:
+                    self.misses += 1
+                    out.append(None)
+                    continue
+                self.hits += 1
+                out.append(self._view(*loc))
+            return out
+
+    def put_many(
+        self,
+        model: str,
+        task_type: Optional[str],
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        with self._lock:
+            with open(self.root / self.LOCK_FILE, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._refresh_index()
+                    offset = os.path.getsize(self.data_path) // 4
+                    blobs: List[bytes] = []
+                    lines: List[str] = []
+                    for text, vec in zip(texts, vectors):
+                        key = self.make_key(model, task_type, text)
+                        if key in self._index:
+                            continue
+                        arr = np.asarray(vec, dtype="<f4")
+                        blobs.append(arr.tobytes())
+                        lines.append(json.dumps({"key": key, "offset": offset, "dim": int(arr.size)}) + "\n")
+                        self._index[key] = (offset, int(arr.size))
+                        offset += int(arr.size)
+                    if not blobs:
+                        return
+                    # Data first, index second: an index line never points past written vectors.
+                    with open(self.data_path, "ab") as f:
+                        f.write(b"".join(blobs))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    with open(self.index_path, "a", encoding="utf-8") as f:
+                        f.write("".join(lines))
+                    self._index_pos = os.path.getsize(self.index_path)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._index)}
+
+    def _refresh_index(self) -> None:
+        size = os.path.getsize(self.index_path)
+        if size <= self._index_pos:
+            return
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_pos)
+            chunk = f.read()
+        consumed = 0
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # partially written line; re-read on next refresh
+            consumed += len(line)
+            try:
+                entry = json.loads(line.decode("utf-8"))
+                self._index[entry["key"]] = (int(entry["offset"]), int(entry["dim"]))
+            except Exception:
+                continue
+        self._index_pos += consumed
+
+    def _view(self, offset: int, dim: int) -> np.ndarray:
+        if self._mmap is None or offset + dim > self._mmap_len:
+            length = os.path.getsize(self.data_path) // 4
+            self._mmap = np.memmap(self.data_path, dtype="<f4", mode="r", shape=(length,)) if length else None
+            self._mmap_len = length
+        if self._mmap is None:
+            raise RuntimeError("embedding store data file is empty")
+        return self._mmap[offset : offset + dim]
+
+
+_SHARED_STORES: Dict[str, EmbeddingStore] = {}
+_SHARED_STORES_LOCK = threading.Lock()
+
+
+def embedding_store_from_env() -> Optional[EmbeddingStore]:
+    root = os.getenv("IR_EMBEDDING_CACHE_DIR")
+    if not root:
+        return None
+    key = str(Path(root).resolve())
+    with _SHARED_STORES_LOCK:
+        if key not in _SHARED_STORES:
+            _SHARED_STORES[key] = EmbeddingStore(Path(root))
+        return _SHARED_STORES[key]
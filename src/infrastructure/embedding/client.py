@@ -1,10 +1,26 @@
-from typing import List, Optional
+import os
+from typing import Any, List, Optional
+
+from src.common.concurrency import bounded_map
+
+DEFAULT_MAX_BATCH_SIZE = 250
+DEFAULT_MAX_CHARS_PER_REQUEST = 20000
+DEFAULT_MAX_IN_FLIGHT = 4
+# Per-request input limits of the Vertex embedding models (texts per call).
+MODEL_BATCH_LIMITS = {
+    "gemini-embedding-001": 1,
+}
 
 
 class EmbeddingClient:
-    def __init__(self, model_name: str = "text-embedding-004"):
+    def __init__(self, model_name: str = "text-embedding-004", max_in_flight: Optional[int] = None):
         self.model_name = model_name
         self._model = None
+        if max_in_flight is None:
+            max_in_flight = int(os.getenv("EMBEDDING_MAX_IN_FLIGHT", str(DEFAULT_MAX_IN_FLIGHT)))
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_batch_size = MODEL_BATCH_LIMITS.get(model_name, DEFAULT_MAX_BATCH_SIZE)
+        self.max_chars_per_request = DEFAULT_MAX_CHARS_PER_REQUEST
 
     def init_vertex(self, project_id: str, location: str = "us-central1") -> None:
         import vertexai
@@ -13,6 +29,12 @@ class EmbeddingClient:
         vertexai.init(project=project_id, location=location)
         self._model = TextEmbeddingModel.from_pretrained(self.model_name)
 
+    def init_fake(self, dim: int = 8, latency_sec: float = 0.0) -> Any:
+        from src.infrastructure.embedding.fake import FakeTextEmbeddingModel
+
+        self._model = FakeTextEmbeddingModel(dim=dim, max_batch_size=self.max_batch_size, latency_sec=latency_sec)
+        return self._model
+
     def embed(self, texts: List[str], task_type: Optional[str] = None) -> List[List[float]]:
         if self._model is None:
             raise RuntimeError("Embedding model is not initialized")
@@ -21,8 +43,26 @@ class EmbeddingClient:
         if task_type:
             kwargs["task_type"] = task_type
 
+        def _embed_batch(batch: List[str]) -> List[List[float]]:
+            response = self._model.get_embeddings(batch, **kwargs)
+            return [list(r.values) for r in response]
+
         vectors: List[List[float]] = []
-        for text in texts:
-            response = self._model.get_embeddings([text], **kwargs)
-            vectors.append(list(response[0].values))
+        for batch_vectors in bounded_map(_embed_batch, self._batches(texts), self.max_in_flight):
+            vectors.extend(batch_vectors)
         return vectors
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        batches: List[List[str]] = []
+        current: List[str] = []
+        used = 0
+        for text in texts:
+            size = len(text)
+            if current and (len(current) >= self.max_batch_size or used + size > self.max_chars_per_request):
+                batches.append(current)
+                current, used = [], 0
+            current.append(text)
+            used += size
+        if current:
+            batches.append(current)
+        return batches
@@ -0,0 +1,46 @@
+import hashlib
+import threading
+import time
+from typing import Any, List, Optional
+
+
+class FakeEmbedding:
+    def __init__(self, values: List[float]):
+        self.values = values
+
+
+class FakeTextEmbeddingModel:
+    """Offline stand-in for `vertexai` TextEmbeddingModel.
+
+    Vectors are derived from a SHA-256 of the text, so they are deterministic
+    and order mistakes are detectable. Every `get_embeddings` call is recorded,
+    and batches larger than `max_batch_size` are rejected like the provider does.
+    """
+
+    def __init__(self, dim: int = 8, max_batch_size: int = 250, latency_sec: float = 0.0):
+        self.dim = dim
+        self.max_batch_size = max_batch_size
+        self.latency_sec = latency_sec
+        self.calls: List[List[str]] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_embeddings(self, texts: List[str], task_type: Optional[str] = None, **_: Any) -> List[FakeEmbedding]:
+        if len(texts) > self.max_batch_size:
+            raise ValueError(f"batch size {len(texts)} exceeds limit {self.max_batch_size}")
+        with self._lock:
+            self.calls.append(list(texts))
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if self.latency_sec:
+                time.sleep(self.latency_sec)
+            return [FakeEmbedding(self.vector_for(t)) for t in texts]
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def vector_for(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [digest[i % len(digest)] / 255.0 for i in range(self.dim)]
@@ -0,0 +1,79 @@
+import os
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_DIM = 256
+DEFAULT_NGRAM = 3
+TOKEN_WEIGHT = 1.0
+NGRAM_WEIGHT = 0.5
+TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9가-힣_]+")
+
+
+@lru_cache(maxsize=200_000)
+def _feature_hash(feature: str) -> int:
+    # crc32 is stable across processes, unlike the per-process salted built-in hash().
+    return zlib.crc32(feature.encode("utf-8"))
+
+
+class HashingEmbedder:
+    """Deterministic feature-hashing embedder used when no embedding model is available.
+
+    Each text is mapped to lowercase word tokens plus character n-grams of
+    those tokens (with `<`/`>` boundary markers). Features are hashed with a
+    stable hash into `dim` signed buckets, accumulated for the whole batch with
+    one `np.add.at`, and L2-normalized. The same text always yields the same
+    vector, in any process.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM, ngram: int = DEFAULT_NGRAM):
+        self.dim = max(8, int(dim))
+        self.ngram = max(1, int(ngram))
+
+    @property
+    def model_name(self) -> str:
+        return f"hashing-v1-d{self.dim}-n{self.ngram}"
+
+    def features(self, text: str) -> List[Tuple[str, float]]:
+        out: List[Tuple[str, float]] = []
+        for token in TOKEN_PATTERN.findall((text or "").lower()):
+            out.append((f"w:{token}", TOKEN_WEIGHT))
+            marked = f"<{token}>"
+            for i in range(len(marked) - self.ngram + 1):
+                out.append((f"c:{marked[i : i + self.ngram]}", NGRAM_WEIGHT))
+        return out
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        hashes: List[int] = []
+        weights: List[float] = []
+        for row, text in enumerate(texts):
+            for feature, weight in self.features(text):
+                rows.append(row)
+                hashes.append(_feature_hash(feature))
+                weights.append(weight)
+
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if not rows:
+            return out
+        h = np.asarray(hashes, dtype=np.uint32)
+        cols = (h % self.dim).astype(np.intp)
+        signs = np.where((h >> 31) & 1, -1.0, 1.0).astype(np.float32)
+        np.add.at(out, (np.asarray(rows, dtype=np.intp), cols), signs * np.asarray(weights, dtype=np.float32))
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+
+_DEFAULT_EMBEDDERS: Dict[int, HashingEmbedder] = {}
+
+
+def hashing_embedder_from_env() -> HashingEmbedder:
+    try:
+        dim = int(os.getenv("IR_FALLBACK_EMBED_DIM", str(DEFAULT_DIM)))
+    except ValueError:
+        dim = DEFAULT_DIM
+    return _DEFAULT_EMBEDDERS.setdefault(dim, HashingEmbedder(dim=dim))
@@ -0,0 +1,267 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+DTYPES = {"int8": np.int8, "float16": np.float16}
+DEFAULT_CACHE_MB = 512
+SEARCH_BLOCK_ROWS = 8192
+
+
+class VectorIndex:
+    """Append-only, quantized on-disk vector index with brute-force cosine search.
+
+    Rows are L2-normalized and stored either as int8 with one float32 scale per
+    row (`max|x| / 127`) or as float16, in a packed data file that is read
+    through a memory map. Keys and metadata live in an append-only `meta.jsonl`;
+    adding an existing key again supersedes its earlier row and `remove` appends
+    a tombstone, so re-analyzed decks keep a single live entry per key. Appends take an exclusive file lock like
+    `EmbeddingStore`.
+
+    Search is an exact scan. Indexes whose dequantized float32 matrix fits in
+    `cache_mb` are kept dense in memory (one BLAS matrix-vector product per
+    query, new rows dequantized incrementally); larger ones are scanned in
+    blocks straight from the memory map.
+    """
+
+    HEADER_FILE = "index.json"
+    DATA_FILE = "vectors.bin"
+    SCALES_FILE = "scales.f32"
+    META_FILE = "meta.jsonl"
+    LOCK_FILE = ".lock"
+
+    def __init__(self, root: Path, dim: int, dtype: str = "int8", cache_mb: int = DEFAULT_CACHE_MB):
+        if dtype not in DTYPES:
+            raise ValueError(f"unsupported vector index dtype: {dtype}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        header_path = self.root / self.HEADER_FILE
+        if header_path.exists():
+            header = json.loads(header_path.read_text(encoding="utf-8"))
+            if int(header["dim"]) != int(dim) or header["dtype"] != dtype:
+                raise ValueError(
+                    f"vector index at {self.root} holds dim={header['dim']} dtype={header['dtype']}, "
+                    f"not dim={dim} dtype={dtype}"
+                )
+        else:
+            header_path.write_text(json.dumps({"dim": int(dim), "dtype": dtype}), encoding="utf-8")
+        self.dim = int(dim)
+        self.dtype = dtype
+        self.cache_rows = max(0, int(cache_mb) * 1024 * 1024 // (4 * self.dim))
+        self.data_path = self.root / self.DATA_FILE
+        self.scales_path = self.root / self.SCALES_FILE
+        self.meta_path = self.root / self.META_FILE
+        for path in (self.data_path, self.scales_path, self.meta_path):
+            path.touch(exist_ok=True)
+
+        self._np_dtype = np.dtype(DTYPES[dtype]).newbyteorder("<")
+        self._rows: Dict[str, int] = {}
+        self._meta: List[Dict[str, Any]] = []
+        self._live = np.zeros(0, dtype=bool)
+        self._meta_pos = 0
+        self._dense: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._refresh()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            self._refresh()
+            return key in self._rows
+
+    def add(
+        self,
+        keys: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        metadata: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> int:
+        """Append (or supersede) rows; returns the number of rows written."""
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(keys), -1) if len(keys) else None
+        if matrix is None:
+            return 0
+        if matrix.shape[1] != self.dim:
+            raise ValueError(f"expected {self.dim}-dim vectors, got {matrix.shape[1]}")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms > 0, norms, 1.0)
+        data, scales = self._quantize(matrix)
+        metadata = metadata or [{} for _ in keys]
+
+        with self._lock:
+            with open(self.root / self.LOCK_FILE, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._refresh()
+                    row = len(self._meta)
+                    # Drop rows orphaned by an append that died before its meta line landed.
+                    os.truncate(self.data_path, row * self.dim * self._np_dtype.itemsize)
+                    os.truncate(self.scales_path, row * 4)
+                    lines = [
+                        json.dumps({**dict(meta), "key": key, "row": row + i}, ensure_ascii=False) + "\n"
+                        for i, (key, meta) in enumerate(zip(keys, metadata))
+                    ]
+                    # Data first, metadata second: a meta line never points past written rows.
+                    with open(self.data_path, "ab") as f:
+                        f.write(data.tobytes())
+                        f.flush()
+                        os.fsync(f.fileno())
+                    with open(self.scales_path, "ab") as f:
+                        f.write(scales.tobytes())
+                        f.flush()
+                        os.fsync(f.fileno())
+                    with open(self.meta_path, "a", encoding="utf-8") as f:
+                        f.write("".join(lines))
+                    self._refresh()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return len(lines)
+
+    def remove(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            with open(self.root / self.LOCK_FILE, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._refresh()
+                    lines = [
+                        json.dumps({"key": key, "deleted": True}, ensure_ascii=False) + "\n"
+                        for key in keys
+                        if key in self._rows
+                    ]
+                    if lines:
+                        with open(self.meta_path, "a", encoding="utf-8") as f:
+                            f.write("".join(lines))
+                        self._refresh()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+        """Dequantized (normalized) vector and metadata of a live key."""
+        with self._lock:
+            self._refresh()
+            row = self._rows.get(key)
+            if row is None:
+                return None
+            return self._dequantize(row, row + 1)[0], dict(self._meta[row])
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        exclude: Iterable[str] = (),
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Top-k live rows by cosine similarity, best first, skipping `exclude` keys."""
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        if q.size != self.dim:
+            raise ValueError(f"expected a {self.dim}-dim query, got {q.size}")
+        norm = float(np.linalg.norm(q))
+        if norm == 0.0 or k <= 0:
+            return []
+        q = q / norm
+
+        with self._lock:
+            self._refresh()
+            n = len(self._meta)
+            if not n:
+                return []
+            scores = self._scores(q, n)
+            mask = self._live[:n].copy()
+            for key in exclude:
+                row = self._rows.get(key)
+                if row is not None:
+                    mask[row] = False
+            scores = np.where(mask, scores, -np.inf)
+            take = min(int(k), int(mask.sum()))
+            if take <= 0:
+                return []
+            top = np.argpartition(-scores, take - 1)[:take]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(float(scores[row]), dict(self._meta[row])) for row in top]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return {
+                "rows": len(self._meta),
+                "live": len(self._rows),
+                "dim": self.dim,
+                "dtype": self.dtype,
+                "bytes": os.path.getsize(self.data_path) + os.path.getsize(self.scales_path),
+                "dense_cached": self._dense is not None,
+            }
+
+    def _quantize(self, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self.dtype == "float16":
+            return matrix.astype(self._np_dtype), np.ones(len(matrix), dtype="<f4")
+        peak = np.abs(matrix).max(axis=1)
+        scales = np.where(peak > 0, peak / 127.0, 1.0).astype("<f4")
+        data = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(self._np_dtype)
+        return data, scales
+
+    def _dequantize(self, start: int, stop: int) -> np.ndarray:
+        data = np.memmap(self.data_path, dtype=self._np_dtype, mode="r", shape=(len(self._meta), self.dim))
+        scales = np.memmap(self.scales_path, dtype="<f4", mode="r", shape=(len(self._meta),))
+        return data[start:stop].astype(np.float32) * scales[start:stop, None]
+
+    def _scores(self, q: np.ndarray, n: int) -> np.ndarray:
+        if n <= self.cache_rows:
+            have = 0 if self._dense is None else len(self._dense)
+            if have < n:
+                fresh = self._dequantize(have, n)
+                self._dense = fresh if self._dense is None else np.vstack([self._dense, fresh])
+            return self._dense[:n] @ q
+        self._dense = None
+        out = np.empty(n, dtype=np.float32)
+        for start in range(0, n, SEARCH_BLOCK_ROWS):
+            stop = min(n, start + SEARCH_BLOCK_ROWS)
+            out[start:stop] = self._dequantize(start, stop) @ q
+        return out
+
+    def _refresh(self) -> None:
+        size = os.path.getsize(self.meta_path)
+        if size <= self._meta_pos:
+            return
+        with open(self.meta_path, "rb") as f:
+            f.seek(self._meta_pos)
+            chunk = f.read()
+        consumed = 0
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break  # partially written line; re-read on next refresh
+            consumed += len(line)
+            try:
+                entry = json.loads(line.decode("utf-8"))
+                key = str(entry["key"])
+                row = -1 if entry.get("deleted") else int(entry["row"])
+            except Exception:
+                continue
+            if row < 0:
+                dropped = self._rows.pop(key, None)
+                if dropped is not None:
+                    self._live[dropped] = False
+                continue
+            if row != len(self._meta):
+                continue
+            self._meta.append(entry)
+            if len(self._live) <= row:
+                self._live = np.concatenate([self._live, np.zeros(max(1024, len(self._live)), dtype=bool)])
+            previous = self._rows.get(key)
+            if previous is not None:
+                self._live[previous] = False
+            self._rows[key] = row
+            self._live[row] = True
+        self._meta_pos += consumed
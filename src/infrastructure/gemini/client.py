@@ -1,10 +1,156 @@
+import hashlib
 import json
 import os
-from typing import Any, Dict
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote
 
 import requests
 
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_CACHE_TTL_SEC = 7 * 24 * 3600
+DEFAULT_CACHE_MAX_TEMPERATURE = 0.1
+
+
+class GeminiResponseCache:
+    """Size-bounded on-disk LRU cache of parsed Gemini JSON responses.
+
+    Entries are content-addressed by a SHA-256 of model + prompt + generation
+    config and stored one file per key. Last access is tracked through file
+    mtimes, so LRU order survives restarts and is shared by workers using the
+    same directory.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, ttl_sec: float):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl_sec = float(ttl_sec)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(model_key: str, prompt: str, generation_config: Dict[str, Any]) -> str:
+        material = json.dumps(
+            {"model": model_key, "prompt": prompt, "generation_config": generation_config},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        with self._lock:
+            if key not in self._entries or not path.exists():
+                self._forget(key)
+                self.misses += 1
+                return None
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                self._remove(key)
+                self.misses += 1
+                return None
+            if self.ttl_sec > 0 and time.time() - float(entry.get("created_at", 0)) > self.ttl_sec:
+                self._remove(key)
+                self.misses += 1
+                return None
+            os.utime(path, None)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.get("response")
+
+    def put(self, key: str, response: Any) -> None:
+        path = self._path(key)
+        data = json.dumps({"created_at": time.time(), "response": response}, ensure_ascii=False).encode("utf-8")
+        if self.max_bytes and len(data) > self.max_bytes:
+            return
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            while self.max_bytes and self._total_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> None:
+        if not self.cache_dir.exists():
+            return
+        files = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, path.stem, st.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _forget(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _remove(self, key: str) -> None:
+        self._forget(key)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+
+_SHARED_CACHES: Dict[Tuple[str, int, float], GeminiResponseCache] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def _cache_from_env() -> Optional[GeminiResponseCache]:
+    cache_dir = os.getenv("GEMINI_CACHE_DIR")
+    if not cache_dir:
+        return None
+    try:
+        max_bytes = int(float(os.getenv("GEMINI_CACHE_MAX_MB", str(DEFAULT_CACHE_MAX_MB))) * 1024 * 1024)
+        ttl_sec = float(os.getenv("GEMINI_CACHE_TTL_SEC", str(DEFAULT_CACHE_TTL_SEC)))
+    except Exception:
+        max_bytes, ttl_sec = DEFAULT_CACHE_MAX_MB * 1024 * 1024, float(DEFAULT_CACHE_TTL_SEC)
+    key = (str(Path(cache_dir).resolve()), max_bytes, ttl_sec)
+    with _SHARED_CACHES_LOCK:
+        if key not in _SHARED_CACHES:
+            _SHARED_CACHES[key] = GeminiResponseCache(Path(cache_dir), max_bytes=max_bytes, ttl_sec=ttl_sec)
+        return _SHARED_CACHES[key]
+
+
+def _cache_max_temperature() -> float:
+    try:
+        return float(os.getenv("GEMINI_CACHE_MAX_TEMPERATURE", str(DEFAULT_CACHE_MAX_TEMPERATURE)))
+    except Exception:
+        return DEFAULT_CACHE_MAX_TEMPERATURE
+
 
 class GeminiJSONClient:
     def __init__(self, model_name: str = "gemini-2.5-flash"):
@@ -12,6 +158,8 @@ class GeminiJSONClient:
         self.model_name = None
         self.model_candidates = []
         self.api_key = None
+        self.cache = _cache_from_env()
+        self.cache_max_temperature = _cache_max_temperature()
         self._init_model(os.getenv("GEMINI_MODEL", model_name))
 
     def _init_model(self, model_name: str) -> None:
@@ -51,6 +199,13 @@ class GeminiJSONClient:
                 "temperature": temperature,
             },
         }
+        cache_key = None
+        if self.cache is not None and temperature <= self.cache_max_temperature:
+            cache_key = self.cache.make_key("|".join(self.model_candidates), prompt, payload["generationConfig"])
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         headers = {
             "Content-Type": "application/json",
             "x-goog-api-key": self.api_key,
@@ -86,9 +241,15 @@ class GeminiJSONClient:
             raw = (parts[0].get("text", "") or "").replace("```json", "").replace("```", "").strip()
             if not raw:
                 raise RuntimeError("Gemini response text is empty")
-            return json.loads(raw)
+            parsed = json.loads(raw)
+            if cache_key is not None:
+                self.cache.put(cache_key, parsed)
+            return parsed
 
         raise RuntimeError(
             "Gemini request failed: no available model for v1 generateContent. "
             f"Tried={self.model_candidates}. Last={last_error}"
         )
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        return self.cache.stats() if self.cache is not None else None
@@ -0,0 +1,125 @@
+"""Pluggable on-disk encoding for pipeline artifacts.
+
+`ARTIFACT_CODEC` selects how artifacts are written:
+
+- `json` (default): pretty-printed JSON, byte-identical to the historical output
+- `json-compact`: single-line JSON (orjson when installed)
+- `msgpack`: MessagePack (requires `msgpack`)
+
+Appending `+zstd` (e.g. `msgpack+zstd`) compresses the payload with
+Zstandard (requires `zstandard`). File names do not change, so every
+`*_docai.json` / `*_final.json` lookup keeps working; `decode_artifact`
+detects the format from the leading bytes, so files written with any codec,
+including every existing JSON file, load the same way.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+ARTIFACT_CODECS = ("json", "json-compact", "msgpack")
+DEFAULT_ARTIFACT_CODEC = "json"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+
+_warned: set = set()
+
+
+def _warn_once(message: str) -> None:
+    if message not in _warned:
+        _warned.add(message)
+        print(f"⚠️ {message}")
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """Codec specs usable with the libraries installed in this environment."""
+    base = [c for c in ARTIFACT_CODECS if c != "msgpack" or msgpack is not None]
+    if zstandard is None:
+        return tuple(base)
+    return tuple(base + [f"{c}+zstd" for c in base if c != "json"])
+
+
+def resolve_codec(spec: Optional[str] = None) -> Tuple[str, bool]:
+    """(codec, zstd) for `spec` or `ARTIFACT_CODEC`, downgraded when a library is missing."""
+    spec = (spec or os.getenv("ARTIFACT_CODEC") or DEFAULT_ARTIFACT_CODEC).strip().lower()
+    codec, _, compression = spec.partition("+")
+    if codec not in ARTIFACT_CODECS:
+        raise ValueError(f"unknown artifact codec: {spec} (expected one of {', '.join(ARTIFACT_CODECS)})")
+    if compression not in ("", "zstd"):
+        raise ValueError(f"unknown artifact compression: {compression}")
+    if codec == "msgpack" and msgpack is None:
+        _warn_once("msgpack 미설치: json-compact로 저장합니다.")
+        codec = "json-compact"
+    use_zstd = compression == "zstd"
+    if use_zstd and zstandard is None:
+        _warn_once("zstandard 미설치: 압축 없이 저장합니다.")
+        use_zstd = False
+    return codec, use_zstd
+
+
+def encode_artifact(data: Any, spec: Optional[str] = None) -> bytes:
+    codec, use_zstd = resolve_codec(spec)
+    if codec == "msgpack":
+        raw = msgpack.packb(data, use_bin_type=True)
+    elif codec == "json-compact":
+        raw = _compact_json(data)
+    else:
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    if use_zstd:
+        raw = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    return raw
+
+
+def decode_artifact(raw: bytes) -> Any:
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]  # UTF-8 BOM from hand-edited files
+    if raw.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed artifact requires the `zstandard` package")
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    head = raw.lstrip()[:1]
+    if head in (b"{", b"[", b'"') or not head:
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity written by the stdlib encoder
+        return json.loads(raw.decode("utf-8"))
+    if msgpack is None:
+        raise RuntimeError("msgpack artifact requires the `msgpack` package")
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
+def write_artifact(path: Path, data: Any, spec: Optional[str] = None) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_artifact(data, spec))
+
+
+def read_artifact(path: Path) -> Any:
+    return decode_artifact(Path(path).read_bytes())
+
+
+def _compact_json(data: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
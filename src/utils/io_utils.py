@@ -1,5 +1,5 @@
-import json
-import os
+from src.common.artifact_catalog import register_artifact
+from src.utils.artifact_codec import read_artifact, write_artifact
 
 
 def read_bytes(path: str) -> bytes:
@@ -9,13 +9,11 @@ def read_bytes(path: str) -> bytes:
 
 
 def save_json(data, path: str):
-    """JSON 파일 저장"""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """JSON 파일 저장 (형식은 ARTIFACT_CODEC)"""
+    write_artifact(path, data)
+    register_artifact(path)
 
 
 def read_json(path: str):
-    """JSON 파일 읽기"""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """JSON 파일 읽기 (저장 형식 자동 감지)"""
+    return read_artifact(path)
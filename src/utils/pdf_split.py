@@ -3,9 +3,27 @@ import os
 from PyPDF2 import PdfReader, PdfWriter
 from typing import List
 
-def split_pdf(input_pdf: str, output_dir: str, chunk_size: int = 15) -> List[str]:
+def chunk_page_counts(total_pages: int, chunk_size: int, balanced: bool = False) -> List[int]:
+    """
+    청크별 페이지 수. 기본은 chunk_size씩 자르고 마지막 청크가 나머지를 가진다.
+    balanced=True면 같은 청크 수를 유지하면서 페이지를 고르게 배분한다
+    (31페이지, chunk_size=11 -> 11/10/10). 어느 청크도 chunk_size를 넘지 않는다.
+    """
+    if total_pages <= 0:
+        return []
+    chunk_size = max(1, chunk_size)
+    if not balanced:
+        full, rest = divmod(total_pages, chunk_size)
+        return [chunk_size] * full + ([rest] if rest else [])
+    n_chunks = -(-total_pages // chunk_size)
+    base, extra = divmod(total_pages, n_chunks)
+    return [base + 1] * extra + [base] * (n_chunks - extra)
+
+
+def split_pdf(input_pdf: str, output_dir: str, chunk_size: int = 15, balanced: bool = False) -> List[str]:
     """
     PDF를 chunk_size 단위로 분할하여 여러 개 PDF로 저장.
+    balanced=True면 청크 크기를 고르게 맞춘다 (chunk_page_counts 참고).
     반환값: 생성된 chunk PDF 경로 리스트
     """
     if not os.path.exists(input_pdf):
@@ -18,13 +36,12 @@ def split_pdf(input_pdf: str, output_dir: str, chunk_size: int = 15) -> List[str
     chunks = []
 
     start = 0
-    part = 1
     
     # 원본 파일명 가져오기 (확장자 제외)
     base_name = os.path.splitext(os.path.basename(input_pdf))[0]
 
-    while start < total_pages:
-        end = min(start + chunk_size, total_pages)
+    for part, size in enumerate(chunk_page_counts(total_pages, chunk_size, balanced), 1):
+        end = start + size
 
         writer = PdfWriter()
         for i in range(start, end):
@@ -39,6 +56,5 @@ def split_pdf(input_pdf: str, output_dir: str, chunk_size: int = 15) -> List[str
 
         chunks.append(chunk_path)
         start = end
-        part += 1
 
     return chunks
\ No newline at end of file
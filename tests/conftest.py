@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_artifact_catalog(tmp_path, monkeypatch):
+    # Keep writers under test from creating data/output/artifact_catalog.sqlite3.
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "artifact_catalog.sqlite3"))
@@ -0,0 +1,145 @@
+import os
+import sqlite3
+import tempfile
+
+from src.common.artifact_catalog import ArtifactCatalog, classify_artifact, register_artifact
+from src.common.utils import find_latest_strategy
+from src.domain.ir.tuning_metrics import find_docai_for_label
+
+
+def _touch(path, text="{}", mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_classify_artifact():
+    assert classify_artifact("out/deck_a_docai.json") == ("deck_a", "docai")
+    assert classify_artifact("deck_a_final.json") == ("deck_a", "final")
+    assert classify_artifact("deck_a_slide_state.json") is None
+
+
+def test_catalog_lookup_rebuild_and_stale_rows(tmp_path):
+    out = tmp_path / "out"
+    docai = _touch(out / "nested" / "deck" / "deck_a_docai.json")
+    _touch(tmp_path / "elsewhere" / "deck_a_docai.json")
+    catalog = ArtifactCatalog(tmp_path / "catalog.sqlite3")
+
+    assert catalog.rebuild([out, tmp_path / "elsewhere"]) == {"docai": 2, "final": 0, "strategy": 0}
+    assert catalog.lookup("deck_a", "docai", [out]) == docai.resolve()
+    assert catalog.lookup("deck_a", "final") is None
+
+    docai.unlink()
+    assert catalog.lookup("deck_a", "docai", [out]) is None
+    assert catalog.stats() == {"docai": 1}
+
+
+def test_lookups_use_env_catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "catalog.sqlite3"))
+    notice_dir = tmp_path / "notice"
+    _touch(notice_dir / "old_strategy.json", mtime=1_000)
+    newest = _touch(notice_dir / "new_strategy.json", mtime=2_000)
+    assert find_latest_strategy(notice_dir) == newest
+
+    # Registered by the first (scanning) call; later calls are answered by the catalog.
+    catalog = ArtifactCatalog(tmp_path / "catalog.sqlite3")
+    assert catalog.latest("strategy", notice_dir) == newest.resolve()
+
+    docai = _touch(tmp_path / "runs" / "a" / "b" / "deck_x_docai.json")
+    assert find_docai_for_label([tmp_path / "runs"], "deck_x.pdf") == docai
+    assert catalog.lookup("deck_x", "docai", [tmp_path / "runs"]) == docai.resolve()
+
+
+def test_hashing_is_opt_in(tmp_path):
+    docai = _touch(tmp_path / "out" / "deck_a_docai.json")
+
+    def _digest(catalog):
+        catalog.register(docai)
+        with sqlite3.connect(str(catalog.db_path)) as conn:
+            return conn.execute("SELECT sha256 FROM artifacts").fetchone()[0]
+
+    assert _digest(ArtifactCatalog(tmp_path / "plain.sqlite3")) == ""
+    assert len(_digest(ArtifactCatalog(tmp_path / "hashed.sqlite3", hash_files=True))) == 64
+
+
+def test_temp_dir_outputs_are_not_catalogued(tmp_path, monkeypatch):
+    scratch = tmp_path / "scratch"
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(scratch))
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "catalog.sqlite3"))
+
+    register_artifact(_touch(scratch / "trial" / "deck_a_final.json"))
+    register_artifact(_touch(tmp_path / "out" / "deck_a_final.json"))
+
+    assert ArtifactCatalog(tmp_path / "catalog.sqlite3").stats() == {"final": 1}
+
+
+def test_label_misses_are_cached_until_registered(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "catalog.sqlite3"))
+    runs = tmp_path / "runs"
+    runs.mkdir()
+
+    assert find_docai_for_label([runs], "deck_y.pdf") is None
+    docai = _touch(runs / "a" / "b" / "deck_y_docai.json")
+    assert find_docai_for_label([runs], "deck_y.pdf") is None  # recent miss, no re-glob
+
+    monkeypatch.setenv("ARTIFACT_CATALOG_MISS_TTL", "0")
+    assert find_docai_for_label([runs], "deck_y.pdf") == docai
+
+    monkeypatch.delenv("ARTIFACT_CATALOG_MISS_TTL")
+    assert find_docai_for_label([runs], "deck_z.pdf") is None
+    register_artifact(_touch(runs / "c" / "deck_z_docai.json"))
+    assert find_docai_for_label([runs], "deck_z.pdf") == (runs / "c" / "deck_z_docai.json").resolve()
+
+
+def test_latest_strategy_sees_files_written_outside_the_catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "catalog.sqlite3"))
+    notice_dir = tmp_path / "notice"
+    register_artifact(_touch(notice_dir / "a_strategy.json", mtime=1_000))
+    copied = _touch(notice_dir / "b_strategy.json", mtime=2_000)
+
+    assert find_latest_strategy(notice_dir) == copied
+    assert ArtifactCatalog(tmp_path / "catalog.sqlite3").latest("strategy", notice_dir) == copied.resolve()
+
+
+def test_lookup_ranks_rewritten_files_by_current_mtime(tmp_path):
+    catalog = ArtifactCatalog(tmp_path / "catalog.sqlite3")
+    older = _touch(tmp_path / "out" / "a" / "deck_a_final.json", mtime=2_000)
+    newer = _touch(tmp_path / "out" / "b" / "deck_a_final.json", mtime=1_000)
+    catalog.register(older)
+    catalog.register(newer)
+
+    os.utime(newer, (3_000, 3_000))  # rewritten without register()
+    assert catalog.lookup("deck_a", "final") == newer.resolve()
+    assert catalog.latest("final", newer.parent) == newer.resolve()
+
+
+def test_temp_writes_do_not_create_the_catalog(tmp_path, monkeypatch):
+    scratch = tmp_path / "scratch"
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(scratch))
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "persistent" / "catalog.sqlite3"))
+
+    register_artifact(_touch(scratch / "trial" / "deck_a_final.json"))
+    assert find_docai_for_label([scratch], "deck_b.pdf") is None
+
+    assert not (tmp_path / "persistent").exists()
+
+
+def test_latest_strategy_is_answered_by_the_catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "catalog.sqlite3"))
+    notice_dir = tmp_path / "notice"
+    _touch(notice_dir / "a_strategy.json", mtime=1_000)
+    newest = _touch(notice_dir / "b_strategy.json", mtime=2_000)
+    assert find_latest_strategy(notice_dir) == newest
+
+    def _no_glob(self, pattern):
+        raise AssertionError("catalogued directory was rescanned")
+
+    monkeypatch.setattr(type(notice_dir), "glob", _no_glob)
+    assert find_latest_strategy(notice_dir) == newest.resolve()
+
+    newest.unlink()  # stale row: dropped, then the directory is rescanned
+    monkeypatch.undo()
+    monkeypatch.setenv("ARTIFACT_CATALOG_PATH", str(tmp_path / "catalog.sqlite3"))
+    assert find_latest_strategy(notice_dir) == notice_dir / "a_strategy.json"
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from src.utils import artifact_codec
+from src.utils.artifact_codec import available_codecs, decode_artifact, encode_artifact, resolve_codec
+from src.utils.io_utils import read_json, save_json
+
+PAYLOAD = {"text": "문제 정의", "pages": [{"pageNumber": 1, "blocks": [{"confidence": 0.98}]}], "empty": None}
+
+
+def test_default_codec_matches_historical_pretty_json(monkeypatch):
+    monkeypatch.delenv("ARTIFACT_CODEC", raising=False)
+    assert encode_artifact(PAYLOAD) == json.dumps(PAYLOAD, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.mark.parametrize("codec", available_codecs())
+def test_every_available_codec_round_trips(codec):
+    assert decode_artifact(encode_artifact(PAYLOAD, codec)) == PAYLOAD
+
+
+def test_readers_detect_format(tmp_path, monkeypatch):
+    legacy = tmp_path / "legacy_docai.json"
+    legacy.write_text(json.dumps(PAYLOAD, indent=2, ensure_ascii=False), encoding="utf-8")
+    assert read_json(str(legacy)) == PAYLOAD
+
+    monkeypatch.setenv("ARTIFACT_CODEC", "json-compact")
+    compact = tmp_path / "out" / "deck_docai.json"
+    save_json(PAYLOAD, str(compact))
+    assert b"\n" not in compact.read_bytes()
+    assert read_json(str(compact)) == PAYLOAD
+
+
+def test_missing_optional_libraries_downgrade(monkeypatch):
+    monkeypatch.setattr(artifact_codec, "msgpack", None)
+    monkeypatch.setattr(artifact_codec, "zstandard", None)
+    assert resolve_codec("msgpack+zstd") == ("json-compact", False)
+    with pytest.raises(ValueError):
+        resolve_codec("pickle")
@@ -0,0 +1,86 @@
+import json
+
+from PyPDF2 import PdfReader
+
+from src.domain.ir import rag_pipeline
+from src.infrastructure.document_ai.native_text import extract_native_text, merge_ocr_pages
+from src.infrastructure.document_ai.pipeline import run_document_ai_pipeline
+
+
+def _write_pdf(path, page_lines):
+    """Minimal PDF with a Helvetica text layer; an empty line list makes an image-like page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in page_lines:
+        ops = "".join(f"BT /F1 14 Tf 72 {700 - 20 * i} Td ({line}) Tj ET\n" for i, line in enumerate(lines))
+        objects.append(f"<< /Length {len(ops)} >>\nstream\n{ops}endstream")
+        content_id = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 960 540] /Contents {content_id} 0 R "
+            "/Resources << /Font << /F1 3 0 R >> >> >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(out)
+    return path
+
+
+def _ocr_page(text):
+    return {"pageNumber": 1, "blocks": [{"layout": {"textAnchor": {"textSegments": [{"endIndex": str(len(text))}]}}}]}
+
+
+def test_extract_native_text_reports_page_coverage(tmp_path):
+    pdf = _write_pdf(tmp_path / "deck.pdf", [["Problem statement", "Retail stock is hard to manage"], [], ["Team"]])
+
+    doc = extract_native_text(str(pdf), min_chars=20)
+
+    assert [c["source"] for c in doc["native_text"]["pages"]] == ["native", "ocr", "ocr"]
+    assert doc["native_text"]["ocr_pages"] == [2, 3]
+    assert doc["pages"][0]["dimension"]["width"] == 960.0
+    slides = rag_pipeline._build_slides(doc)
+    assert slides[0].clean_text == "Problem statement Retail stock is hard to manage"
+    assert slides[1].clean_text == ""
+
+    merged = merge_ocr_pages(doc, {"text": "scanned chart", "pages": [_ocr_page("scanned chart")]}, [2])
+    assert [s.clean_text for s in rag_pipeline._build_slides(merged)] == [
+        "Problem statement Retail stock is hard to manage",
+        "scanned chart",
+        "Team",
+    ]
+
+
+def test_pipeline_sends_only_low_text_pages_to_document_ai(monkeypatch, tmp_path):
+    pdf = _write_pdf(
+        tmp_path / "deck.pdf",
+        [["Market size TAM 12B USD", "CAGR 14%"], [], ["Business model: subscription 29,000 KRW / month"]],
+    )
+    sent = []
+
+    def _flaky_ocr(file_path, processor_type, output_path, enable_enhancement=True):
+        sent.append(len(PdfReader(file_path).pages))
+        if len(sent) == 1:
+            raise RuntimeError("transient 503")
+        return {"text": "Revenue chart 45,000,000 KRW", "pages": [_ocr_page("Revenue chart 45,000,000 KRW")]}
+
+    monkeypatch.setenv("DOCAI_NATIVE_TEXT", "1")
+    monkeypatch.setenv("ARTIFACT_CATALOG", "0")
+    monkeypatch.setattr("src.infrastructure.document_ai.processor.process_document", _flaky_ocr)
+
+    doc = run_document_ai_pipeline(pdf, tmp_path / "out")
+
+    assert sent == [1, 1]  # the low-text group is retried once, like OCR chunks
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["deck_docai.json"]
+    assert doc["native_text"]["ocr_pages_processed"] == [2]
+    assert [s.clean_text for s in rag_pipeline._build_slides(doc)][1] == "Revenue chart 45,000,000 KRW"
+    assert doc["metadata"]["total_pages"] == 3 and "extracted_numbers" in doc
+    assert json.loads((tmp_path / "out" / "deck_docai.json").read_text(encoding="utf-8")) == doc
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from src.infrastructure.document_ai.pipeline import run_document_ai_pipeline
 
 
@@ -77,3 +79,70 @@ def test_page_limit_error_falls_back_to_chunking(monkeypatch, tmp_path):
     assert called["single"] == 1
     assert called["chunk"] == 1
     assert called["merge"] == 1
+
+
+def test_choose_pages_per_chunk_respects_limits_and_spreads_over_workers():
+    from src.infrastructure.document_ai.processor import OCR_PAGE_LIMIT, choose_pages_per_chunk
+
+    mb = 1024 * 1024
+    assert choose_pages_per_chunk(60, 5 * mb, concurrency=4) == OCR_PAGE_LIMIT
+    assert choose_pages_per_chunk(31, 5 * mb, concurrency=1) == 11  # 3 chunks (at most 11 pages), not 15/15/1
+    assert choose_pages_per_chunk(30, 2 * mb, concurrency=4) == 8
+    assert choose_pages_per_chunk(45, 50 * mb, concurrency=1) == 15
+    assert choose_pages_per_chunk(14, 60 * mb, concurrency=1) == 4  # request size bound
+
+
+def test_split_pdf_balances_pages_across_chunks(tmp_path):
+    from PyPDF2 import PdfReader, PdfWriter
+
+    from src.utils.pdf_split import chunk_page_counts, split_pdf
+
+    assert chunk_page_counts(31, 11) == [11, 11, 9]
+    assert chunk_page_counts(31, 11, balanced=True) == [11, 10, 10]
+    assert chunk_page_counts(31, 8, balanced=True) == [8, 8, 8, 7]
+    assert chunk_page_counts(31, 15, balanced=True) == [11, 10, 10]
+
+    writer = PdfWriter()
+    for _ in range(31):
+        writer.add_blank_page(width=960, height=540)
+    pdf = tmp_path / "deck.pdf"
+    with open(pdf, "wb") as f:
+        writer.write(f)
+
+    chunks = split_pdf(str(pdf), str(tmp_path / "chunks"), 11, balanced=True)
+    assert [len(PdfReader(c).pages) for c in chunks] == [11, 10, 10]
+
+
+def test_chunks_run_concurrently_in_order_with_one_retry(monkeypatch, tmp_path):
+    import threading
+
+    from src.infrastructure.document_ai import processor
+
+    chunk_files = [str(tmp_path / f"deck_chunk_{i}.pdf") for i in range(1, 5)]
+    monkeypatch.setattr(processor, "split_pdf", lambda *_args, **_kwargs: chunk_files)
+    attempts = {}
+    lock = threading.Lock()
+
+    def _process(file_path, processor_type, output_path, enable_enhancement=True):
+        with lock:
+            attempts[file_path] = attempts.get(file_path, 0) + 1
+            first_try = attempts[file_path] == 1
+        if file_path.endswith("_2.pdf") and first_try:
+            raise RuntimeError("transient 503")
+        return {"text": file_path}
+
+    monkeypatch.setattr(processor, "process_document", _process)
+    results = processor.process_pdf_ocr_in_chunks("deck.pdf", str(tmp_path), pages_per_chunk=15, max_workers=3)
+
+    assert [r["text"] for r in results] == chunk_files
+    assert [r["chunk_info"]["chunk_index"] for r in results] == [1, 2, 3, 4]
+    assert attempts[chunk_files[1]] == 2
+
+    def _always_fail(file_path, *_args, **_kwargs):
+        if file_path.endswith("_3.pdf"):
+            raise RuntimeError("bad chunk")
+        return {"text": file_path}
+
+    monkeypatch.setattr(processor, "process_document", _always_fail)
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        processor.process_pdf_ocr_in_chunks("deck.pdf", str(tmp_path), pages_per_chunk=15, max_workers=3)
@@ -0,0 +1,78 @@
+import json
+
+from src.common.artifact_catalog import classify_artifact
+from src.domain.ir import rag_pipeline
+from src.domain.ir.scorer import extract_slide_contents
+from src.domain.notice.pipeline import _extract_tables
+from src.infrastructure.document_ai.processor import detect_sections
+from src.infrastructure.document_ai.projection import ocr_process_options, raw_output_path, slim_document
+
+
+def _anchor(start, end):
+    return {"textAnchor": {"textSegments": [{"startIndex": str(start), "endIndex": str(end)}]}}
+
+
+def _raw_document():
+    text = "문제 정의\n소상공인 재고 관리\n매출 | 4,500만원\n"
+    tokens = [
+        {"layout": {**_anchor(i, i + 1), "confidence": 0.9}, "styleInfo": {"fontSize": 12}} for i in range(len(text))
+    ]
+    symbols = [{"layout": _anchor(i, i + 1)} for i in range(len(text))]
+    page = {
+        "pageNumber": 1,
+        "dimension": {"width": 1280, "height": 720, "unit": "pixels"},
+        "image": {"content": "A" * 50_000, "mimeType": "image/png", "width": 1280, "height": 720},
+        "imageQualityScores": {"qualityScore": 0.8, "detectedDefects": [{"type": "quality/defect_blurry"}]},
+        "layout": _anchor(0, len(text)),
+        "blocks": [{"layout": {**_anchor(0, 5), "boundingPoly": {"vertices": [{"x": 1}]}}}, {"layout": _anchor(6, 16)}],
+        "paragraphs": [{"layout": _anchor(0, 16)}],
+        "lines": [{"layout": _anchor(0, 5)}, {"layout": _anchor(6, 16)}],
+        "tokens": tokens,
+        "symbols": symbols,
+        "tables": [
+            {
+                "layout": _anchor(17, 30),
+                "bodyRows": [{"cells": [{"layout": _anchor(17, 19), "colSpan": 1}, {"layout": _anchor(22, 30)}]}],
+            }
+        ],
+    }
+    return {"text": text, "pages": [page], "textStyles": [{"fontSize": 12}] * 50}
+
+
+def test_slim_document_keeps_everything_downstream_reads():
+    raw = detect_sections(_raw_document())
+    slim = slim_document(raw)
+
+    assert len(json.dumps(slim)) * 10 < len(json.dumps(raw))
+    assert "tokens" not in slim["pages"][0] and "textStyles" not in slim
+    assert slim["pages"][0]["dimension"] == raw["pages"][0]["dimension"]
+
+    assert [s.to_dict() for s in rag_pipeline._build_slides(slim)] == [
+        s.to_dict() for s in rag_pipeline._build_slides(raw)
+    ]
+    assert extract_slide_contents(slim, slim["pages"]) == extract_slide_contents(raw, raw["pages"])
+    assert _extract_tables(slim) == _extract_tables(raw)
+
+
+def test_raw_output_is_not_catalogued_as_docai():
+    path = raw_output_path("out/deck_docai.json")
+    assert path == "out/deck_docai_raw.json"
+    assert classify_artifact(path) is None
+
+
+def test_ocr_extras_are_requested_only_when_the_full_document_is_kept(monkeypatch):
+    def _extras():
+        config = ocr_process_options().ocr_config
+        return config.enable_symbol, config.compute_style_info, config.enable_image_quality_scores
+
+    monkeypatch.delenv("DOCAI_SLIM", raising=False)
+    monkeypatch.delenv("DOCAI_KEEP_RAW", raising=False)
+    assert _extras() == (False, False, False)
+    assert ocr_process_options().ocr_config.enable_native_pdf_parsing
+
+    monkeypatch.setenv("DOCAI_KEEP_RAW", "1")
+    assert _extras() == (True, True, True)
+
+    monkeypatch.setenv("DOCAI_KEEP_RAW", "0")
+    monkeypatch.setenv("DOCAI_SLIM", "0")
+    assert _extras() == (True, True, True)
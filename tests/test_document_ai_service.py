@@ -0,0 +1,48 @@
+import time
+from types import SimpleNamespace
+
+from google.cloud import documentai_v1beta3 as documentai
+
+from src.common.concurrency import bounded_map
+from src.infrastructure.document_ai import service as service_module
+from src.infrastructure.document_ai.client import DocumentAIClient
+from src.infrastructure.document_ai.service import OCRService
+
+
+class _FakeClient:
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        time.sleep(0.01)  # stands in for credential discovery + channel setup
+
+    def process_document(self, request):
+        return SimpleNamespace(document=documentai.Document(text=f"ocr:{request.name}"))
+
+
+def test_service_reuses_pooled_clients_and_reports_savings():
+    _FakeClient.created = 0
+    service = OCRService(pool_size=2, client_factory=_FakeClient)
+    requests = [documentai.ProcessRequest(name=f"p{i}") for i in range(12)]
+
+    results = bounded_map(service.process_document, requests, max_workers=4)
+
+    assert [r.document.text for r in results] == [f"ocr:p{i}" for i in range(12)]
+    assert _FakeClient.created == 2
+    stats = service.stats()
+    assert stats["clients_created"] == 2 and stats["requests"] == 12
+    assert stats["setup_sec_saved"] >= 10 * 0.01 * 0.9
+
+
+def test_notice_client_shares_process_wide_service(monkeypatch, tmp_path):
+    _FakeClient.created = 0
+    monkeypatch.setattr(service_module, "_SERVICE", OCRService(client_factory=_FakeClient))
+    pdf = tmp_path / "notice.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n%fake")
+
+    for _ in range(3):
+        doc = DocumentAIClient("proj", "us", "proc").process_ocr_pdf(pdf)
+
+    assert doc["text"] == "ocr:projects/proj/locations/us/processors/proc"
+    assert _FakeClient.created == 1
+    assert service_module.get_ocr_service().stats()["requests"] == 3
@@ -0,0 +1,56 @@
+import numpy as np
+
+from src.domain.ir import rag_pipeline
+from src.infrastructure.embedding.client import EmbeddingClient
+
+
+def test_embed_batches_requests_and_keeps_order():
+    client = EmbeddingClient(model_name="text-embedding-004", max_in_flight=3)
+    client.max_batch_size = 4
+    model = client.init_fake(dim=6, latency_sec=0.01)
+    texts = [f"슬라이드 {i}" for i in range(10)]
+
+    vectors = client.embed(texts, task_type="RETRIEVAL_DOCUMENT")
+
+    assert [len(c) for c in sorted(model.calls, key=lambda c: texts.index(c[0]))] == [4, 4, 2]
+    assert vectors == [model.vector_for(t) for t in texts]
+    assert model.max_in_flight > 1
+
+
+def test_single_input_models_run_one_text_per_request_concurrently():
+    client = EmbeddingClient(model_name="gemini-embedding-001", max_in_flight=4)
+    model = client.init_fake(latency_sec=0.01)
+    texts = [f"text-{i}" for i in range(8)]
+
+    vectors = client.embed(texts)
+
+    assert len(model.calls) == 8
+    assert all(len(c) == 1 for c in model.calls)
+    assert 1 < model.max_in_flight <= 4
+    assert vectors == [model.vector_for(t) for t in texts]
+
+
+def test_char_budget_splits_batches():
+    client = EmbeddingClient(model_name="text-embedding-004", max_in_flight=1)
+    client.max_chars_per_request = 100
+    model = client.init_fake()
+    client.embed(["a" * 60, "b" * 60, "c" * 30])
+    assert [len(c) for c in model.calls] == [1, 2]
+
+
+def test_embed_deck_sends_slides_and_rubric_in_one_call():
+    client = EmbeddingClient(model_name="text-embedding-004")
+    model = client.init_fake()
+    slides = [
+        {"slide_number": i, "clean_text": f"본문 {i}", "short_summary": f"요약 {i}", "embedding": []}
+        for i in range(1, 4)
+    ]
+    rubric = rag_pipeline._default_rubric("VC_DEMO")
+
+    rag_pipeline._embed_deck(slides, rubric, client)
+
+    items = [item for g in rubric["groups"] for item in g["items"]]
+    assert len(model.calls) == 1
+    assert len(model.calls[0]) == len(slides) + len(items)
+    assert np.allclose(slides[1]["embedding"], model.vector_for("본문 2\n요약 2"))
+    assert items[0]["embedding"] == model.vector_for(f"{items[0]['item_name']}. {items[0]['description']}")
@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.domain.ir import rag_pipeline
+from src.infrastructure.embedding import cache as embedding_cache
+from src.infrastructure.embedding.cache import EmbeddingStore
+
+
+class _CountingEmbedClient:
+    model_name = "fake-embedding"
+
+    def __init__(self):
+        self.requested = []
+
+    def embed(self, texts, task_type=None):
+        self.requested.extend(texts)
+        return [[float(len(t)), float(i), 1.0] for i, t in enumerate(texts)]
+
+
+def test_embed_texts_only_sends_cache_misses(monkeypatch, tmp_path):
+    monkeypatch.setenv("IR_EMBEDDING_CACHE_DIR", str(tmp_path / "emb"))
+    monkeypatch.setattr(embedding_cache, "_SHARED_STORES", {})
+    client = _CountingEmbedClient()
+
+    first = rag_pipeline._embed_texts(["시장규모. TAM", "팀 역량. 대표"], client)
+    second = rag_pipeline._embed_texts(["팀 역량. 대표", "새 슬라이드", "시장규모. TAM"], client)
+
+    assert client.requested == ["시장규모. TAM", "팀 역량. 대표", "새 슬라이드"]
+    np.testing.assert_allclose(second[0], first[1])
+    np.testing.assert_allclose(second[2], first[0])
+
+
+def test_store_persists_across_instances_and_separates_task_types(tmp_path):
+    store = EmbeddingStore(tmp_path)
+    store.put_many("m", "RETRIEVAL_DOCUMENT", ["a", "b"], [[1.0, 2.0], [3.0, 4.0, 5.0]])
+
+    reopened = EmbeddingStore(tmp_path)
+    got = reopened.get_many("m", "RETRIEVAL_DOCUMENT", ["b", "a", "c"])
+    assert got[2] is None
+    np.testing.assert_array_equal(got[0], np.array([3.0, 4.0, 5.0], dtype=np.float32))
+    np.testing.assert_array_equal(got[1], np.array([1.0, 2.0], dtype=np.float32))
+    assert isinstance(got[0], np.memmap)
+    assert reopened.get_many("m", "RETRIEVAL_QUERY", ["a"]) == [None]
@@ -0,0 +1,74 @@
+import json
+import time
+
+from src.infrastructure.gemini import client as gemini_client
+from src.infrastructure.gemini.client import GeminiJSONClient, GeminiResponseCache
+
+
+class _Response:
+    status_code = 200
+    text = ""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return {"candidates": [{"content": {"parts": [{"text": json.dumps(self._payload)}]}}]}
+
+
+def _client(monkeypatch, tmp_path, calls):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("GEMINI_MODEL", "gemini-test")
+    monkeypatch.setenv("GEMINI_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(gemini_client, "_SHARED_CACHES", {})
+
+    def fake_post(url, headers, json, timeout):
+        calls.append(json)
+        return _Response({"n": len(calls)})
+
+    monkeypatch.setattr(gemini_client.requests, "post", fake_post)
+    return GeminiJSONClient()
+
+
+def test_low_temperature_calls_are_served_from_cache(monkeypatch, tmp_path):
+    calls = []
+    client = _client(monkeypatch, tmp_path, calls)
+
+    first = client.generate_json("같은 프롬프트", temperature=0.0)
+    second = client.generate_json("같은 프롬프트", temperature=0.0)
+    other_temp = client.generate_json("같은 프롬프트", temperature=0.1)
+
+    assert first == second == {"n": 1}
+    assert other_temp == {"n": 2}
+    assert len(calls) == 2
+    assert client.cache_stats()["hits"] == 1
+    assert client.cache_stats()["misses"] == 2
+
+
+def test_high_temperature_calls_bypass_cache(monkeypatch, tmp_path):
+    calls = []
+    client = _client(monkeypatch, tmp_path, calls)
+
+    client.generate_json("피드백", temperature=0.2)
+    client.generate_json("피드백", temperature=0.2)
+
+    assert len(calls) == 2
+    assert client.cache_stats()["hits"] == 0
+
+
+def test_cache_evicts_least_recently_used_and_expires(tmp_path):
+    cache = GeminiResponseCache(tmp_path, max_bytes=200, ttl_sec=0)
+    keys = [GeminiResponseCache.make_key("m", f"p{i}", {"temperature": 0.0}) for i in range(3)]
+    cache.put(keys[0], {"v": "a" * 40})
+    cache.put(keys[1], {"v": "b" * 40})
+    assert cache.get(keys[0]) == {"v": "a" * 40}
+    cache.put(keys[2], {"v": "c" * 40})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["evictions"] == 1
+
+    reloaded = GeminiResponseCache(tmp_path, max_bytes=200, ttl_sec=0.05)
+    time.sleep(0.1)
+    assert reloaded.get(keys[2]) is None
+    assert not any(p.name.startswith(keys[2]) for p in tmp_path.rglob("*.json"))
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from src.infrastructure.embedding.hashing import HashingEmbedder, hashing_embedder_from_env
+
+ROOT = Path(__file__).resolve().parents[1]
+TEXTS = ["시장 규모 TAM 12조원 SAM 3조원", "팀 CEO 10년 경력 CTO", "", "시장 규모 TAM 20조원"]
+
+
+def test_vectors_are_identical_across_hash_seeds():
+    code = (
+        "import json; from src.infrastructure.embedding.hashing import HashingEmbedder; "
+        f"print(json.dumps(HashingEmbedder(dim=64).embed({TEXTS!r}).tolist()))"
+    )
+    outputs = []
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        outputs.append(json.loads(proc.stdout))
+    assert outputs[0] == outputs[1]
+    assert np.allclose(np.asarray(outputs[0], dtype=np.float32), HashingEmbedder(dim=64).embed(TEXTS))
+
+
+def test_batch_matches_single_text_embedding_and_is_normalized():
+    embedder = HashingEmbedder(dim=128)
+    batch = embedder.embed(TEXTS)
+    assert batch.shape == (4, 128) and batch.dtype == np.float32
+    for text, row in zip(TEXTS, batch):
+        assert np.array_equal(embedder.embed([text])[0], row)
+    assert np.allclose(np.linalg.norm(batch[[0, 1, 3]], axis=1), 1.0)
+    assert not batch[2].any()
+    assert float(batch[0] @ batch[3]) > float(batch[0] @ batch[1])
+
+
+def test_dimension_comes_from_env(monkeypatch):
+    monkeypatch.setenv("IR_FALLBACK_EMBED_DIM", "96")
+    embedder = hashing_embedder_from_env()
+    assert embedder.dim == 96
+    assert embedder.model_name.endswith("d96-n3")
@@ -39,3 +39,79 @@ def test_run_ir_batch_writes_summary(tmp_path, monkeypatch):
     assert (tmp_path / "out" / "batch_summary.json").exists()
     assert (tmp_path / "out" / "batch_summary.csv").exists()
 
+
+
+def test_run_ir_batch_process_pool_keeps_input_order(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    names = ["a", "b", "c", "d"]
+    for name in names:
+        (input_dir / f"{name}.pdf").write_bytes(b"%PDF-1.4\n")
+
+    def fake_run_ir_analysis(ir_pdf, output_dir, strategy, use_chunking, pitch_type):
+        import time
+
+        # Earlier files finish last.
+        time.sleep(0.05 * (len(names) - names.index(Path(ir_pdf).stem)))
+        if Path(ir_pdf).stem == "c":
+            raise RuntimeError("boom")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        final_path = output_dir / f"{Path(ir_pdf).stem}_final.json"
+        final_path.write_text(json.dumps({"deck_score": {"total_score": 60}, "criteria_scores": []}), encoding="utf-8")
+        return {"final_path": str(final_path)}
+
+    monkeypatch.setattr(batch_runner, "run_ir_analysis", fake_run_ir_analysis)
+
+    config = batch_runner.BatchRunConfig(
+        input_dir=input_dir,
+        output_root=tmp_path / "out",
+        workers=3,
+        llm_concurrency=1,
+    )
+    summary = batch_runner.run_ir_batch(config)
+    assert [Path(r["file"]).stem for r in summary["results"]] == names
+    assert [r["status"] for r in summary["results"]] == ["COMPLETED", "COMPLETED", "FAILED", "COMPLETED"]
+    csv_rows = (tmp_path / "out" / "batch_summary.csv").read_text(encoding="utf-8").splitlines()[1:]
+    assert [Path(line.split(",")[1]).stem for line in csv_rows] == names
+
+
+def test_run_ir_batch_resumes_from_journal(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ["a", "b", "c"]:
+        (input_dir / f"{name}.pdf").write_bytes(f"%PDF-1.4 {name}\n".encode())
+    calls = []
+    failing = {"c"}
+
+    def fake_run_ir_analysis(ir_pdf, output_dir, strategy, use_chunking, pitch_type):
+        calls.append(Path(ir_pdf).stem)
+        if Path(ir_pdf).stem in failing:
+            raise RuntimeError("ocr timeout")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        final_path = output_dir / f"{Path(ir_pdf).stem}_final.json"
+        final_path.write_text(json.dumps({"deck_score": {"total_score": 50}, "criteria_scores": []}), encoding="utf-8")
+        return {"final_path": str(final_path)}
+
+    monkeypatch.setattr(batch_runner, "run_ir_analysis", fake_run_ir_analysis)
+    config = batch_runner.BatchRunConfig(input_dir=input_dir, output_root=tmp_path / "out", resume=True)
+
+    first = batch_runner.run_ir_batch(config)
+    assert first["completed_files"] == 2 and calls == ["a", "b", "c"]
+    journal = tmp_path / "out" / batch_runner.JOURNAL_FILE
+    with journal.open("a", encoding="utf-8") as f:
+        f.write('{"file": "torn')  # crash mid-write
+
+    # Only the failed case and the changed PDF are re-run.
+    calls.clear()
+    failing.clear()
+    (input_dir / "b.pdf").write_bytes(b"%PDF-1.4 b v2\n")
+    second = batch_runner.run_ir_batch(config)
+    assert sorted(calls) == ["b", "c"]
+    assert second["resumed_files"] == 1 and second["completed_files"] == 3
+    assert [Path(r["file"]).stem for r in second["results"]] == ["a", "b", "c"]
+
+    # A different config hash invalidates the journal.
+    calls.clear()
+    monkeypatch.setenv("IR_SIM_HIGH", "0.8")
+    batch_runner.run_ir_batch(config)
+    assert calls == ["a", "b", "c"]
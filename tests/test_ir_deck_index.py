@@ -0,0 +1,134 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.routers import ir as ir_router
+from src.domain.ir import pipeline as ir_pipeline
+from src.domain.ir.deck_index import DeckIndex, deck_index_from_env, index_analysis_outputs
+from src.domain.ir.slide_state import save_slide_state
+from src.infrastructure.embedding.vector_index import VectorIndex
+
+
+def _write_deck(root, deck_id, vectors, score=70):
+    deck_dir = root / deck_id
+    slides = [
+        {"slide_number": i, "clean_text": f"{deck_id} slide {i}", "short_summary": "", "embedding": vec}
+        for i, vec in enumerate(vectors, start=1)
+    ]
+    save_slide_state(deck_dir / f"{deck_id}_slide_state.json", slides, [], "hashing-v1-d4-n3")
+    final = {
+        "pitch_type": "STARTUP_CONTEST",
+        "deck_score": {"total_score": score},
+        "slides": [{"slide_number": s["slide_number"], "category": "MARKET", "content": s["clean_text"]} for s in slides],
+        "meta": {"filename": f"{deck_id}.pdf"},
+    }
+    (deck_dir / f"{deck_id}_final.json").write_text(json.dumps(final), encoding="utf-8")
+    return deck_dir / f"{deck_id}_slide_state.json"
+
+
+def test_vector_index_int8_search_supersede_and_remove(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((50, 16)).astype(np.float32)
+    index = VectorIndex(tmp_path, dim=16)
+    index.add([f"k{i}" for i in range(50)], vectors, [{"i": i} for i in range(50)])
+
+    hits = index.search(vectors[7], k=3)
+    assert hits[0][1]["key"] == "k7" and hits[0][0] == pytest.approx(1.0, abs=0.01)
+    assert [h[1]["key"] for h in index.search(vectors[7], k=3, exclude=["k7"])][0] != "k7"
+
+    index.add(["k7"], [-vectors[7]])
+    index.remove(["k8"])
+    reopened = VectorIndex(tmp_path, dim=16)
+    assert len(reopened) == 49 and "k8" not in reopened
+    assert reopened.search(vectors[7], k=1)[0][1]["key"] != "k7"
+    with pytest.raises(ValueError):
+        VectorIndex(tmp_path, dim=8)
+
+
+def test_similar_decks_and_slides_from_analysis_outputs(tmp_path):
+    out = tmp_path / "ir_analysis"
+    _write_deck(out, "deck-a", [[1, 0, 0, 0], [0.9, 0.1, 0, 0]])
+    _write_deck(out, "deck-b", [[1, 0.1, 0, 0], [0, 0, 1, 0]])
+    _write_deck(out, "deck-c", [[0, 0, 0, 1], [0, 0.1, 0, 1]], score=40)
+
+    index = DeckIndex(tmp_path / "index", dtype="float16")
+    assert index_analysis_outputs(index, [out]) == {"deck-a": 2, "deck-b": 2, "deck-c": 2}
+
+    decks = index.similar_decks("deck-a", k=2)
+    assert [d["deck_id"] for d in decks] == ["deck-b", "deck-c"]
+    assert decks[0]["filename"] == "deck-b.pdf" and decks[1]["total_score"] == 40
+
+    slides = index.similar_slides("deck-b", 2, k=1)
+    assert slides[0]["deck_id"] != "deck-b"
+    assert index.similar_decks("missing") is None
+
+    # Re-analysis with fewer slides drops the stale slide rows.
+    _write_deck(out, "deck-c", [[0, 0, 0, 1]])
+    index.add_deck("deck-c", out / "deck-c" / "deck-c_slide_state.json")
+    assert index.similar_slides("deck-c", 2) is None
+
+
+def test_similar_endpoint_reads_index_from_env(tmp_path, monkeypatch):
+    out = tmp_path / "ir_analysis"
+    _write_deck(out, "deck-a", [[1, 0, 0, 0]])
+    _write_deck(out, "deck-b", [[1, 0.2, 0, 0]])
+    monkeypatch.setenv("IR_DECK_INDEX_DIR", str(tmp_path / "index"))
+    index_analysis_outputs(deck_index_from_env(), [out])
+
+    res = ir_router.get_similar_ir_decks(deck_id="deck-a", k=5, slide_number=None)
+    assert [d.ir_deck_id for d in res.similar_decks] == ["deck-b"]
+    res = ir_router.get_similar_ir_decks(deck_id="deck-a", k=5, slide_number=1)
+    assert res.similar_slides[0].ir_deck_id == "deck-b" and res.similar_slides[0].slide_number == 1
+    with pytest.raises(HTTPException) as exc:
+        ir_router.get_similar_ir_decks(deck_id="unknown", k=5, slide_number=None)
+    assert exc.value.status_code == 404
+
+
+def test_vector_index_recovers_from_torn_append(tmp_path):
+    index = VectorIndex(tmp_path, dim=4)
+    index.add(["a"], [[1, 0, 0, 0]])
+    # Simulate a crash after the data/scales appends but before the meta line.
+    with open(tmp_path / VectorIndex.DATA_FILE, "ab") as f:
+        f.write(np.zeros(4, dtype=np.int8).tobytes())
+    with open(tmp_path / VectorIndex.SCALES_FILE, "ab") as f:
+        f.write(np.ones(1, dtype="<f4").tobytes())
+
+    index.add(["b"], [[0, 1, 0, 0]])
+    reopened = VectorIndex(tmp_path, dim=4)
+    assert len(reopened) == 2 and "b" in reopened
+    assert reopened.search([0, 1, 0, 0], k=1)[0][1]["key"] == "b"
+    assert (tmp_path / VectorIndex.SCALES_FILE).stat().st_size == 2 * 4
+
+
+def test_run_ir_analysis_indexes_only_fresh_rag_results(tmp_path, monkeypatch):
+    monkeypatch.setenv("IR_DECK_INDEX_DIR", str(tmp_path / "index"))
+    runs = tmp_path / "runs"
+    monkeypatch.setattr(ir_pipeline, "run_document_ai_pipeline", lambda *a, **k: {"text": "x"})
+    monkeypatch.setattr(ir_pipeline, "export_final_json", lambda ocr, path, strategy: None)
+
+    def _analyze(deck_id, rag, **kwargs):
+        pdf = tmp_path / f"{deck_id}.pdf"
+        pdf.write_bytes(b"%PDF")
+        monkeypatch.setattr(ir_pipeline, "run_rag_ir_analysis", rag)
+        ir_pipeline.run_ir_analysis(pdf, runs / deck_id, **kwargs)
+        return deck_index_from_env().similar_decks(deck_id) is not None
+
+    def _rag(**kwargs):
+        deck_id = Path(kwargs["slide_state_path"]).parent.name
+        _write_deck(runs, deck_id, [[1, 0, 0, 0]])
+
+    def _failing_rag(**kwargs):
+        raise RuntimeError("boom")
+
+    assert not _analyze("deck-a", _rag)  # opt-in only
+    assert _analyze("deck-b", _rag, index_deck=True)
+
+    # Leftover slide state from an earlier run must not be indexed against a new final.json.
+    stale = _write_deck(runs, "deck-c", [[0, 1, 0, 0]])
+    assert not _analyze("deck-c", _failing_rag, index_deck=True)
+    os.utime(stale, (1_000, 1_000))
+    assert not _analyze("deck-c", lambda **kwargs: None, index_deck=True)
@@ -0,0 +1,109 @@
+import json
+
+from src.domain.ir import rag_pipeline
+from src.infrastructure.embedding.client import EmbeddingClient
+
+PAGES = [
+    "문제 정의: 소상공인은 재고 관리에 불편을 겪고 있으며 pain point가 큽니다",
+    "솔루션: AI 기반 자동 발주로 해결합니다 as-is to-be 개선",
+    "시장 규모 TAM 12조원 SAM 3조원 SOM 1200억원 CAGR 14%",
+    "비즈니스 모델 구독 월 29,000원 수수료 3% ARPU LTV",
+    "팀 CEO 10년 경력 CTO 학력 자문",
+]
+
+
+class _FakeGemini:
+    model = True
+    model_name = "fake"
+
+    def __init__(self):
+        self.classified = []
+
+    def generate_json(self, prompt, temperature=0.2):
+        if "[슬라이드 텍스트]" in prompt:
+            text = prompt.split("[슬라이드 텍스트]\n", 1)[1]
+            self.classified.append(text)
+            return {"category": "MARKET", "category_confidence": 0.8, "short_summary": text[:30], "key_claims": [text[:10]]}
+        try:
+            payload = json.loads(prompt)
+        except ValueError:
+            return {}
+        if "item_name" in payload:
+            return {"is_relevant": True, "confidence": 0.7}
+        return {"feedback": f"{payload.get('group_name')} 피드백", "confidence": 0.7}
+
+    def cache_stats(self):
+        return None
+
+
+def _docai(pages):
+    text, out_pages = "", []
+    for idx, page in enumerate(pages, start=1):
+        start = len(text)
+        text += page + "\n"
+        segment = {"startIndex": str(start), "endIndex": str(len(text))}
+        out_pages.append({"pageNumber": idx, "blocks": [{"layout": {"textAnchor": {"textSegments": [segment]}}}]})
+    return {"text": text, "pages": out_pages, "detected_sections": [], "metadata": {"filename": "deck.pdf"}}
+
+
+def _run(monkeypatch, tmp_path, name, pages, previous=None):
+    gemini = _FakeGemini()
+    client = EmbeddingClient(model_name="text-embedding-004")
+    model = client.init_fake(dim=16)
+    monkeypatch.setattr(rag_pipeline, "GeminiJSONClient", lambda: gemini)
+    monkeypatch.setattr(rag_pipeline, "_init_embedding_client", lambda: client)
+    state = tmp_path / f"{name}_slide_state.json"
+    result = rag_pipeline.run_rag_ir_analysis(
+        docai_result=_docai(pages),
+        output_path=str(tmp_path / f"{name}_final.json"),
+        pitch_type="VC_DEMO",
+        previous_slide_state=str(previous) if previous else None,
+        slide_state_path=str(state),
+    )
+    embedded = [text for call in model.calls for text in call]
+    return result, state, gemini.classified, embedded
+
+
+def test_unchanged_deck_reuses_slide_state_and_matches_cold_run(monkeypatch, tmp_path):
+    monkeypatch.delenv("IR_FAST_MODE", raising=False)
+    monkeypatch.delenv("IR_EMBEDDING_CACHE_DIR", raising=False)
+    cold, state, classified, embedded = _run(monkeypatch, tmp_path, "v1", PAGES)
+    assert len(classified) == len(PAGES)
+
+    warm, _, classified, embedded = _run(monkeypatch, tmp_path, "v2", PAGES, previous=state)
+    assert classified == []
+    assert not any(page in text for page in PAGES for text in embedded)
+    assert warm == cold
+
+
+def test_changed_slide_is_the_only_one_recomputed(monkeypatch, tmp_path):
+    monkeypatch.delenv("IR_FAST_MODE", raising=False)
+    monkeypatch.delenv("IR_EMBEDDING_CACHE_DIR", raising=False)
+    _, state, _, _ = _run(monkeypatch, tmp_path, "v1", PAGES)
+
+    changed = list(PAGES)
+    changed[2] = "시장 규모 TAM 20조원 SAM 5조원 SOM 2000억원 CAGR 18%"
+    cold, _, _, _ = _run(monkeypatch, tmp_path, "v2_cold", changed)
+    warm, _, classified, embedded = _run(monkeypatch, tmp_path, "v2", changed, previous=state)
+
+    assert len(classified) == 1 and changed[2] in classified[0]
+    slide_texts = [t for t in embedded if any(page in t for page in changed)]
+    assert len(slide_texts) == 1 and changed[2] in slide_texts[0]
+    assert warm == cold
+
+
+def test_meta_reports_the_fallback_embedding_model(monkeypatch, tmp_path):
+    monkeypatch.delenv("IR_EMBEDDING_CACHE_DIR", raising=False)
+    monkeypatch.setattr(rag_pipeline, "GeminiJSONClient", _FakeGemini)
+    monkeypatch.setattr(rag_pipeline, "_init_embedding_client", lambda: None)
+    state = tmp_path / "deck_slide_state.json"
+    result = rag_pipeline.run_rag_ir_analysis(
+        docai_result=_docai(PAGES),
+        output_path=str(tmp_path / "deck_final.json"),
+        pitch_type="VC_DEMO",
+        slide_state_path=str(state),
+    )
+
+    model = result["meta"]["embedding_model"]
+    assert model.startswith("hashing-")
+    assert json.loads(state.read_text(encoding="utf-8"))["embedding_model"] == model
@@ -0,0 +1,76 @@
+from math import log
+
+import numpy as np
+
+from src.domain.ir import rag_pipeline
+from src.domain.ir.lexical_index import BM25Index, token_counts
+from src.domain.ir.settings import PipelineSettings
+
+DOCS = [
+    "시장 규모 TAM 12조원 SAM 3조원 시장 성장",
+    "팀 CEO 10년 경력 CTO",
+    "비즈니스 모델 구독 수수료 시장",
+    "",
+]
+
+
+def _brute_force_bm25(docs, query, k1=1.2, b=0.75):
+    counts = [token_counts(d) for d in docs]
+    avgdl = sum(sum(c.values()) for c in counts) / len(counts)
+    out = []
+    for c in counts:
+        dl = sum(c.values())
+        score = 0.0
+        for term in set(query):
+            df = sum(1 for other in counts if term in other)
+            if c[term]:
+                idf = log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+                score += idf * c[term] * (k1 + 1) / (c[term] + k1 * (1 - b + b * dl / avgdl))
+        out.append(score)
+    return np.array(out)
+
+
+def test_postings_scoring_matches_brute_force_bm25():
+    index = BM25Index.from_texts(DOCS)
+    query = ["시장", "tam", "없는단어"]
+    assert np.allclose(index.scores(query), _brute_force_bm25(DOCS, query))
+
+    normalized = index.normalized_matrix([query, ["팀", "cto"], []])
+    assert normalized.shape == (3, 4)
+    assert ((normalized >= 0) & (normalized <= 1)).all()
+    assert normalized[0].argmax() == 0 and normalized[1].argmax() == 1
+    assert not normalized[2].any() and not normalized[:, 3].any()
+
+
+def test_bm25_is_selectable_for_retrieval(monkeypatch):
+    monkeypatch.setenv("IR_LEXICAL_SCORER", "bm25")
+    assert PipelineSettings.resolve().lexical_scorer == "bm25"
+    monkeypatch.setenv("IR_LEXICAL_SCORER", "nonsense")
+    assert PipelineSettings.resolve().lexical_scorer == "jaccard"
+
+    slides = [
+        {"slide_number": i, "clean_text": text, "short_summary": "", "category": "OTHER", "embedding": []}
+        for i, text in enumerate(DOCS[:3], start=1)
+    ]
+    item = {"item_name": "시장 규모", "description": "TAM SAM 시장 규모"}
+    evidences = rag_pipeline._retrieve_evidences([("MARKET_BM", item)], slides, top_k=2, lexical_scorer="bm25")
+    assert evidences[0][0]["slide_number"] == 1
+
+
+def test_prebuilt_deck_index_is_reused(monkeypatch):
+    slides = [
+        {"slide_number": i, "clean_text": text, "short_summary": "", "category": "OTHER", "embedding": []}
+        for i, text in enumerate(DOCS[:3], start=1)
+    ]
+    index = rag_pipeline._build_lexical_index(slides, "bm25")
+    assert rag_pipeline._build_lexical_index(slides, "jaccard") is None
+
+    def _rebuild(*args, **kwargs):
+        raise AssertionError("BM25 index rebuilt per retrieval")
+
+    monkeypatch.setattr(BM25Index, "from_texts", _rebuild)
+    item = {"item_name": "시장 규모", "description": "TAM SAM 시장 규모"}
+    evidences = rag_pipeline._retrieve_evidences(
+        [("MARKET_BM", item)], slides, top_k=2, lexical_scorer="bm25", lexical_index=index
+    )
+    assert evidences[0][0]["slide_number"] == 1
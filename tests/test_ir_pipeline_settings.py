@@ -0,0 +1,57 @@
+import json
+import os
+
+from src.domain.ir import rag_pipeline
+from src.domain.ir.settings import PipelineSettings, load_pipeline_config
+
+
+def _write_config(path, high, mtime):
+    path.write_text(json.dumps({"matching": {"similarity_threshold": {"high": high}, "top_k": 4}}), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_pipeline_config_reloads_when_mtime_changes(tmp_path, monkeypatch):
+    cfg = tmp_path / "pipeline.json"
+    monkeypatch.setenv("PITCHCOACH_PIPELINE_CONFIG_PATH", str(cfg))
+    for name in ("IR_SIM_HIGH", "IR_SIM_MID", "IR_SIM_LOW", "IR_TOP_K"):
+        monkeypatch.delenv(name, raising=False)
+
+    _write_config(cfg, 0.8, 1_000_000_000)
+    first = PipelineSettings.resolve()
+    assert (first.sim_high, first.top_k) == (0.8, 4)
+    assert load_pipeline_config() is load_pipeline_config()
+
+    _write_config(cfg, 0.9, 2_000_000_000)
+    assert PipelineSettings.resolve().sim_high == 0.9
+    assert first.sim_high == 0.8
+
+
+def test_settings_precedence_and_derived_low(tmp_path, monkeypatch):
+    monkeypatch.setenv("PITCHCOACH_PIPELINE_CONFIG_PATH", str(tmp_path / "missing.json"))
+    monkeypatch.delenv("IR_SIM_LOW", raising=False)
+    monkeypatch.setenv("IR_SIM_HIGH", "0.7")
+    monkeypatch.setenv("IR_SIM_MID", "0.5")
+    monkeypatch.setenv("IR_TOP_K", "not-a-number")
+
+    from_env = PipelineSettings.resolve()
+    assert (from_env.sim_high, from_env.sim_mid, from_env.top_k) == (0.7, 0.5, 3)
+    assert abs(from_env.sim_low - 0.4) < 1e-9
+
+    overridden = PipelineSettings.resolve(sim_mid=0.3, top_k=50, fast_mode=True)
+    assert overridden.sim_high == 0.7
+    assert abs(overridden.sim_low - 0.2) < 1e-9
+    assert overridden.top_k == 10
+    assert overridden.fast_mode
+
+
+def test_settings_are_threaded_without_touching_env(monkeypatch):
+    monkeypatch.setenv("IR_SIM_HIGH", "0.99")
+    gemini = type("NoModel", (), {"model": None})()
+    item = {"item_name": "시장규모", "fail_if_missing": False}
+    evidences = [{"slide_number": 1, "similarity": 0.5, "summary": "", "clean_text": "시장 규모 TAM 12조원 근거 슬라이드"}]
+
+    strict = PipelineSettings.resolve()
+    loose = PipelineSettings.resolve(sim_high=0.45, sim_mid=0.3)
+    assert rag_pipeline._decide_coverage(item, evidences, gemini, strict) == "PARTIALLY_COVERED"
+    assert rag_pipeline._decide_coverage(item, evidences, gemini, loose) == "COVERED"
+    assert rag_pipeline._score_item(10.0, "COVERED", 0.5, loose) > rag_pipeline._score_item(10.0, "COVERED", 0.5)
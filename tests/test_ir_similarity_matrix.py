@@ -0,0 +1,163 @@
+import random
+from math import sqrt
+
+from src.domain.ir import rag_pipeline
+from src.domain.ir.settings import PipelineSettings
+from src.domain.ir.similarity import SIMILARITY_TOLERANCE, rank_key
+from src.domain.ir.slide_features import jaccard, keyword_overlap
+from src.domain.ir.slide_model import as_slide_records, attach_embeddings
+from src.infrastructure.embedding.hashing import HashingEmbedder
+
+PHRASES = [
+    "문제 정의: 고객은 재고 관리에 불편을 겪고 있습니다",
+    "솔루션: AI 자동 발주로 해결합니다",
+    "시장 규모 TAM 12조원 SAM 3조원 CAGR 14%",
+    "비즈니스 모델 구독 월 29,000원 수수료 3%",
+    "MOU 5건 PoC 3건 베타 사용자 1,200명 매출 4,500만원",
+    "팀 CEO 10년 경력 CTO 학력",
+    "재무 계획 투자 유치 5억원 BEP 2027",
+]
+CATEGORIES = ["PROBLEM", "SOLUTION", "MARKET", "BUSINESS_MODEL", "TRACTION", "TEAM", "FINANCE", "OTHER"]
+
+
+def _cosine(a, b):
+    if len(a) == 0 or len(b) == 0:
+        return 0.0
+    n = min(len(a), len(b))
+    a = [float(v) for v in a[:n]]
+    b = [float(v) for v in b[:n]]
+    dot = sum(x * y for x, y in zip(a, b))
+    na = sqrt(sum(x * x for x in a))
+    nb = sqrt(sum(y * y for y in b))
+    if na == 0 or nb == 0:
+        return 0.0
+    return max(0.0, min(1.0, dot / (na * nb)))
+
+
+def _per_pair_top_k(item, slides, top_k, group_id="", min_sim=PipelineSettings.retrieval_min_sim):
+    """Reference: the original one-(item, slide)-pair-at-a-time retrieval blend."""
+    item_feat = rag_pipeline._item_features(item)
+    prefers_numeric = rag_pipeline._item_prefers_numeric(rag_pipeline._item_text(item))
+    priors = rag_pipeline.GROUP_CATEGORY_PRIORS.get(group_id, set())
+    scored = []
+    for slide in as_slide_records(slides):
+        if slide.text_deficiency_flag:
+            continue
+        feat = rag_pipeline._slide_features(slide)
+        vec_sim = _cosine(item.get("embedding", []), slide.embedding)
+        lex_sim = jaccard(item_feat.tokens, feat.tokens)
+        ngram_sim = jaccard(item_feat.trigrams, feat.trigrams)
+        kw_sim = keyword_overlap(item_feat.tokens, feat.tokens)
+        blend_sim = (0.40 * vec_sim) + (0.25 * lex_sim) + (0.20 * ngram_sim) + (0.15 * kw_sim)
+        sim = max(blend_sim, lex_sim, ngram_sim, (0.85 * vec_sim) + (0.15 * kw_sim))
+        if priors and slide.category in priors:
+            sim = min(1.0, sim + 0.12)
+            if float(slide.category_confidence) >= 0.7:
+                sim = min(1.0, sim + 0.04)
+        if prefers_numeric:
+            if feat.digit_count >= 6:
+                sim = min(1.0, sim + 0.06)
+            elif feat.digit_count >= 3:
+                sim = min(1.0, sim + 0.03)
+        if sim < min_sim:
+            continue
+        scored.append(
+            {
+                "slide_number": slide.slide_number,
+                "similarity": sim,
+                "summary": slide.short_summary,
+                "clean_text": feat.evidence_text,
+            }
+        )
+    scored.sort(key=lambda x: rank_key(x["similarity"]), reverse=True)
+    return scored[:top_k]
+
+
+def _synthetic_deck(n_slides, dim, seed=3):
+    rng = random.Random(seed)
+    slides = []
+    for idx in range(1, n_slides + 1):
+        text = " ".join(rng.sample(PHRASES, k=rng.randint(1, 3)))
+        if idx % 9 == 0:
+            text = "짧음"
+        slides.append(
+            {
+                "slide_number": idx,
+                "clean_text": text,
+                "short_summary": text[:40],
+                "category": rng.choice(CATEGORIES),
+                "category_confidence": rng.choice([0.5, 0.7, 0.9]),
+                "text_deficiency_flag": len(text) < 20,
+                "embedding": [rng.uniform(-1, 1) for _ in range(dim)],
+            }
+        )
+    rubric = rag_pipeline._default_rubric("VC_DEMO")
+    for group in rubric["groups"]:
+        for item in group["items"]:
+            item["embedding"] = [rng.uniform(-1, 1) for _ in range(dim)]
+    return slides, rubric
+
+
+def test_matrix_retrieval_matches_per_pair_retrieval():
+    slides, rubric = _synthetic_deck(n_slides=60, dim=96)
+    rag_pipeline._attach_slide_features(slides)
+    item_refs = [(g["group_id"], item) for g in rubric["groups"] for item in g["items"]]
+
+    matrix_evidences = rag_pipeline._retrieve_evidences(item_refs, slides, top_k=3)
+
+    for (group_id, item), got in zip(item_refs, matrix_evidences):
+        expected = _per_pair_top_k(item, slides, top_k=3, group_id=group_id)
+        assert [e["slide_number"] for e in got] == [e["slide_number"] for e in expected]
+        for g, e in zip(got, expected):
+            assert abs(g["similarity"] - e["similarity"]) <= SIMILARITY_TOLERANCE
+            assert g["summary"] == e["summary"]
+            assert g["clean_text"] == e["clean_text"]
+
+
+def test_matrix_retrieval_handles_missing_embeddings():
+    slides, rubric = _synthetic_deck(n_slides=8, dim=16)
+    for slide in slides:
+        slide["embedding"] = []
+    rag_pipeline._attach_slide_features(slides)
+    item_refs = [(g["group_id"], item) for g in rubric["groups"] for item in g["items"]]
+
+    matrix_evidences = rag_pipeline._retrieve_evidences(item_refs, slides, top_k=2)
+
+    for (group_id, item), got in zip(item_refs, matrix_evidences):
+        expected = _per_pair_top_k(item, slides, top_k=2, group_id=group_id)
+        assert [e["slide_number"] for e in got] == [e["slide_number"] for e in expected]
+
+
+def test_matrix_retrieval_matches_per_pair_on_near_ties():
+    # Few distinct phrases over many slides: duplicate texts and hashing embeddings
+    # produce exact and near ties that must fall back to slide order in both paths.
+    embedder = HashingEmbedder(dim=256)
+    for seed in range(40):
+        rng = random.Random(seed)
+        slides = []
+        for idx in range(1, rng.randint(1, 30) + 1):
+            text = " ".join(rng.sample(PHRASES, k=rng.randint(1, 3)))
+            slides.append(
+                {
+                    "slide_number": idx,
+                    "clean_text": text,
+                    "short_summary": text[:40],
+                    "category": rng.choice(CATEGORIES),
+                    "category_confidence": rng.choice([0.5, 0.7, 0.9]),
+                    "text_deficiency_flag": False,
+                }
+            )
+        attach_embeddings(slides, embedder.embed([s["clean_text"] for s in slides]))
+        rag_pipeline._attach_slide_features(slides)
+        rubric = rag_pipeline._default_rubric("VC_DEMO")
+        item_refs = [(g["group_id"], item) for g in rubric["groups"] for item in g["items"]]
+        vectors = embedder.embed([rag_pipeline._item_text(item) for _, item in item_refs])
+        for (_, item), vector in zip(item_refs, vectors):
+            item["embedding"] = vector
+
+        matrix_evidences = rag_pipeline._retrieve_evidences(item_refs, slides, top_k=3)
+
+        for (group_id, item), got in zip(item_refs, matrix_evidences):
+            expected = _per_pair_top_k(item, slides, top_k=3, group_id=group_id)
+            assert [e["slide_number"] for e in got] == [e["slide_number"] for e in expected], seed
+            assert all(type(e["similarity"]) is float for e in expected)
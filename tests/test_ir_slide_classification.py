@@ -0,0 +1,122 @@
+import re
+import threading
+import time
+
+from src.domain.ir import rag_pipeline
+
+
+class _FakeGemini:
+    model = True
+    model_name = "fake"
+
+    def __init__(self, delay=0.0, fail_on=()):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def generate_json(self, prompt, temperature=0.2):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            for marker in self.fail_on:
+                if marker in prompt:
+                    raise RuntimeError("boom")
+            return {"category": "MARKET", "category_confidence": 0.9, "short_summary": "요약", "key_claims": ["주장"]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _slides(texts):
+    return [
+        {
+            "slide_number": idx,
+            "clean_text": text,
+            "short_summary": "",
+            "key_claims": [],
+            "category": "OTHER",
+            "category_confidence": 0.5,
+        }
+        for idx, text in enumerate(texts, start=1)
+    ]
+
+
+def test_concurrent_classification_keeps_order_and_bounds_in_flight(monkeypatch):
+    monkeypatch.setenv("IR_LLM_CONCURRENCY", "3")
+    monkeypatch.setenv("IR_LLM_SLIDE_LIMIT", "12")
+    slides = _slides([f"시장 규모 슬라이드 {i}" for i in range(9)])
+    gemini = _FakeGemini(delay=0.05)
+
+    started = time.perf_counter()
+    rag_pipeline._classify_and_summarize_slides(slides, gemini)
+    elapsed = time.perf_counter() - started
+
+    assert gemini.max_in_flight == 3
+    assert elapsed < 9 * 0.05
+    assert [s["slide_number"] for s in slides] == list(range(1, 10))
+    assert all(s["category"] == "MARKET" and s["short_summary"] == "요약" for s in slides)
+
+
+def test_failed_slide_falls_back_to_keyword_classification(monkeypatch):
+    monkeypatch.setenv("IR_LLM_CONCURRENCY", "4")
+    slides = _slides(["시장 규모 TAM SAM SOM 분석", "팀 CEO CTO 경력 FAIL", "시장 성장률 CAGR"])
+    gemini = _FakeGemini(fail_on=["FAIL"])
+
+    rag_pipeline._classify_and_summarize_slides(slides, gemini)
+
+    expected = rag_pipeline._keyword_classify_with_confidence(slides[1]["clean_text"], slide_number=2, total_slides=3)
+    assert (slides[1]["category"], slides[1]["category_confidence"]) == expected
+    assert slides[1]["short_summary"] == slides[1]["clean_text"][:180]
+    assert slides[0]["short_summary"] == "요약"
+    assert slides[2]["short_summary"] == "요약"
+
+
+class _BatchGemini:
+    model = True
+    model_name = "fake"
+
+    def __init__(self, drop=()):
+        self.drop = set(drop)
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def generate_json(self, prompt, temperature=0.2):
+        with self._lock:
+            self.prompts.append(prompt)
+        numbers = [int(n) for n in re.findall(r"\[슬라이드 (\d+)\]", prompt)]
+        if numbers:
+            return [
+                {"slide_number": n, "category": "TEAM", "category_confidence": 0.8, "short_summary": f"배치 {n}", "key_claims": []}
+                for n in numbers
+                if n not in self.drop
+            ]
+        return {"category": "MARKET", "category_confidence": 0.9, "short_summary": "단건", "key_claims": []}
+
+
+def test_batched_classification_reissues_only_missing_slides(monkeypatch):
+    monkeypatch.setenv("IR_LLM_BATCH_SIZE", "4")
+    monkeypatch.setenv("IR_LLM_SLIDE_LIMIT", "12")
+    slides = _slides([f"팀 소개 슬라이드 본문 {i}" for i in range(10)])
+    gemini = _BatchGemini(drop={6})
+
+    rag_pipeline._classify_and_summarize_slides(slides, gemini)
+
+    batch_prompts = [p for p in gemini.prompts if re.search(r"\[슬라이드 \d+\]", p)]
+    single_prompts = [p for p in gemini.prompts if "[슬라이드 텍스트]" in p]
+    assert len(batch_prompts) == 3
+    assert len(single_prompts) == 1
+    assert slides[5]["short_summary"] == "단건"
+    assert [s["short_summary"] for s in slides if s["slide_number"] != 6] == [
+        f"배치 {n}" for n in range(1, 11) if n != 6
+    ]
+    assert set(slides[0].keys()) == {"slide_number", "clean_text", "short_summary", "key_claims", "category", "category_confidence"}
+
+
+def test_pack_classification_batches_respects_char_budget():
+    slides = _slides(["가" * 3000, "나" * 3000, "다" * 3000, "라" * 100])
+    batches = rag_pipeline._pack_classification_batches(slides, batch_size=8, char_budget=6500)
+    assert [[s["slide_number"] for s in b] for b in batches] == [[1, 2], [3, 4]]
@@ -0,0 +1,47 @@
+from src.domain.ir import rag_pipeline
+from src.domain.ir.slide_features import build_slide_features, char_ngrams, tokenize
+
+
+def _slide(number, text, summary="", category="OTHER"):
+    return {
+        "slide_number": number,
+        "raw_text": text,
+        "clean_text": text,
+        "short_summary": summary,
+        "key_claims": [],
+        "category": category,
+        "category_confidence": 0.5,
+        "text_deficiency_flag": len(text) < 20,
+        "embedding": [],
+    }
+
+
+def test_slide_features_match_text_tokenizers():
+    slide = _slide(1, "시장 규모 TAM 12조원 SAM 3조원 CAGR 14%", summary="시장 성장률 요약 2026")
+    feat = build_slide_features(slide)
+    slide_text = f"{slide['clean_text']} {slide['short_summary']}"
+
+    assert feat.tokens == tokenize(slide_text)
+    assert feat.trigrams == char_ngrams(slide_text)
+    assert feat.digit_count == sum(ch.isdigit() for ch in slide_text)
+    assert feat.clean_digit_count == sum(ch.isdigit() for ch in slide["clean_text"])
+    assert feat.evidence_text == slide["clean_text"][:1000]
+
+
+def test_retrieve_evidences_reuses_attached_features(monkeypatch):
+    slides = [
+        _slide(1, "문제 정의: 소상공인은 재고 관리에 불편을 겪고 있습니다", category="PROBLEM"),
+        _slide(2, "시장 규모 TAM 12조원 SAM 3조원 SOM 1200억원", category="MARKET"),
+        _slide(3, "팀 CEO 10년 경력 CTO 학력 자문", category="TEAM"),
+    ]
+    rag_pipeline._attach_slide_features(slides)
+
+    def _fail(_slide):
+        raise AssertionError("slide features must not be rebuilt during retrieval")
+
+    monkeypatch.setattr(rag_pipeline, "build_slide_features", _fail)
+    item = {"item_id": "MK_01", "item_name": "시장규모", "description": "TAM/SAM/SOM 등 시장 규모"}
+    evidences = rag_pipeline._retrieve_evidences([("MARKET_BM", item)], slides, top_k=2)[0]
+
+    assert evidences[0]["slide_number"] == 2
+    assert evidences[0]["clean_text"] == slides[1]["clean_text"]
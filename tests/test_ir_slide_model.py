@@ -0,0 +1,43 @@
+import numpy as np
+
+from src.domain.ir import rag_pipeline
+from src.domain.ir.slide_model import SlideRecord, attach_embeddings, deck_embedding_matrix
+
+
+def _docai(pages):
+    text, out_pages = "", []
+    for idx, page in enumerate(pages, start=1):
+        start = len(text)
+        text += page + "\n"
+        segment = {"startIndex": str(start), "endIndex": str(len(text))}
+        out_pages.append({"pageNumber": idx, "blocks": [{"layout": {"textAnchor": {"textSegments": [segment]}}}]})
+    return {"text": text, "pages": out_pages}
+
+
+def test_slides_share_one_float32_deck_matrix():
+    slides = rag_pipeline._build_slides(_docai(["시장 규모 TAM 12조원 SAM 3조원", "팀 CEO CTO 경력 10년 자문"]))
+    assert all(isinstance(s, SlideRecord) for s in slides)
+    assert not hasattr(slides[0], "__dict__")
+
+    matrix = attach_embeddings(slides, [[1.0, 0.0, 2.0], [0.5, 0.5, 0.5]])
+    assert matrix.dtype == np.float32
+    assert all(np.shares_memory(s.embedding, matrix) for s in slides)
+    assert deck_embedding_matrix(slides) is matrix
+    assert deck_embedding_matrix(list(reversed(slides))) is not matrix
+
+
+def test_record_mapping_access_and_output_dict():
+    slide = SlideRecord(slide_number=3, clean_text="본문", embedding=np.ones(4, dtype=np.float32))
+    slide.update({"category": "TEAM", "category_confidence": 0.8, "short_summary": "요약"})
+    assert slide["category"] == "TEAM" and slide.get("missing", "x") == "x"
+    assert slide.to_dict() == {
+        "slide_number": 3,
+        "clean_text": "본문",
+        "short_summary": "요약",
+        "key_claims": [],
+        "category": "TEAM",
+        "category_confidence": 0.8,
+        "text_deficiency_flag": False,
+    }
+    assert slide.to_dict(include_embedding=True)["embedding"] == [1.0, 1.0, 1.0, 1.0]
+    assert rag_pipeline._infer_pitch_type_from_slides([SlideRecord(1, clean_text="정부 지원사업 창업패키지")]) == "GOV_SUPPORT"
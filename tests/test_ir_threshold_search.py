@@ -0,0 +1,45 @@
+from src.domain.ir.threshold_search import candidate_space, parse_values, random_candidates, successive_halving
+
+
+def test_parse_values_supports_inclusive_ranges_and_lists():
+    assert parse_values("0.60:0.65:0.01") == [0.6, 0.61, 0.62, 0.63, 0.64, 0.65]
+    assert parse_values("2:4:1", int) == [2, 3, 4]
+    assert parse_values("0.55, 0.6,0.55:0.6:0.05") == [0.55, 0.6]
+
+
+def test_candidate_space_and_random_sampling():
+    space = candidate_space([0.6, 0.7], [0.6, 0.5], [2, 3])
+    assert (0.6, 0.6, 2) not in space
+    assert len(space) == 6
+
+    sample = random_candidates(space, 3, seed=7)
+    assert sample == random_candidates(space, 3, seed=7)
+    assert len(set(sample)) == 3
+    assert random_candidates(space, 100) == space
+
+
+def test_successive_halving_keeps_best_and_ends_on_all_labels():
+    candidates = [(round(0.5 + i * 0.01, 2), 0.4, 3) for i in range(9)]
+    calls = []
+
+    def evaluate(cands, n_labels):
+        calls.append((len(cands), n_labels))
+        # Higher sim_high scores better regardless of how many labels are used.
+        return [
+            {
+                "pitch_type_accuracy": 1.0,
+                "coverage_macro_f1": high,
+                "group_coverage_accuracy": 0.0,
+                "related_slide_hit_rate": 0.0,
+                "slide_category_accuracy": 0.0,
+            }
+            for high, _, _ in cands
+        ]
+
+    rows = successive_halving(candidates, 9, evaluate, eta=3, min_labels=1)
+
+    assert calls == [(9, 1), (3, 3), (1, 9)]
+    final = [r for r in rows if r["labels"] == 9]
+    assert len(final) == 1
+    assert final[0]["coverage_macro_f1"] == 0.58
+    assert [r["round"] for r in rows] == [0] * 9 + [1] * 3 + [2]
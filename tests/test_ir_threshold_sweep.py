@@ -0,0 +1,61 @@
+from src.domain.ir.rag_pipeline import run_rag_ir_analysis
+from src.domain.ir.settings import PipelineSettings
+from src.domain.ir.threshold_sweep import prepare_sweep_deck, sweep_criteria
+
+PAGES = [
+    "PitchCoach 2025 IR Deck",
+    "문제 정의: 소상공인은 재고 관리에 불편을 겪고 있으며 pain point가 큽니다",
+    "솔루션: AI 기반 자동 발주로 해결합니다 as-is to-be 개선",
+    "시장 규모 TAM 12조원 SAM 3조원 SOM 1200억원 CAGR 14%",
+    "비즈니스 모델 구독 월 29,000원 수수료 3% ARPU LTV",
+    "경쟁사 비교 차별점 포지셔닝 진입장벽",
+    "팀 CEO 10년 경력 CTO 학력 자문",
+    "자금 계획 투자 유치 10억원 사용처 마일스톤",
+]
+
+
+def _docai(pages):
+    text, out_pages = "", []
+    for idx, page in enumerate(pages, start=1):
+        start = len(text)
+        text += page + "\n"
+        segment = {"startIndex": str(start), "endIndex": str(len(text))}
+        out_pages.append({"pageNumber": idx, "blocks": [{"layout": {"textAnchor": {"textSegments": [segment]}}}]})
+    return {"text": text, "pages": out_pages, "detected_sections": [], "metadata": {"filename": "deck.pdf"}}
+
+
+def test_sweep_reproduces_pipeline_criteria_for_every_grid_point(tmp_path, monkeypatch):
+    for name in ("GEMINI_API_KEY", "GOOGLE_API_KEY", "ENABLE_VERTEX_EMBEDDING", "IR_EMBEDDING_CACHE_DIR"):
+        monkeypatch.delenv(name, raising=False)
+    docai = _docai(PAGES)
+    grid = [
+        PipelineSettings.resolve(sim_high=high, sim_mid=mid, top_k=top_k, fast_mode=True, llm_slide_limit=0)
+        for high in (0.25, 0.4, 0.72)
+        for mid in (0.1, 0.2, 0.35)
+        if mid < high
+        for top_k in (1, 2, 4)
+    ]
+
+    deck = prepare_sweep_deck(docai, max_top_k=4, pitch_type="STARTUP_CONTEST")
+    swept = sweep_criteria(deck, grid)
+    assert len(swept) == len(grid)
+
+    statuses = set()
+    for settings, criteria in zip(grid, swept):
+        full = run_rag_ir_analysis(
+            docai_result=docai,
+            output_path=str(tmp_path / "final.json"),
+            pitch_type="STARTUP_CONTEST",
+            settings=settings,
+        )
+        expected = [
+            {k: c[k] for k in ("criteria_id", "coverage_status", "related_slides", "score")}
+            for c in full["criteria_scores"]
+        ]
+        assert criteria == expected
+        statuses.update(c["coverage_status"] for c in criteria)
+        assert deck.prediction(criteria)["slides"] == [
+            {"slide_number": s["slide_number"], "category": s["category"]} for s in full["slides"]
+        ]
+    # The grid actually exercises different decisions.
+    assert len(statuses) >= 2
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+
+from src.domain.ir import rag_pipeline
+
+
+class _ReviewGemini:
+    model = True
+    model_name = "fake"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def generate_json(self, prompt, temperature=0.2):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            payload = json.loads(prompt)
+            with self._lock:
+                self.calls.append("review" if "item_name" in payload else "feedback")
+            if "item_name" in payload:
+                relevant = "시장" in str(payload["item_name"]) or "팀" in str(payload["item_name"])
+                return {"is_relevant": relevant, "confidence": 0.8 if relevant else 0.1}
+            return {"feedback": f"{payload['group_name']} 피드백", "confidence": 0.7}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _deck():
+    texts = [
+        "문제 정의: 소상공인은 재고 관리에 불편을 겪고 있으며 pain point가 큽니다",
+        "솔루션: AI 기반 자동 발주로 해결합니다 as-is to-be 개선",
+        "시장 규모 TAM 12조원 SAM 3조원 SOM 1200억원 CAGR 14%",
+        "비즈니스 모델 구독 월 29,000원 수수료 3% ARPU LTV",
+        "팀 CEO 10년 경력 CTO 학력 자문",
+    ]
+    slides = [
+        {
+            "slide_number": idx,
+            "clean_text": text,
+            "short_summary": text[:60],
+            "key_claims": [],
+            "category": "OTHER",
+            "category_confidence": 0.5,
+            "text_deficiency_flag": False,
+            "embedding": [],
+        }
+        for idx, text in enumerate(texts, start=1)
+    ]
+    rag_pipeline._attach_slide_features(slides)
+    return slides
+
+
+def test_two_phase_scoring_matches_serial_scoring(monkeypatch):
+    monkeypatch.delenv("IR_FAST_MODE", raising=False)
+    monkeypatch.setenv("IR_SIM_HIGH", "0.5")
+    monkeypatch.setenv("IR_SIM_MID", "0.2")
+
+    monkeypatch.setenv("IR_LLM_CONCURRENCY", "1")
+    serial = rag_pipeline._score_criteria_with_rag(_deck(), rag_pipeline._default_rubric("VC_DEMO"), _ReviewGemini())
+
+    monkeypatch.setenv("IR_LLM_CONCURRENCY", "8")
+    gemini = _ReviewGemini(delay=0.02)
+    parallel = rag_pipeline._score_criteria_with_rag(_deck(), rag_pipeline._default_rubric("VC_DEMO"), gemini)
+
+    assert parallel == serial
+    assert gemini.max_in_flight > 1
+    # All reviews finish before any group feedback starts.
+    first_feedback = gemini.calls.index("feedback")
+    assert "review" not in gemini.calls[first_feedback:]
+
+
+def test_plan_coverage_matches_decide_coverage():
+    gemini = _ReviewGemini()
+    item = {"item_name": "시장규모", "description": "TAM", "fail_if_missing": True}
+    for sim in (0.0, 0.3, 0.55, 0.65, 0.9):
+        evidences = [{"slide_number": 1, "similarity": sim, "summary": "요약", "clean_text": "시장 규모 TAM 12조원 근거 슬라이드"}]
+        plan = rag_pipeline._plan_coverage(item, evidences, gemini)
+        decided = rag_pipeline._decide_coverage(item, evidences, gemini)
+        if plan.needs_review:
+            assert plan.resolve(rag_pipeline._llm_review(item, evidences, gemini)) == decided
+        else:
+            assert plan.coverage == decided
@@ -0,0 +1,47 @@
+import random
+
+from src.common.keyword_matcher import KeywordMatcher
+from src.domain.ir import rag_pipeline
+from src.infrastructure.document_ai import processor
+
+
+def _naive_counts(groups, text):
+    return {label: sum(1 for kw in keywords if kw in text) for label, keywords in groups.items()}
+
+
+def test_counts_match_substring_semantics_for_nested_and_overlapping_keywords():
+    groups = {"A": ["시장", "시장규모", "장규"], "B": ["매출", "실매출", "arr"], "C": ["arr", "rr"]}
+    matcher = KeywordMatcher(groups)
+    assert matcher.counts("실매출과 시장규모 arr") == {"A": 3, "B": 3, "C": 2}
+    assert matcher.found("시장") == frozenset({"시장"})
+
+    rng = random.Random(7)
+    alphabet = "ab가나 "
+    for _ in range(200):
+        groups = {
+            f"g{i}": ["".join(rng.choice(alphabet[:-1]) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 5))]
+            for i in range(3)
+        }
+        matcher = KeywordMatcher(groups)
+        for _ in range(10):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert matcher.counts(text) == _naive_counts(groups, text)
+
+
+def test_rule_based_classification_uses_category_tables():
+    text = "시장 규모 tam 12조원 sam 3조원 som 1200억원 cagr 14% 성장률"
+    hits = rag_pipeline._CLASSIFY_MATCHER.counts(text)
+    assert hits["MARKET"] == _naive_counts(rag_pipeline.CATEGORY_KEYWORDS, text)["MARKET"]
+    assert rag_pipeline._keyword_classify_with_confidence(text, slide_number=4, total_slides=10)[0] == "MARKET"
+
+
+def test_detect_sections_picks_first_matching_section_in_table_order():
+    text = "Team 구성원 소개\n시장 규모 TAM\n아무 내용\n"
+    pages = []
+    start = 0
+    for line in text.splitlines(keepends=True):
+        segment = {"startIndex": str(start), "endIndex": str(start + len(line))}
+        pages.append({"blocks": [{"layout": {"textAnchor": {"textSegments": [segment]}}}]})
+        start += len(line)
+    doc = processor.detect_sections({"text": text, "pages": pages})
+    assert [s["section"] for s in doc["detected_sections"]] == ["team", "market", "unknown"]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.common.artifact_catalog import KIND_SUFFIXES
+from src.utils.artifact_codec import available_codecs, encode_artifact, read_artifact, write_artifact
+
+
+def _collect(roots: List[Path], kinds: List[str], limit: int) -> List[Path]:
+    paths: List[Path] = []
+    for root in roots:
+        for kind in kinds:
+            paths.extend(sorted(root.glob(f"**/*{KIND_SUFFIXES[kind]}")))
+    return paths[:limit] if limit else paths
+
+
+def _bench_codec(payloads: List[object], codec: str, repeat: int, tmp_dir: Path) -> Dict[str, float]:
+    size = 0
+    write_sec = 0.0
+    read_sec = 0.0
+    for i, payload in enumerate(payloads):
+        path = tmp_dir / f"{i}.artifact"
+        size += len(encode_artifact(payload, codec))
+        best_write = best_read = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            write_artifact(path, payload, codec)
+            best_write = min(best_write, time.perf_counter() - started)
+            started = time.perf_counter()
+            loaded = read_artifact(path)
+            best_read = min(best_read, time.perf_counter() - started)
+        if loaded != payload:
+            raise SystemExit(f"{codec}: round trip changed artifact #{i}")
+        write_sec += best_write
+        read_sec += best_read
+    return {"bytes": size, "write_ms": round(write_sec * 1000, 2), "read_ms": round(read_sec * 1000, 2)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare artifact codecs (size, write and read time) on real outputs.")
+    parser.add_argument("--roots", type=Path, nargs="+", default=[Path("data/output/ir_benchmark")])
+    parser.add_argument("--kinds", nargs="+", choices=sorted(KIND_SUFFIXES), default=["docai", "final"])
+    parser.add_argument("--codecs", nargs="+", default=list(available_codecs()))
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing per artifact.")
+    parser.add_argument("--limit", type=int, default=0, help="Benchmark at most N artifacts (0 = all).")
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+
+    paths = _collect([r for r in args.roots if r.exists()], args.kinds, args.limit)
+    if not paths:
+        raise SystemExit(f"No {'/'.join(args.kinds)} artifacts under: {' '.join(map(str, args.roots))}")
+    payloads = [read_artifact(p) for p in paths]
+
+    with TemporaryDirectory(prefix="artifact_codec_") as tmp:
+        results = {codec: _bench_codec(payloads, codec, max(1, args.repeat), Path(tmp)) for codec in args.codecs}
+    baseline = results.get("json", next(iter(results.values())))
+    for row in results.values():
+        row["size_ratio"] = round(row["bytes"] / baseline["bytes"], 3) if baseline["bytes"] else None
+        row["read_speedup"] = round(baseline["read_ms"] / row["read_ms"], 2) if row["read_ms"] else None
+
+    report = {"artifacts": len(paths), "source_bytes": sum(p.stat().st_size for p in paths), "codecs": results}
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from math import sqrt
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.ir import rag_pipeline
+from src.domain.ir.settings import PipelineSettings
+from src.domain.ir.similarity import SIMILARITY_TOLERANCE, rank_key
+from src.domain.ir.slide_features import jaccard, keyword_overlap
+from src.domain.ir.slide_model import as_slide_records
+
+PHRASES = [
+    "문제 정의: 소상공인은 재고 관리에 불편을 겪고 있습니다",
+    "솔루션: AI 기반 자동 발주로 해결합니다. as-is to-be 개선",
+    "제품 화면 UI/UX 스크린샷과 데모 flow",
+    "시장 규모 TAM 12조원 SAM 3조원 SOM 1200억원 CAGR 14%",
+    "비즈니스 모델 구독 월 29,000원 수수료 3% ARPU LTV",
+    "MOU 5건 PoC 3건 베타 사용자 1,200명 MAU 800 매출 4,500만원",
+    "경쟁사 비교 포지셔닝 차별점",
+    "팀 CEO 10년 경력 CTO 학력 자문",
+    "재무 계획 투자 유치 5억원 BEP 2027 runway 18개월",
+    "로드맵 2026 Q1 Q2 Q3 마일스톤",
+]
+CATEGORIES = ["COVER", "PROBLEM", "SOLUTION", "PRODUCT", "MARKET", "BUSINESS_MODEL", "TRACTION", "TEAM", "FINANCE", "ASK"]
+
+
+def _cosine(a, b) -> float:
+    if len(a) == 0 or len(b) == 0:
+        return 0.0
+    n = min(len(a), len(b))
+    a = [float(v) for v in a[:n]]
+    b = [float(v) for v in b[:n]]
+    dot = sum(x * y for x, y in zip(a, b))
+    na = sqrt(sum(x * x for x in a))
+    nb = sqrt(sum(y * y for y in b))
+    if na == 0 or nb == 0:
+        return 0.0
+    return max(0.0, min(1.0, dot / (na * nb)))
+
+
+def _per_pair_top_k(item, slides, top_k: int, group_id: str = "", min_sim: float = PipelineSettings.retrieval_min_sim):
+    # Baseline: the pre-matrix retrieval, one (item, slide) pair at a time.
+    item_feat = rag_pipeline._item_features(item)
+    prefers_numeric = rag_pipeline._item_prefers_numeric(rag_pipeline._item_text(item))
+    priors = rag_pipeline.GROUP_CATEGORY_PRIORS.get(group_id, set())
+    scored = []
+    for slide in as_slide_records(slides):
+        if slide.text_deficiency_flag:
+            continue
+        feat = rag_pipeline._slide_features(slide)
+        vec_sim = _cosine(item.get("embedding", []), slide.embedding)
+        lex_sim = jaccard(item_feat.tokens, feat.tokens)
+        ngram_sim = jaccard(item_feat.trigrams, feat.trigrams)
+        kw_sim = keyword_overlap(item_feat.tokens, feat.tokens)
+        blend_sim = (0.40 * vec_sim) + (0.25 * lex_sim) + (0.20 * ngram_sim) + (0.15 * kw_sim)
+        sim = max(blend_sim, lex_sim, ngram_sim, (0.85 * vec_sim) + (0.15 * kw_sim))
+        if priors and slide.category in priors:
+            sim = min(1.0, sim + 0.12)
+            if float(slide.category_confidence) >= 0.7:
+                sim = min(1.0, sim + 0.04)
+        if prefers_numeric:
+            if feat.digit_count >= 6:
+                sim = min(1.0, sim + 0.06)
+            elif feat.digit_count >= 3:
+                sim = min(1.0, sim + 0.03)
+        if sim < min_sim:
+            continue
+        scored.append(
+            {
+                "slide_number": slide.slide_number,
+                "similarity": sim,
+                "summary": slide.short_summary,
+                "clean_text": feat.evidence_text,
+            }
+        )
+    scored.sort(key=lambda x: rank_key(x["similarity"]), reverse=True)
+    return scored[:top_k]
+
+
+def _synthetic_deck(n_slides: int, dim: int, seed: int):
+    rng = random.Random(seed)
+    slides = []
+    for idx in range(1, n_slides + 1):
+        text = " ".join(rng.sample(PHRASES, k=rng.randint(1, 4)))
+        slides.append(
+            {
+                "slide_number": idx,
+                "clean_text": text,
+                "short_summary": text[:180],
+                "category": rng.choice(CATEGORIES),
+                "category_confidence": rng.choice([0.5, 0.7, 0.85]),
+                "text_deficiency_flag": False,
+                "embedding": [rng.uniform(-1, 1) for _ in range(dim)],
+            }
+        )
+    rubric = rag_pipeline._default_rubric("VC_DEMO")
+    for group in rubric["groups"]:
+        for item in group["items"]:
+            item["embedding"] = [rng.uniform(-1, 1) for _ in range(dim)]
+    return slides, rubric
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-pair vs matrix rubric retrieval on a synthetic deck.")
+    parser.add_argument("--slides", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    slides, rubric = _synthetic_deck(args.slides, args.dim, args.seed)
+    rag_pipeline._attach_slide_features(slides)
+    item_refs = [(g["group_id"], item) for g in rubric["groups"] for item in g["items"]]
+
+    per_pair_times = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        per_pair = [_per_pair_top_k(item, slides, args.top_k, group_id=gid) for gid, item in item_refs]
+        per_pair_times.append(time.perf_counter() - started)
+
+    matrix_times = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        matrix = rag_pipeline._retrieve_evidences(item_refs, slides, args.top_k)
+        matrix_times.append(time.perf_counter() - started)
+
+    same_ranking = all(
+        [e["slide_number"] for e in a] == [e["slide_number"] for e in b] for a, b in zip(per_pair, matrix)
+    )
+    max_abs_diff = max(
+        (abs(x["similarity"] - y["similarity"]) for a, b in zip(per_pair, matrix) for x, y in zip(a, b)),
+        default=0.0,
+    )
+    report = {
+        "slides": args.slides,
+        "items": len(item_refs),
+        "dim": args.dim,
+        "per_pair_sec": round(min(per_pair_times), 4),
+        "matrix_sec": round(min(matrix_times), 4),
+        "speedup": round(min(per_pair_times) / max(min(matrix_times), 1e-9), 1),
+        "same_ranking": same_ranking,
+        "max_abs_similarity_diff": max_abs_diff,
+        "tolerance": SIMILARITY_TOLERANCE,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0 if same_ranking and max_abs_diff <= SIMILARITY_TOLERANCE else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
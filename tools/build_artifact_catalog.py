@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.common.artifact_catalog import DEFAULT_CATALOG_PATH, ArtifactCatalog
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="(Re)build the docai/final/strategy artifact catalog from disk.")
+    parser.add_argument("--roots", type=Path, nargs="+", default=[Path("data/output")])
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_CATALOG_PATH)
+    parser.add_argument("--hash", action="store_true", help="also record a sha256 of every artifact")
+    args = parser.parse_args()
+
+    catalog = ArtifactCatalog(args.catalog, hash_files=args.hash)
+    registered = catalog.rebuild(args.roots)
+    print(json.dumps({"catalog": str(args.catalog), "registered": registered, "stats": catalog.stats()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
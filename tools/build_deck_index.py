@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.domain.ir.deck_index import DEFAULT_DECK_INDEX_DIR, DeckIndex, index_analysis_outputs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="(Re)build the cross-deck similarity index from analysis outputs.")
+    parser.add_argument(
+        "--roots",
+        type=Path,
+        nargs="+",
+        default=[Path("data/output/ir_analysis"), Path("data/output/ir_benchmark")],
+    )
+    parser.add_argument("--index-dir", type=Path, default=DEFAULT_DECK_INDEX_DIR)
+    parser.add_argument("--dtype", choices=["int8", "float16"], default="int8")
+    parser.add_argument("--query", type=str, default=None, help="Print similar decks for this deck id afterwards.")
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    index = DeckIndex(args.index_dir, dtype=args.dtype)
+    indexed = index_analysis_outputs(index, [r for r in args.roots if r.exists()])
+    report = {"indexed_decks": len(indexed), "indexed_slides": sum(indexed.values()), "stats": index.stats()}
+    if args.query:
+        report["similar_decks"] = index.similar_decks(args.query, k=args.k)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
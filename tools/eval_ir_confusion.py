@@ -18,6 +18,7 @@ from src.domain.ir.tuning_metrics import (
     load_labels,
     normalize_category_for_report,
 )
+from src.utils.artifact_codec import read_artifact
 
 
 def _parse_focus(v: str) -> List[str]:
@@ -48,7 +49,7 @@ def main() -> int:
         if not result_path:
             missing_results.append(str(label.get("filename", "")))
             continue
-        payload = json.loads(result_path.read_text(encoding="utf-8"))
+        payload = read_artifact(result_path)
         all_pairs.extend(extract_slide_category_pairs(label, payload))
 
     overall = build_confusion(all_pairs)
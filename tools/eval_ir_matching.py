@@ -5,12 +5,53 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.domain.ir.tuning_metrics import aggregate_eval, evaluate_label, find_result_for_label, load_labels
+from src.domain.ir.rag_pipeline import run_rag_ir_analysis
+from src.domain.ir.settings import LEXICAL_SCORERS, PipelineSettings
+from src.domain.ir.tuning_metrics import (
+    aggregate_eval,
+    evaluate_label,
+    find_docai_for_label,
+    find_result_for_label,
+    load_labels,
+)
+from src.utils.artifact_codec import read_artifact
+
+
+def _evaluate_lexical_scorer(
+    labels: List[Dict[str, Any]],
+    docai_roots: List[Path],
+    lexical_scorer: str,
+    tmp_dir: Path,
+) -> Dict[str, Any]:
+    """Re-run offline retrieval on cached DocAI JSON with the given lexical scorer."""
+    settings = PipelineSettings.resolve(lexical_scorer=lexical_scorer, fast_mode=True, llm_slide_limit=0)
+    rows = []
+    missing = []
+    for label in labels:
+        docai_path = find_docai_for_label(docai_roots, str(label.get("filename", "")), aliases=label.get("filename_aliases"))
+        if not docai_path:
+            missing.append(str(label.get("filename", "")))
+            continue
+        docai = read_artifact(docai_path)
+        pred = run_rag_ir_analysis(
+            docai_result=docai,
+            output_path=str(tmp_dir / f"{Path(label['filename']).stem}_{lexical_scorer}.json"),
+            strategy=None,
+            analysis_version=1,
+            pitch_type=label.get("pitch_type"),
+            settings=settings,
+        )
+        row = evaluate_label(label, pred)
+        row["docai_path"] = str(docai_path)
+        rows.append(row)
+    return {"summary": aggregate_eval(rows), "evaluated_cases": rows, "missing_docai": missing}
 
 
 def main() -> int:
@@ -18,12 +59,40 @@ def main() -> int:
     parser.add_argument("--dataset", type=Path, default=Path("data/config/pitchcoach_tuning_dataset.json"))
     parser.add_argument("--results-root", type=Path, default=Path("data/output/ir_benchmark"))
     parser.add_argument("--out", type=Path, default=Path("data/output/ir_benchmark/eval_report.json"))
+    parser.add_argument(
+        "--lexical-scorer",
+        nargs="+",
+        choices=LEXICAL_SCORERS,
+        help="Re-run offline matching from cached DocAI JSON with each lexical scorer and compare.",
+    )
+    parser.add_argument(
+        "--docai-roots",
+        type=Path,
+        nargs="+",
+        default=[Path("data/output/ir_benchmark"), Path("data/output/ir_analysis"), Path("data/output")],
+    )
     args = parser.parse_args()
 
     labels = load_labels(args.dataset)
     if not labels:
         raise SystemExit(f"No labels found in dataset: {args.dataset}")
 
+    if args.lexical_scorer:
+        with TemporaryDirectory(prefix="ir_eval_") as tmp:
+            by_scorer = {
+                name: _evaluate_lexical_scorer(labels, args.docai_roots, name, Path(tmp)) for name in args.lexical_scorer
+            }
+        report = {
+            "dataset": str(args.dataset),
+            "docai_roots": [str(p) for p in args.docai_roots],
+            "summary_by_lexical_scorer": {name: r["summary"] for name, r in by_scorer.items()},
+            "by_lexical_scorer": by_scorer,
+        }
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(json.dumps(report["summary_by_lexical_scorer"], ensure_ascii=False, indent=2))
+        return 0
+
     rows = []
     missing_results = []
     for label in labels:
@@ -35,7 +104,7 @@ def main() -> int:
         if not result_path:
             missing_results.append(str(label.get("filename", "")))
             continue
-        payload = json.loads(result_path.read_text(encoding="utf-8"))
+        payload = read_artifact(result_path)
         row = evaluate_label(label, payload)
         row["result_path"] = str(result_path)
         rows.append(row)
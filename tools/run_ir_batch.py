@@ -22,6 +22,14 @@ def main() -> int:
     parser.add_argument("--max-files", type=int, default=None)
     parser.add_argument("--no-chunking", action="store_true")
     parser.add_argument("--include-notice-like", action="store_true")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip cases already completed in batch_journal.jsonl with the same PDF and config hash.",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Decks analyzed in parallel (process pool).")
+    parser.add_argument("--ocr-concurrency", type=int, default=None, help="Max concurrent OCR stages across workers.")
+    parser.add_argument("--llm-concurrency", type=int, default=None, help="Max concurrent LLM stages across workers.")
     args = parser.parse_args()
 
     config = BatchRunConfig(
@@ -32,6 +40,10 @@ def main() -> int:
         max_files=args.max_files,
         use_chunking=not args.no_chunking,
         skip_notice_like=not args.include_notice_like,
+        workers=args.workers,
+        ocr_concurrency=args.ocr_concurrency,
+        llm_concurrency=args.llm_concurrency,
+        resume=args.resume,
     )
     summary = run_ir_batch(config)
     print(json.dumps(summary, ensure_ascii=False, indent=2))
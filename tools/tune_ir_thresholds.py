@@ -4,17 +4,22 @@ from __future__ import annotations
 import argparse
 import csv
 import json
-import os
+import random
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.domain.ir.rag_pipeline import run_rag_ir_analysis
+from src.domain.ir.settings import PipelineSettings
+from src.domain.ir.threshold_search import candidate_space, parse_values, random_candidates, successive_halving
+from src.domain.ir.threshold_sweep import SweepDeck, prepare_sweep_deck, sweep_criteria
 from src.domain.ir.tuning_metrics import (
     aggregate_eval,
     evaluate_label,
@@ -22,34 +27,114 @@ from src.domain.ir.tuning_metrics import (
     load_labels,
     score_for_ranking,
 )
+from src.utils.artifact_codec import read_artifact
 
 
-def _parse_float_list(v: str) -> List[float]:
-    return [float(x.strip()) for x in v.split(",") if x.strip()]
+Candidate = Tuple[float, float, int]
 
 
-def _parse_int_list(v: str) -> List[int]:
-    return [int(x.strip()) for x in v.split(",") if x.strip()]
+def _trial_settings(candidate: Candidate) -> PipelineSettings:
+    high, mid, topk = candidate
+    return PipelineSettings.resolve(sim_high=high, sim_mid=mid, top_k=topk, fast_mode=True, llm_slide_limit=0)
 
 
-def _set_env(overrides: Dict[str, str]) -> Dict[str, str]:
-    before = {}
-    for k, val in overrides.items():
-        before[k] = os.environ.get(k)
-        os.environ[k] = str(val)
-    return before
+def _prepare_deck(docai_path: Path, pitch_type: Optional[str], max_top_k: int) -> SweepDeck:
+    docai = read_artifact(docai_path)
+    # Deck preparation only reads the threshold-independent settings.
+    settings = PipelineSettings.resolve(fast_mode=True, llm_slide_limit=0)
+    return prepare_sweep_deck(docai, max_top_k, pitch_type=pitch_type, settings=settings)
 
 
-def _restore_env(before: Dict[str, str]) -> None:
-    for k, old in before.items():
-        if old is None:
-            os.environ.pop(k, None)
+def _run_full_trial(label: Dict, docai_path: Path, settings: PipelineSettings) -> Dict:
+    docai = read_artifact(docai_path)
+    with TemporaryDirectory(prefix="ir_tuning_") as tmp:
+        pred = run_rag_ir_analysis(
+            docai_result=docai,
+            output_path=str(Path(tmp) / f"{Path(label['filename']).stem}.json"),
+            strategy=None,
+            analysis_version=1,
+            pitch_type=label.get("pitch_type"),
+            settings=settings,
+        )
+    return evaluate_label(label, pred)
+
+
+class _TrialEvaluator:
+    """Scores candidates on the first n labels, caching decks (sweep) or per-label results (full)."""
+
+    def __init__(self, cases: List[Tuple[Dict, Path]], mode: str, max_top_k: int, pool: Optional[ProcessPoolExecutor]):
+        self.cases = cases
+        self.mode = mode
+        self.max_top_k = max_top_k
+        self.pool = pool
+        self.label_evaluations = 0
+        self._decks: Dict[int, SweepDeck] = {}
+        self._full_rows: Dict[Tuple[Candidate, int], Dict] = {}
+
+    def __call__(self, candidates: List[Candidate], n_labels: int) -> List[Dict]:
+        label_ids = list(range(min(n_labels, len(self.cases))))
+        if self.mode == "sweep":
+            eval_rows = self._sweep(candidates, label_ids)
         else:
-            os.environ[k] = old
+            eval_rows = self._full(candidates, label_ids)
+        self.label_evaluations += len(candidates) * len(label_ids)
+        out = []
+        for (high, mid, topk), rows in zip(candidates, eval_rows):
+            summary = aggregate_eval(rows)
+            out.append(
+                {
+                    "sim_high": high,
+                    "sim_mid": mid,
+                    "top_k": topk,
+                    "cases": summary["cases"],
+                    "pitch_type_accuracy": summary["pitch_type_accuracy"],
+                    "group_coverage_accuracy": summary["group_coverage_accuracy"],
+                    "related_slide_hit_rate": summary["related_slide_hit_rate"],
+                    "slide_category_accuracy": summary["slide_category_accuracy"],
+                    "coverage_macro_f1": summary.get("coverage_macro_f1", 0.0),
+                }
+            )
+        return out
+
+    def _map(self, fn, *iterables) -> List:
+        if self.pool is None:
+            return list(map(fn, *iterables))
+        return list(self.pool.map(fn, *iterables))
+
+    def _sweep(self, candidates: List[Candidate], label_ids: List[int]) -> List[List[Dict]]:
+        """Rank slides once per deck (in the pool), then decide all candidates from it."""
+        missing = [i for i in label_ids if i not in self._decks]
+        decks = self._map(
+            _prepare_deck,
+            [self.cases[i][1] for i in missing],
+            [self.cases[i][0].get("pitch_type") for i in missing],
+            [self.max_top_k] * len(missing),
+        )
+        self._decks.update(zip(missing, decks))
+
+        trials = [_trial_settings(c) for c in candidates]
+        eval_rows: List[List[Dict]] = [[] for _ in candidates]
+        for i in label_ids:
+            label, deck = self.cases[i][0], self._decks[i]
+            for rows, criteria in zip(eval_rows, sweep_criteria(deck, trials)):
+                rows.append(evaluate_label(label, deck.prediction(criteria)))
+        return eval_rows
+
+    def _full(self, candidates: List[Candidate], label_ids: List[int]) -> List[List[Dict]]:
+        """Re-run the whole pipeline for every (candidate, label) not seen yet, in the pool."""
+        missing = [(c, i) for c in candidates for i in label_ids if (c, i) not in self._full_rows]
+        results = self._map(
+            _run_full_trial,
+            [self.cases[i][0] for _, i in missing],
+            [self.cases[i][1] for _, i in missing],
+            [_trial_settings(c) for c, _ in missing],
+        )
+        self._full_rows.update(zip(missing, results))
+        return [[self._full_rows[(c, i)] for i in label_ids] for c in candidates]
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Grid-search IR_SIM_HIGH/IR_SIM_MID/IR_TOP_K with GT labels.")
+    parser = argparse.ArgumentParser(description="Search IR_SIM_HIGH/IR_SIM_MID/IR_TOP_K against GT labels (grid, random or successive halving).")
     parser.add_argument("--dataset", type=Path, default=Path("data/config/pitchcoach_tuning_dataset.json"))
     parser.add_argument(
         "--search-roots",
@@ -57,9 +142,21 @@ def main() -> int:
         nargs="+",
         default=[Path("data/output/ir_benchmark"), Path("data/output/ir_analysis"), Path("data/output")],
     )
-    parser.add_argument("--sim-high", type=str, default="0.65,0.68,0.72")
-    parser.add_argument("--sim-mid", type=str, default="0.55,0.60")
+    parser.add_argument("--sim-high", type=str, default="0.65,0.68,0.72", help="Values or start:stop:step ranges.")
+    parser.add_argument("--sim-mid", type=str, default="0.55,0.60", help="Values or start:stop:step ranges.")
     parser.add_argument("--top-k", type=str, default="2,3,4")
+    parser.add_argument(
+        "--mode",
+        choices=["sweep", "full"],
+        default="sweep",
+        help="sweep: rank slides once per deck and decide all grid points from it; full: rerun the pipeline per trial.",
+    )
+    parser.add_argument("--search", choices=["grid", "random", "halving"], default="grid")
+    parser.add_argument("--trials", type=int, default=None, help="random/halving: number of sampled candidates.")
+    parser.add_argument("--eta", type=int, default=3, help="halving: keep the best 1/eta candidates per round.")
+    parser.add_argument("--min-labels", type=int, default=2, help="halving: labels used in the first round.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1, help="Process pool size for deck preparation / full trials.")
     parser.add_argument("--out-json", type=Path, default=Path("data/output/ir_benchmark/tuning_report.json"))
     parser.add_argument("--out-csv", type=Path, default=Path("data/output/ir_benchmark/tuning_report.csv"))
     args = parser.parse_args()
@@ -68,75 +165,69 @@ def main() -> int:
     if not labels:
         raise SystemExit(f"No labels found in dataset: {args.dataset}")
 
-    highs = _parse_float_list(args.sim_high)
-    mids = _parse_float_list(args.sim_mid)
-    topks = _parse_int_list(args.top_k)
-
-    rows = []
-    with TemporaryDirectory(prefix="ir_tuning_") as tmp:
-        tmp_dir = Path(tmp)
-        for high in highs:
-            for mid in mids:
-                if mid >= high:
-                    continue
-                for topk in topks:
-                    before = _set_env(
-                        {
-                            "IR_SIM_HIGH": str(high),
-                            "IR_SIM_MID": str(mid),
-                            "IR_TOP_K": str(topk),
-                            "IR_FAST_MODE": "1",
-                            "IR_LLM_SLIDE_LIMIT": "0",
-                        }
-                    )
-                    try:
-                        eval_rows = []
-                        skipped = 0
-                        for label in labels:
-                            docai_path = find_docai_for_label(
-                                args.search_roots,
-                                str(label.get("filename", "")),
-                                aliases=label.get("filename_aliases"),
-                            )
-                            if not docai_path:
-                                skipped += 1
-                                continue
-                            docai = json.loads(docai_path.read_text(encoding="utf-8"))
-                            out_path = tmp_dir / f"{Path(label['filename']).stem}_h{high}_m{mid}_k{topk}.json"
-                            pred = run_rag_ir_analysis(
-                                docai_result=docai,
-                                output_path=str(out_path),
-                                strategy=None,
-                                analysis_version=1,
-                                pitch_type=label.get("pitch_type"),
-                            )
-                            eval_rows.append(evaluate_label(label, pred))
-
-                        summary = aggregate_eval(eval_rows)
-                        rows.append(
-                            {
-                                "sim_high": high,
-                                "sim_mid": mid,
-                                "top_k": topk,
-                                "cases": summary["cases"],
-                                "skipped": skipped,
-                                "pitch_type_accuracy": summary["pitch_type_accuracy"],
-                                "group_coverage_accuracy": summary["group_coverage_accuracy"],
-                                "related_slide_hit_rate": summary["related_slide_hit_rate"],
-                                "slide_category_accuracy": summary["slide_category_accuracy"],
-                                "coverage_macro_f1": summary.get("coverage_macro_f1", 0.0),
-                            }
-                        )
-                    finally:
-                        _restore_env(before)
-
-    if not rows:
+    space = candidate_space(
+        parse_values(args.sim_high),
+        parse_values(args.sim_mid),
+        parse_values(args.top_k, int),
+    )
+    if not space:
+        raise SystemExit("Empty grid: every sim_mid must be below some sim_high.")
+    candidates = space
+    if args.search in {"random", "halving"} and args.trials:
+        candidates = random_candidates(space, args.trials, seed=args.seed)
+
+    started = time.perf_counter()
+    cases = []
+    skipped = 0
+    for label in labels:
+        docai_path = find_docai_for_label(
+            args.search_roots,
+            str(label.get("filename", "")),
+            aliases=label.get("filename_aliases"),
+        )
+        if not docai_path:
+            skipped += 1
+            continue
+        cases.append((label, docai_path))
+    if not cases:
         raise SystemExit("No tuning results produced. Check dataset/search roots.")
-
-    best = max(rows, key=score_for_ranking)
+    if args.search == "halving":
+        # Label subsets of early rounds should not all come from the same folder/prefix.
+        random.Random(args.seed).shuffle(cases)
+
+    workers = max(1, args.workers)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        evaluator = _TrialEvaluator(cases, args.mode, max(c[2] for c in candidates), pool)
+        if args.search == "halving":
+            rows = successive_halving(candidates, len(cases), evaluator, eta=args.eta, min_labels=args.min_labels)
+        else:
+            rows = [{**row, "round": 0, "labels": len(cases)} for row in evaluator(candidates, len(cases))]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    elapsed = time.perf_counter() - started
+    for row in rows:
+        row["skipped"] = skipped
+
+    final_rows = [r for r in rows if r["labels"] == len(cases)]
+    best = max(final_rows, key=score_for_ranking)
     report = {
         "dataset": str(args.dataset),
         "search_roots": [str(p) for p in args.search_roots],
+        "mode": args.mode,
+        "search": {
+            "strategy": args.search,
+            "space_size": len(space),
+            "candidates": len(candidates),
+            "eta": args.eta if args.search == "halving" else None,
+            "seed": args.seed,
+            "workers": workers,
+        },
+        "elapsed_sec": round(elapsed, 3),
+        "trials_evaluated": len(rows),
+        "trials_per_sec": round(len(rows) / elapsed, 2) if elapsed > 0 else None,
+        "label_evaluations": evaluator.label_evaluations,
         "trials": rows,
         "best": best,
         "recommended_env": {
@@ -155,7 +246,7 @@ def main() -> int:
         writer.writeheader()
         writer.writerows(rows)
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    print(json.dumps({k: v for k, v in report.items() if k != "trials"}, ensure_ascii=False, indent=2))
     return 0
 
 